@@ -0,0 +1,232 @@
+"""
+Build pre-aggregated per-season summary tables for the dashboard.
+
+The dashboard's summary / trends / distributions endpoints otherwise
+re-scan the fact and player tables on every request. Historical seasons
+never change, so their aggregates are built once; the current season is
+rebuilt after each ingestion run (or nightly) with --current-only.
+Cached dashboard responses for each rebuilt season are dropped afterwards.
+
+Tables (MySQL has no materialized views, so these are plain tables):
+  - mv_season_team_stats     (season, team_id)
+  - mv_season_gw_trends      (season, gameweek)
+  - mv_season_position_stats (season, element_type)
+  - mv_season_player_totals  (season, player_id), indexed on total_points
+                             so top-N reads are an index range scan
+  - mv_season_meta           (season) -> last gameweek, refresh time
+"""
+
+import sys
+
+from Utils.logging_config import get_logger
+from Utils.db import get_connection
+from app.core.cache import invalidate_dashboard_cache
+from app.api.dashboard.season_config import (
+    SeasonSchema, get_season_schema, build_season_filter, build_season_where,
+    build_player_join, build_team_join, build_understat_join,
+    get_player_team_column, CURRENT_SEASON
+)
+from Scripts.ingest_fpl_github import SEASONS
+
+logger = get_logger("build_season_summaries")
+
+
+CREATE_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS mv_season_team_stats (
+        season VARCHAR(16) NOT NULL,
+        team_id INT NOT NULL,
+        player_count INT NOT NULL,
+        total_now_cost BIGINT NOT NULL,
+        total_points BIGINT NOT NULL,
+        total_goals INT NOT NULL,
+        total_assists INT NOT NULL,
+        PRIMARY KEY (season, team_id)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS mv_season_gw_trends (
+        season VARCHAR(16) NOT NULL,
+        gameweek INT NOT NULL,
+        total_points FLOAT NOT NULL,
+        total_goals INT NOT NULL,
+        total_assists INT NOT NULL,
+        avg_minutes FLOAT NOT NULL,
+        PRIMARY KEY (season, gameweek)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS mv_season_position_stats (
+        season VARCHAR(16) NOT NULL,
+        element_type INT NOT NULL,
+        player_count INT NOT NULL,
+        total_points BIGINT NOT NULL,
+        PRIMARY KEY (season, element_type)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS mv_season_player_totals (
+        season VARCHAR(16) NOT NULL,
+        player_id INT NOT NULL,
+        player_name VARCHAR(255) NOT NULL,
+        team_name VARCHAR(255) NULL,
+        total_points INT NOT NULL,
+        total_goals INT NOT NULL,
+        total_assists INT NOT NULL,
+        xg FLOAT NULL,
+        xa FLOAT NULL,
+        PRIMARY KEY (season, player_id),
+        KEY idx_mv_player_totals_points (season, total_points)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS mv_season_meta (
+        season VARCHAR(16) NOT NULL,
+        max_gw INT NULL,
+        refreshed_at DATETIME NOT NULL,
+        PRIMARY KEY (season)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """,
+]
+
+
+def _summary_queries(schema: SeasonSchema, with_understat: bool = False) -> list:
+    """INSERT ... SELECT statements that aggregate one season (bound from schema.sql_params)."""
+    team_col = get_player_team_column(schema)
+    team_join, team_select = build_team_join(schema)
+    us_join, xg_col, xa_col = build_understat_join(schema) if with_understat else ("", "NULL", "NULL")
+
+    team_stats = f"""
+        INSERT INTO {schema.table_mv_team_stats}
+            (season, team_id, player_count, total_now_cost, total_points, total_goals, total_assists)
+        SELECT
+            %(season)s,
+            p.{team_col},
+            COUNT(*),
+            COALESCE(SUM(p.now_cost), 0),
+            COALESCE(SUM(fs.pts), 0),
+            COALESCE(SUM(fs.g), 0),
+            COALESCE(SUM(fs.a), 0)
+        FROM {schema.table_players} p
+        LEFT JOIN (
+            SELECT {schema.col_player_id} AS pid,
+                   SUM(total_points) AS pts, SUM(goals_scored) AS g, SUM(assists) AS a
+            FROM {schema.table_fact}
+            {build_season_where(schema)}
+            GROUP BY {schema.col_player_id}
+        ) fs ON fs.pid = p.{schema.col_player_table_id}
+        WHERE 1=1 {build_season_filter(schema, "p")}
+        GROUP BY p.{team_col}
+    """
+
+    gw_trends = f"""
+        INSERT INTO {schema.table_mv_gw_trends}
+            (season, gameweek, total_points, total_goals, total_assists, avg_minutes)
+        SELECT
+            %(season)s,
+            {schema.col_gameweek},
+            COALESCE(SUM(total_points), 0),
+            COALESCE(SUM(goals_scored), 0),
+            COALESCE(SUM(assists), 0),
+            COALESCE(AVG(minutes), 0)
+        FROM {schema.table_fact}
+        {build_season_where(schema)}
+        GROUP BY {schema.col_gameweek}
+    """
+
+    position_stats = f"""
+        INSERT INTO {schema.table_mv_position_stats}
+            (season, element_type, player_count, total_points)
+        SELECT %(season)s, element_type, COUNT(*), COALESCE(SUM(total_points), 0)
+        FROM {schema.table_players}
+        WHERE 1=1 {build_season_filter(schema)}
+        GROUP BY element_type
+    """
+
+    player_totals = f"""
+        INSERT INTO {schema.table_mv_player_totals}
+            (season, player_id, player_name, team_name,
+             total_points, total_goals, total_assists, xg, xa)
+        SELECT
+            %(season)s,
+            f.{schema.col_player_id},
+            CONCAT(p.first_name, ' ', p.second_name),
+            {team_select or "NULL"},
+            COALESCE(SUM(f.total_points), 0),
+            COALESCE(SUM(f.goals_scored), 0),
+            COALESCE(SUM(f.assists), 0),
+            MAX({xg_col}),
+            MAX({xa_col})
+        FROM {schema.table_fact} f
+        {build_player_join(schema, "f", "p")}
+        {team_join}
+        {us_join}
+        WHERE 1=1 {build_season_filter(schema, "f")}
+        GROUP BY f.{schema.col_player_id}, p.first_name, p.second_name
+    """
+
+    season_meta = f"""
+        INSERT INTO {schema.table_mv_season_meta} (season, max_gw, refreshed_at)
+        SELECT %(season)s, MAX({schema.col_gameweek}), NOW()
+        FROM {schema.table_fact}
+        {build_season_where(schema)}
+    """
+
+    return [
+        (schema.table_mv_team_stats, team_stats),
+        (schema.table_mv_gw_trends, gw_trends),
+        (schema.table_mv_position_stats, position_stats),
+        (schema.table_mv_player_totals, player_totals),
+        (schema.table_mv_season_meta, season_meta),
+    ]
+
+
+def _table_exists(conn, table: str) -> bool:
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s",
+            (table,)
+        )
+        return bool(cur.fetchone()[0])
+
+
+def build_season_summary(conn, season: str):
+    """Rebuild all summary rows for one season in a single transaction."""
+    schema = get_season_schema(season)
+    # xG/xA are only stored once Scripts/build_understat_player_map.py has run
+    with_understat = schema.supports_understat and _table_exists(conn, schema.table_understat_map)
+
+    with conn.cursor() as cur:
+        try:
+            for table, insert_sql in _summary_queries(schema, with_understat):
+                cur.execute(f"DELETE FROM {table} WHERE season = %s", (season,))
+                cur.execute(insert_sql, schema.sql_params)
+            conn.commit()
+            logger.info(f"Built summary tables for {season}")
+            invalidate_dashboard_cache(season)
+        except Exception:
+            conn.rollback()
+            logger.exception(f"Failed building summary tables for {season}")
+            raise
+
+
+def build_season_summaries(seasons=None):
+    seasons = seasons or SEASONS
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for ddl in CREATE_TABLES:
+                cur.execute(ddl)
+        conn.commit()
+
+        for season in seasons:
+            build_season_summary(conn, season)
+
+
+if __name__ == "__main__":
+    # --current-only: refresh just the live season (run after each ingestion)
+    if "--current-only" in sys.argv:
+        build_season_summaries([CURRENT_SEASON])
+    else:
+        build_season_summaries()
@@ -0,0 +1,76 @@
+"""
+Build the FPL element_id -> Understat player_id mapping table.
+
+The name match between FPL players and Understat roster rows is done once
+here, offline, instead of joining on CONCAT(first_name, ' ', second_name)
+at query time. Dashboard queries then join integer IDs through
+understat_player_map (see build_understat_join in season_config.py).
+
+Table: understat_player_map (season, fpl_element_id) -> understat_id
+"""
+
+import pandas as pd
+
+from Utils.logging_config import get_logger
+from Utils.db import upsert_dataframe, execute_query
+from app.core.cache import mark_data_refreshed
+from app.api.dashboard.season_config import (
+    get_season_schema, get_understat_season_year, build_season_filter
+)
+from app.api.dashboard.service import normalize_name
+from Scripts.ingest_fpl_github import SEASONS
+
+logger = get_logger("build_understat_player_map")
+
+MAP_TABLE = "understat_player_map"
+
+
+def build_season_map(season: str) -> pd.DataFrame:
+    """Match one season's FPL players to Understat player IDs by normalized full name."""
+    schema = get_season_schema(season)
+    year = get_understat_season_year(season)
+
+    fpl_players = execute_query(f"""
+        SELECT {schema.col_player_table_id} as pid, first_name, second_name
+        FROM {schema.table_players}
+        WHERE 1=1 {build_season_filter(schema)}
+    """, schema.sql_params)
+    understat_players = execute_query(
+        "SELECT DISTINCT player_id, player FROM understat_roster_metrics WHERE season = %s",
+        (year,)
+    )
+
+    by_name = {normalize_name(r["player"]): r["player_id"] for r in understat_players}
+
+    rows = []
+    for p in fpl_players:
+        key = normalize_name(f"{p['first_name']} {p['second_name']}")
+        understat_id = by_name.get(key)
+        if understat_id is not None:
+            rows.append({
+                "season": season,
+                "fpl_element_id": int(p["pid"]),
+                "understat_id": int(understat_id),
+            })
+
+    logger.info(f"{season}: mapped {len(rows)}/{len(fpl_players)} FPL players to Understat")
+    return pd.DataFrame(rows)
+
+
+def build_understat_player_map():
+    for season in SEASONS:
+        if not get_season_schema(season).supports_understat:
+            continue
+
+        try:
+            df = build_season_map(season)
+            upsert_dataframe(df, MAP_TABLE, primary_keys=["season", "fpl_element_id"])
+        except Exception:
+            logger.exception(f"Failed building Understat player map for {season}")
+
+    # Running APIs switch to the ID join once they see the map table
+    mark_data_refreshed()
+
+
+if __name__ == "__main__":
+    build_understat_player_map()
@@ -2,6 +2,8 @@ import mysql.connector
 from mysql.connector import Error
 import sys
 
+from app.core.cache import mark_data_refreshed
+
 # -------------------------------
 # DB CONFIG (adjust if needed)
 # -------------------------------
@@ -13,6 +15,18 @@ DB_CONFIG = {
     "port": 3306,
 }
 
+# FPL team name -> Understat team name, for names that differ between sources
+TEAM_NAME_ALIASES = [
+    ("Man City", "Manchester City"),
+    ("Man Utd", "Manchester United"),
+    ("Spurs", "Tottenham"),
+    ("Wolves", "Wolverhampton Wanderers"),
+    ("Nott'm Forest", "Nottingham Forest"),
+    ("Newcastle", "Newcastle United"),
+    ("Sheffield Utd", "Sheffield United"),
+    ("West Brom", "West Bromwich Albion"),
+]
+
 # -------------------------------
 # Helper
 # -------------------------------
@@ -58,6 +72,7 @@ try:
         team_name VARCHAR(255),
         xg_for FLOAT,
         xg_against FLOAT,
+        xpts FLOAT,
         PRIMARY KEY (season, team_name)
     )
     """)
@@ -77,10 +92,26 @@ try:
         pts INT,
         xg_for FLOAT,
         xg_against FLOAT,
+        xpts FLOAT,
         PRIMARY KEY (season, team_id)
     )
     """)
 
+    # Persistent alias table: canonical (Understat) name per source alias
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS team_name_alias (
+        source VARCHAR(32),
+        alias VARCHAR(255),
+        canonical VARCHAR(255),
+        PRIMARY KEY (source, alias)
+    )
+    """)
+
+    cur.executemany("""
+    INSERT IGNORE INTO team_name_alias (source, alias, canonical)
+    VALUES ('fpl', %s, %s)
+    """, TEAM_NAME_ALIASES)
+
     conn.commit()
     log("2/10", "Tables ready")
 
@@ -194,7 +225,15 @@ try:
         season,
         team_name,
         ROUND(SUM(xg_for), 2) AS xg_for,
-        ROUND(SUM(xg_against), 2) AS xg_against
+        ROUND(SUM(xg_against), 2) AS xg_against,
+        -- xPts: 3 per match won on xG, 1 per match level on xG
+        SUM(
+            CASE
+                WHEN u.xg_for > u.xg_against THEN 3
+                WHEN u.xg_for = u.xg_against THEN 1
+                ELSE 0
+            END
+        ) AS xpts
     FROM (
         SELECT
             season,
@@ -220,54 +259,37 @@ try:
 
     cur.executemany("""
     INSERT INTO clean_team_xg_season
-    (season, team_name, xg_for, xg_against)
-    VALUES (%(season)s, %(team_name)s, %(xg_for)s, %(xg_against)s)
+    (season, team_name, xg_for, xg_against, xpts)
+    VALUES (%(season)s, %(team_name)s, %(xg_for)s, %(xg_against)s, %(xpts)s)
     """, xg_rows)
 
     conn.commit()
 
     # -------------------------------------------------
-    # [9/10] Merge FPL + Understat in Python
+    # [9/10] Merge FPL + Understat via the alias table
     # -------------------------------------------------
     log("9/10", "Merging FPL stats with Understat xG...")
 
-    cur.execute("SELECT * FROM clean_team_season_stats")
-    fpl = cur.fetchall()
-
-    cur.execute("SELECT * FROM clean_team_xg_season")
-    xg = cur.fetchall()
-
-    xg_lookup = {
-        (str(r["season"]), r["team_name"].lower().strip()):
-        (r["xg_for"], r["xg_against"])
-        for r in xg
-    }
-
-    merged = []
-    for r in fpl:
-        season_start = r["season"].split("-")[0]
-        key = (season_start, r["team_name"].lower().strip())
-        xg_for, xg_against = xg_lookup.get(key, (None, None))
-
-        merged.append({
-            **r,
-            "xg_for": xg_for,
-            "xg_against": xg_against,
-        })
-
-    # -------------------------------------------------
-    # [10/10] Store final clean metrics
-    # -------------------------------------------------
-    cur.executemany("""
+    # Teams without an alias row are named the same in both sources
+    cur.execute("""
     INSERT INTO clean_team_season_metrics
-    (season, team_id, team_name, played, wins, draws, losses, gf, ga, gd, pts, xg_for, xg_against)
-    VALUES (%(season)s, %(team_id)s, %(team_name)s,
-            %(played)s, %(wins)s, %(draws)s, %(losses)s,
-            %(gf)s, %(ga)s, %(gd)s, %(pts)s,
-            %(xg_for)s, %(xg_against)s)
-    """, merged)
+    (season, team_id, team_name, played, wins, draws, losses, gf, ga, gd, pts, xg_for, xg_against, xpts)
+    SELECT
+        s.season, s.team_id, s.team_name,
+        s.played, s.wins, s.draws, s.losses,
+        s.gf, s.ga, s.gd, s.pts,
+        x.xg_for, x.xg_against, x.xpts
+    FROM clean_team_season_stats s
+    LEFT JOIN team_name_alias a
+        ON a.source = 'fpl' AND a.alias = TRIM(s.team_name)
+    LEFT JOIN clean_team_xg_season x
+        ON x.season = CAST(SUBSTRING_INDEX(s.season, '-', 1) AS UNSIGNED)
+        AND x.team_name = COALESCE(a.canonical, TRIM(s.team_name))
+    """)
 
     conn.commit()
+    # New/refreshed clean_* tables and columns (e.g. xpts): let running APIs re-probe
+    mark_data_refreshed()
     log("10/10", "Cleaning data and storing into tables ✅")
 
 except Error as e:
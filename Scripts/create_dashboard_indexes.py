@@ -0,0 +1,182 @@
+"""
+Create the secondary indexes the dashboard queries rely on.
+
+Every query built from season_config.py filters the fact/dimension tables by
+season plus a player, team or gameweek key. Primary keys created by
+upsert_dataframe already cover some of these:
+  - fpl_player_gameweeks (season, element_id, gameweek)
+  - fpl_season_players   (season, element_id)
+  - fpl_season_teams     (season, team_id)
+so only the missing access paths are added here.
+
+MySQL has no INCLUDE clause, so "covering" indexes list the hot columns
+as trailing key parts. The player tables also get a STORED generated
+full_name column, so name lookups read (and index) one column instead of
+CONCAT-ing first/second name per row, plus an ngram FULLTEXT index on it
+for the dashboard's substring player search. Safe to re-run: existing
+columns and indexes are skipped.
+Run once after the initial ingestion (and again if tables are rebuilt).
+"""
+
+from typing import List, Tuple
+
+from Utils.logging_config import get_logger
+from Utils.db import get_connection, execute_query
+from app.core.cache import mark_data_refreshed
+
+logger = get_logger("create_dashboard_indexes")
+
+# (table, column, generated expression) - STORED so the column can be indexed
+GENERATED_COLUMNS: List[Tuple[str, str, str]] = [
+    ("fpl_season_players", "full_name", "CONCAT(`first_name`, ' ', `second_name`)"),
+    ("players", "full_name", "CONCAT(`first_name`, ' ', `second_name`)"),
+]
+
+# (table, index_name, columns)
+INDEXES: List[Tuple[str, str, List[str]]] = [
+    # Per-player season aggregates (squad, top players, player trends)
+    (
+        "fpl_player_gameweeks",
+        "idx_fpg_season_element",
+        ["season", "element_id", "gameweek", "total_points", "goals_scored", "assists", "minutes"],
+    ),
+    # Per-gameweek aggregates (trends, max gameweek)
+    ("fpl_player_gameweeks", "idx_fpg_season_gameweek", ["season", "gameweek"]),
+    # Current-season equivalent of idx_fpg_season_element: the squad and
+    # player aggregates read only these columns, so they scan the index
+    # instead of the wide fact rows
+    (
+        "fact_player_gameweeks",
+        "idx_fact_player_event_cover",
+        ["player_id", "event", "total_points", "goals_scored", "assists", "minutes"],
+    ),
+    # Covering indexes for the per-gameweek aggregates (trends, summary
+    # totals, max gameweek): GROUP BY gameweek with the team filter on the
+    # player id, summing only the trailing columns - index-only scans
+    (
+        "fpl_player_gameweeks",
+        "idx_fpg_season_gw_cover",
+        ["season", "gameweek", "element_id", "total_points", "goals_scored", "assists", "minutes"],
+    ),
+    (
+        "fact_player_gameweeks",
+        "idx_fact_event_player_cover",
+        ["event", "player_id", "total_points", "goals_scored", "assists", "minutes"],
+    ),
+    # Squad membership (team filter subqueries)
+    ("fpl_season_players", "idx_fsp_season_team", ["season", "team_id", "element_id"]),
+    ("players", "idx_players_team", ["team", "id"]),
+    # Understat roster lookups by player name
+    ("understat_roster_metrics", "idx_urm_player_name", ["player"]),
+    # Covering index for the per-player xG/xA aggregate in build_understat_join
+    # (WHERE season = ? GROUP BY player_id, SUM(xg), SUM(xa)) - index-only scan
+    (
+        "understat_roster_metrics",
+        "idx_urm_season_player_cover",
+        ["season", "player_id", "xg", "xa"],
+    ),
+    # Player name lookups / anchored LIKE search on the generated column
+    ("fpl_season_players", "idx_fsp_full_name", ["full_name"]),
+    ("players", "idx_players_full_name", ["full_name"]),
+]
+
+# (table, index_name, columns) - FULLTEXT WITH PARSER ngram, so
+# MATCH ... AGAINST can serve '%term%' style search without a table scan
+FULLTEXT_INDEXES: List[Tuple[str, str, List[str]]] = [
+    ("fpl_season_players", "ftx_fsp_full_name", ["full_name"]),
+    ("players", "ftx_players_full_name", ["full_name"]),
+]
+
+
+def index_exists(table: str, index_name: str) -> bool:
+    query = """
+        SELECT COUNT(*) as cnt
+        FROM information_schema.statistics
+        WHERE table_schema = DATABASE()
+        AND table_name = %s
+        AND index_name = %s
+    """
+    result = execute_query(query, (table, index_name))
+    return bool(result and result[0]["cnt"])
+
+
+def column_exists(table: str, column: str) -> bool:
+    query = """
+        SELECT COUNT(*) as cnt
+        FROM information_schema.columns
+        WHERE table_schema = DATABASE()
+        AND table_name = %s
+        AND column_name = %s
+    """
+    result = execute_query(query, (table, column))
+    return bool(result and result[0]["cnt"])
+
+
+def add_generated_column(table: str, column: str, expression: str):
+    """Add one STORED generated column if it doesn't exist yet (rebuilds the table)."""
+    try:
+        if column_exists(table, column):
+            logger.info(f"Column {column} on {table} already exists")
+            return
+
+        logger.info(f"Adding generated column {column} to {table}...")
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"ALTER TABLE `{table}` ADD COLUMN `{column}` VARCHAR(255) "
+                f"GENERATED ALWAYS AS ({expression}) STORED"
+            )
+            conn.commit()
+            cursor.close()
+        logger.info(f"Added generated column {column}")
+    except Exception as e:
+        logger.warning(f"Could not add column {column} to {table}: {e}")
+
+
+def create_index(table: str, index_name: str, columns: List[str], fulltext: bool = False):
+    """
+    Create one index if it doesn't exist yet. B-tree indexes use online DDL
+    (no table lock); FULLTEXT indexes can't, so they take the default lock.
+    """
+    try:
+        if index_exists(table, index_name):
+            logger.info(f"Index {index_name} on {table} already exists")
+            return
+
+        cols = ", ".join(f"`{c}`" for c in columns)
+        logger.info(f"Creating index {index_name} on {table} ({cols})...")
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            if fulltext:
+                cursor.execute(
+                    f"ALTER TABLE `{table}` ADD FULLTEXT INDEX `{index_name}` ({cols}) "
+                    f"WITH PARSER ngram"
+                )
+            else:
+                cursor.execute(
+                    f"ALTER TABLE `{table}` ADD INDEX `{index_name}` ({cols}), "
+                    f"ALGORITHM=INPLACE, LOCK=NONE"
+                )
+            conn.commit()
+            cursor.close()
+        logger.info(f"Created index {index_name}")
+    except Exception as e:
+        logger.warning(f"Could not create index {index_name} on {table}: {e}")
+
+
+def create_dashboard_indexes():
+    for table, column, expression in GENERATED_COLUMNS:
+        add_generated_column(table, column, expression)
+
+    for table, index_name, columns in INDEXES:
+        create_index(table, index_name, columns)
+
+    for table, index_name, columns in FULLTEXT_INDEXES:
+        create_index(table, index_name, columns, fulltext=True)
+
+    # Running APIs re-probe for full_name and the FULLTEXT indexes
+    mark_data_refreshed()
+
+
+if __name__ == "__main__":
+    create_dashboard_indexes()
@@ -0,0 +1,124 @@
+"""
+Tests for dashboard response-cache keys and invalidation (app.core.cache).
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi_cache")
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+
+from app.core.cache import (
+    CACHE_PREFIX, DASHBOARD_NAMESPACE, clear_dashboard_cache, dashboard_key_builder
+)
+
+
+def _cached_endpoint():
+    """A decorated stand-in for a dashboard route, counting real calls."""
+    calls = {"n": 0}
+
+    @cache(namespace=DASHBOARD_NAMESPACE, key_builder=dashboard_key_builder, expire=60)
+    async def summary(season: str = None, team_id: int = None, current_user: dict = None):
+        calls["n"] += 1
+        return {"season": season, "team_id": team_id}
+
+    return summary, calls
+
+
+@pytest.fixture
+def backend():
+    backend = InMemoryBackend()
+    backend._store.clear()  # the in-memory store is shared class state
+    FastAPICache.init(backend, prefix=CACHE_PREFIX)
+    yield backend
+    backend._store.clear()
+    FastAPICache.reset()
+
+
+class TestDashboardCacheKeys:
+    def test_key_layout(self, backend):
+        summary, _ = _cached_endpoint()
+        asyncio.run(summary(season="2023-24", team_id=1))
+        asyncio.run(summary())
+
+        keys = sorted(backend._store)
+        assert len(keys) == 2
+        assert keys[0].startswith(f"{CACHE_PREFIX}:{DASHBOARD_NAMESPACE}:2023-24:")
+        assert keys[1].startswith(f"{CACHE_PREFIX}:{DASHBOARD_NAMESPACE}:all:")
+
+    def test_current_user_does_not_vary_the_key(self, backend):
+        summary, calls = _cached_endpoint()
+        asyncio.run(summary(season="2023-24", current_user={"id": 1}))
+        asyncio.run(summary(season="2023-24", current_user={"id": 2}))
+        assert calls["n"] == 1
+
+    def test_clear_invalidates_cached_responses(self, backend):
+        summary, calls = _cached_endpoint()
+        asyncio.run(summary(season="2023-24"))
+        asyncio.run(summary(season="2023-24"))
+        assert calls["n"] == 1
+
+        asyncio.run(clear_dashboard_cache())
+        assert not backend._store
+
+        asyncio.run(summary(season="2023-24"))
+        assert calls["n"] == 2
+
+
+class TestSeasonInvalidation:
+    """invalidate_dashboard_cache against keys written by the real decorator."""
+
+    @pytest.fixture
+    def redis_server(self, monkeypatch):
+        fakeredis = pytest.importorskip("fakeredis")
+        from fastapi_cache.backends.redis import RedisBackend
+        from app.core import cache as cache_module
+
+        server = fakeredis.FakeServer()
+        FastAPICache.init(
+            RedisBackend(fakeredis.aioredis.FakeRedis(server=server)), prefix=CACHE_PREFIX
+        )
+        monkeypatch.setattr(cache_module.settings, "REDIS_URL", "redis://cache:6379/0")
+        monkeypatch.setattr(
+            cache_module.Redis, "from_url",
+            staticmethod(lambda url, **kwargs: fakeredis.FakeRedis(server=server)),
+        )
+        yield fakeredis.FakeRedis(server=server)
+        FastAPICache.reset()
+
+    def test_invalidates_only_the_refreshed_season(self, redis_server):
+        from app.core.cache import invalidate_dashboard_cache
+
+        summary, calls = _cached_endpoint()
+
+        # One event loop for the whole scenario: the async client is bound to it
+        async def scenario():
+            for season in ("2023-24", "2022-23", None):
+                await summary(season=season)
+            responses = f"{CACHE_PREFIX}:{DASHBOARD_NAMESPACE}:*"
+            assert len(redis_server.keys(responses)) == 3
+
+            invalidate_dashboard_cache("2023-24")
+
+            remaining = [k.decode() for k in redis_server.keys(responses)]
+            assert len(remaining) == 1
+            assert remaining[0].startswith(f"{CACHE_PREFIX}:{DASHBOARD_NAMESPACE}:2022-23:")
+
+            # The invalidated season is recomputed, the other one is still cached
+            await summary(season="2023-24")
+            await summary(season="2022-23")
+
+        asyncio.run(scenario())
+        assert calls["n"] == 4
+
+    def test_etl_signals_bump_the_data_version(self, redis_server):
+        from app.core.cache import get_data_version, invalidate_dashboard_cache, mark_data_refreshed
+
+        assert get_data_version() == 0
+        invalidate_dashboard_cache("2023-24")
+        mark_data_refreshed()
+        assert get_data_version() == 2
@@ -0,0 +1,350 @@
+"""
+Unit tests for dashboard service helpers that don't need a database:
+execute_query is replaced per test where a helper would query.
+"""
+
+import threading
+import time
+import unicodedata
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pydantic")
+pytest.importorskip("mysql.connector")
+
+from app.api.dashboard import service
+from app.api.dashboard.schemas import GlobalSearchFilters
+
+
+class TestSchemaProbes:
+    """Optional-object probes: cached on success, never on DB errors."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self):
+        service.invalidate_filters_cache()
+        yield
+        service.invalidate_filters_cache()
+
+    def test_transient_error_is_not_cached(self, monkeypatch):
+        responses = [RuntimeError("connection lost"), [{"cnt": 1}]]
+        calls = []
+
+        def fake_execute_query(query, params=None):
+            calls.append(params)
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(service, "execute_query", fake_execute_query)
+
+        with pytest.raises(RuntimeError):
+            service._table_exists("understat_player_map")
+        assert service._table_exists("understat_player_map") is True
+        assert service._table_exists("understat_player_map") is True
+        assert len(calls) == 2
+
+    def test_invalidate_clears_probes_and_query_text(self, monkeypatch):
+        counts = iter([[{"cnt": 0}], [{"cnt": 1}]])
+        monkeypatch.setattr(service, "execute_query", lambda query, params=None: next(counts))
+
+        assert service._column_exists("fpl_season_players", "full_name") is False
+        service._cached_query(("probe_test",), lambda: "SELECT 1")
+
+        service.invalidate_filters_cache()
+
+        assert ("probe_test",) not in service._QUERY_CACHE
+        assert service._column_exists("fpl_season_players", "full_name") is True
+
+    def test_found_objects_are_cached_for_good(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            service, "execute_query", lambda query, params=None: calls.append(params) or [{"cnt": 1}]
+        )
+        monkeypatch.setattr(service, "SCHEMA_PROBE_RETRY_TTL", 0)
+
+        for _ in range(3):
+            assert service._index_exists("players", "ftx_players_full_name") is True
+        assert len(calls) == 1
+
+    def test_missing_objects_are_reprobed_after_ttl(self, monkeypatch):
+        counts = iter([[{"cnt": 0}], [{"cnt": 1}]])
+        monkeypatch.setattr(service, "execute_query", lambda query, params=None: next(counts))
+
+        assert service._table_exists("understat_player_map") is False
+        # Within the TTL the negative answer is reused (no second query)
+        assert service._table_exists("understat_player_map") is False
+
+        service._cached_query(("built_without_map",), lambda: "SELECT 1")
+        monkeypatch.setattr(service, "SCHEMA_PROBE_RETRY_TTL", 0)
+        service._schema_missing[("table", "understat_player_map")] = 0.0
+
+        # The ETL has built the table since: found, and stale query text dropped
+        assert service._table_exists("understat_player_map") is True
+        assert ("built_without_map",) not in service._QUERY_CACHE
+
+
+class TestDataVersion:
+    """sync_data_version drops in-process caches when the ETL bumps the version."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_state(self, monkeypatch):
+        monkeypatch.setattr(service, "_data_version", {"value": None, "checked": 0.0})
+        monkeypatch.setattr(service, "DATA_VERSION_CHECK_TTL", 0)
+        service.invalidate_filters_cache()
+        yield
+        service.invalidate_filters_cache()
+
+    def test_version_change_invalidates(self, monkeypatch):
+        versions = iter([3, 3, 4])
+        monkeypatch.setattr(service, "get_data_version", lambda: next(versions))
+
+        service.sync_data_version()
+        service._cached_query(("stale",), lambda: "SELECT 1")
+        service.sync_data_version()
+        assert ("stale",) in service._QUERY_CACHE
+
+        service.sync_data_version()
+        assert ("stale",) not in service._QUERY_CACHE
+
+    def test_checks_are_rate_limited(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(service, "DATA_VERSION_CHECK_TTL", 60)
+        monkeypatch.setattr(service, "get_data_version", lambda: calls.append(1) or 1)
+
+        for _ in range(5):
+            service.sync_data_version()
+        assert len(calls) == 1
+
+    def test_without_redis_nothing_is_dropped(self, monkeypatch):
+        monkeypatch.setattr(service, "get_data_version", lambda: None)
+        service._cached_query(("kept",), lambda: "SELECT 1")
+        service.sync_data_version()
+        service.sync_data_version()
+        assert ("kept",) in service._QUERY_CACHE
+
+
+class TestQueryTextCache:
+    """_cached_query keys must use the same team predicate as the SQL template."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self):
+        service.invalidate_filters_cache()
+        yield
+        service.invalidate_filters_cache()
+
+    @pytest.fixture
+    def queries(self, monkeypatch):
+        seen = []
+
+        def fake_execute_query(query, params=None):
+            seen.append(query)
+            if "information_schema" in query:
+                return [{"cnt": 0}]  # no summary tables: live aggregation
+            return []
+
+        monkeypatch.setattr(service, "execute_query", fake_execute_query)
+        return seen
+
+    @pytest.mark.parametrize("first,second", [(0, 5), (5, 0), (None, 5), (0, None)])
+    def test_trends_team_filter(self, queries, first, second):
+        service.get_gameweek_trends(team_id=first, season="2023-24")
+        service.get_gameweek_trends(team_id=second, season="2023-24")
+
+        trends = [q for q in queries if "GROUP BY" in q and "information_schema" not in q]
+        assert len(trends) == 2
+        for team_id, query in zip((first, second), trends):
+            assert ("%(team_id)s" in query) == bool(team_id)
+
+    @pytest.mark.parametrize("first,second", [(0, 5), (5, 0)])
+    def test_summary_team_filter(self, queries, first, second):
+        service.get_summary_stats(team_id=first, season="2023-24")
+        service.get_summary_stats(team_id=second, season="2023-24")
+
+        summaries = [q for q in queries if "avg_val" in q]
+        assert len(summaries) == 2
+        for team_id, query in zip((first, second), summaries):
+            assert ("%(team_id)s" in query) == bool(team_id)
+
+
+class TestNormalizeName:
+    """normalize_name: translate-table fast paths agree with full NFKD folding."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Bukayo Saka", "bukayo saka"),
+        ("  Heung-Min Son ", "heung-min son"),
+        ("Mesut Özil", "mesut ozil"),
+        ("João Cancelo", "joao cancelo"),
+        ("Sergio Agüero", "sergio aguero"),
+        ("Łukasz Fabiański", "lukasz fabianski"),
+        ("Martin Ødegaard", "martin odegaard"),
+        ("Đorđe Petrović", "dorde petrovic"),
+        ("José\u0301", "jose"),  # combining acute accent: NFKD fallback
+        ("Nguyễn", "nguyen"),  # outside the Latin tables: NFKD fallback
+        ("", ""),
+        (None, ""),
+    ])
+    def test_names(self, name, expected):
+        assert service.normalize_name(name) == expected
+
+    def test_table_matches_nfkd_for_decomposable_letters(self):
+        for code in range(0x00C0, 0x0180):
+            ch = chr(code)
+            nfkd = unicodedata.normalize("NFKD", ch).encode("ASCII", "ignore").decode("ascii")
+            if nfkd:
+                assert service.normalize_name(ch) == nfkd.lower(), ch
+
+    def test_result_is_always_ascii(self):
+        for code in range(0x00C0, 0x0250):
+            assert service.normalize_name(f"a{chr(code)}b").isascii()
+
+
+class TestGlobalSearchPaging:
+    """Page cache boundaries and next-page prefetch in get_global_players."""
+
+    PLAYERS = [
+        {"pid": i, "name": f"Player {i}", "tname": "ARS", "total_points": 100 - i,
+         "goals_scored": 0, "assists": 0, "xg": None, "xa": None}
+        for i in range(1, 6)
+    ]
+
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self):
+        service.invalidate_filters_cache()
+        yield
+        service.invalidate_filters_cache()
+
+    @pytest.fixture
+    def searches(self, monkeypatch):
+        """Serve pages from PLAYERS and record the (limit, offset) of each search query."""
+        seen = []
+        lock = threading.Lock()
+
+        def fake_execute_query(query, params=None):
+            if "information_schema" in query:
+                return [{"cnt": 0}]
+            with lock:
+                seen.append((params["limit"], params["offset"]))
+            return self.PLAYERS[params["offset"]:params["offset"] + params["limit"]]
+
+        monkeypatch.setattr(service, "execute_query", fake_execute_query)
+        return seen
+
+    @staticmethod
+    def _page_ids(filters):
+        return [r["player_id"] for r in service.get_global_players(filters)]
+
+    @staticmethod
+    def _wait_for_prefetch(filters, page):
+        key = (tuple(sorted(filters.model_dump(exclude={"page"}).items())), page)
+        deadline = time.monotonic() + 5
+        while service._search_page_get(key) is None:
+            assert time.monotonic() < deadline, "prefetch did not complete"
+            time.sleep(0.01)
+
+    def test_pages_use_limit_and_offset(self, searches):
+        assert self._page_ids(GlobalSearchFilters(page=1, page_size=2)) == [1, 2]
+        self._wait_for_prefetch(GlobalSearchFilters(page_size=2), 2)
+        assert sorted(searches) == [(2, 0), (2, 2)]
+
+    def test_next_page_is_served_from_prefetch(self, searches):
+        filters = GlobalSearchFilters(page=1, page_size=2)
+        self._page_ids(filters)
+        self._wait_for_prefetch(filters, 2)
+
+        assert self._page_ids(filters.model_copy(update={"page": 2})) == [3, 4]
+        # Page 2 was a cache hit; serving it only triggered the page 3 prefetch
+        self._wait_for_prefetch(filters, 3)
+        assert sorted(searches) == [(2, 0), (2, 2), (2, 4)]
+
+    def test_short_page_does_not_prefetch(self, searches):
+        assert self._page_ids(GlobalSearchFilters(page=3, page_size=2)) == [5]
+        time.sleep(0.05)
+        assert searches == [(2, 4)]
+
+    def test_repeat_request_is_a_cache_hit(self, searches):
+        filters = GlobalSearchFilters(page=1, page_size=10)  # one short page, no prefetch
+        assert self._page_ids(filters) == [1, 2, 3, 4, 5]
+        assert self._page_ids(filters) == [1, 2, 3, 4, 5]
+        assert searches == [(10, 0)]
+
+    def test_different_filters_do_not_share_pages(self, searches):
+        self._page_ids(GlobalSearchFilters(page_size=10, sort_by="minutes"))
+        self._page_ids(GlobalSearchFilters(page_size=10, sort_by="form"))
+        assert searches == [(10, 0), (10, 0)]
+
+    def test_expired_pages_are_refetched(self, searches, monkeypatch):
+        monkeypatch.setattr(service, "SEARCH_PAGE_CACHE_TTL", 0)
+        filters = GlobalSearchFilters(page_size=10)
+        self._page_ids(filters)
+        self._page_ids(filters)
+        assert searches == [(10, 0), (10, 0)]
+
+    def test_cache_is_bounded(self, searches, monkeypatch):
+        monkeypatch.setattr(service, "SEARCH_PAGE_CACHE_SIZE", 2)
+        for min_points in (1, 2, 3):
+            self._page_ids(GlobalSearchFilters(page_size=10, min_points=min_points))
+        assert len(service._search_pages) == 2
+
+        # The oldest entry was evicted, the newest are still cached
+        self._page_ids(GlobalSearchFilters(page_size=10, min_points=3))
+        self._page_ids(GlobalSearchFilters(page_size=10, min_points=1))
+        assert searches == [(10, 0)] * 4
+
+
+class TestPlayerTrendsGapFill:
+    """get_player_trends keeps every fetched gameweek, even past a stale max gameweek."""
+
+    @staticmethod
+    def _row(gw, points):
+        return {"gw": gw, "p": points, "m": 90, "g": 0, "a": 0, "v": 5.0, "xg": None, "xa": None}
+
+    @pytest.fixture
+    def trend_rows(self, monkeypatch):
+        rows = []
+
+        def fake_execute_query(query, params=None):
+            if "information_schema" in query:
+                return [{"cnt": 0}]
+            if "as name" in query:
+                return [{"name": "Bukayo Saka"}]
+            return rows
+
+        monkeypatch.setattr(service, "execute_query", fake_execute_query)
+        monkeypatch.setattr(service, "_get_max_gameweek", lambda schema: 2)
+        service.invalidate_filters_cache()
+        yield rows
+        service.invalidate_filters_cache()
+
+    def test_rows_past_cached_max_gameweek_are_kept(self, trend_rows):
+        trend_rows += [self._row(1, 2), self._row(3, 8), self._row(4, 12)]
+        trend = service.get_player_trends(7, season="2023-24").trend
+
+        assert [(t.gameweek, t.points) for t in trend] == [(1, 2), (2, 0), (3, 8), (4, 12)]
+
+    def test_gap_fill_runs_to_max_gameweek_without_rows(self, trend_rows):
+        trend_rows += [self._row(1, 2), self._row(None, 5)]
+        trend = service.get_player_trends(7, season="2023-24").trend
+
+        assert [(t.gameweek, t.points) for t in trend] == [(1, 2), (2, 0)]
+
+
+class TestGameweekTrendsGapFill:
+    """_gap_fill_trends zero-fills holes and tolerates rows with no gameweek."""
+
+    @staticmethod
+    def _row(gw, points):
+        return {"gameweek": gw, "total_points": points, "total_goals": 1,
+                "total_assists": 0, "avg_minutes": 60}
+
+    def test_missing_gameweeks_are_zero_filled(self):
+        data = service._gap_fill_trends([self._row(1, 50), self._row(3, 70)])
+
+        assert [(d.gameweek, d.total_points) for d in data] == [(1, 50.0), (2, 0.0), (3, 70.0)]
+
+    def test_null_gameweek_rows_are_skipped(self):
+        data = service._gap_fill_trends([self._row(None, 10), self._row(2, 40)])
+
+        assert [(d.gameweek, d.total_points) for d in data] == [(1, 0.0), (2, 40.0)]
+        assert service._gap_fill_trends([self._row(None, 10)]) == []
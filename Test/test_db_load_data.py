@@ -0,0 +1,43 @@
+"""
+Tests for the LOAD DATA file written by Utils.db bulk loads.
+"""
+
+import io
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("mysql.connector")
+pytest.importorskip("dotenv")
+
+from Utils.db import _write_load_data_file
+
+
+def _render(df):
+    buf = io.StringIO()
+    _write_load_data_file(df, buf)
+    return buf.getvalue()
+
+
+class TestLoadDataFile:
+    """NULLs, literal strings and escaping in the TSV handed to LOAD DATA."""
+
+    def test_missing_values_use_null_marker(self):
+        df = pd.DataFrame({"name": ["Saka", None], "goals": [16.0, None]})
+        assert _render(df) == "Saka\t16.0\n\\N\t\\N\n"
+
+    def test_literal_null_string_is_not_null(self):
+        df = pd.DataFrame({"name": ["NULL", "\\N"]})
+        assert _render(df) == "NULL\n\\\\N\n"
+
+    def test_backslashes_are_escaped(self):
+        df = pd.DataFrame({"path": ["a\\b"]})
+        assert _render(df) == "a\\\\b\n"
+
+    def test_separators_in_text_are_enclosed(self):
+        df = pd.DataFrame({"note": ['tab\there', 'say "hi"', "two\nlines"]})
+        assert _render(df) == '"tab\there"\n"say ""hi"""\n"two\nlines"\n'
+
+    def test_booleans_are_written_as_integers(self):
+        df = pd.DataFrame({"flag": [True, False], "id": [1, 2]})
+        assert _render(df) == "1\t1\n0\t2\n"
@@ -0,0 +1,86 @@
+"""
+Tests for DashboardETagMiddleware (app.core.etag).
+"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.etag import (
+    CURRENT_CACHE_CONTROL, HISTORICAL_CACHE_CONTROL, DashboardETagMiddleware
+)
+
+
+def _make_client():
+    app = FastAPI()
+    app.add_middleware(DashboardETagMiddleware)
+    state = {"calls": 0, "payload": {"standings": [1, 2, 3]}}
+
+    def require_token(authorization: str = Header(None)):
+        if authorization != "Bearer ok":
+            raise HTTPException(status_code=401)
+
+    @app.get("/dashboard/standings", dependencies=[Depends(require_token)])
+    def standings(season: str = None):
+        state["calls"] += 1
+        return state["payload"]
+
+    return TestClient(app), state
+
+
+AUTH = {"Authorization": "Bearer ok"}
+
+
+class TestDashboardETag:
+    def test_historical_response_is_private_and_not_immutable(self):
+        client, _ = _make_client()
+        resp = client.get("/dashboard/standings", params={"season": "2019-20"}, headers=AUTH)
+        assert resp.status_code == 200
+        assert resp.headers["Cache-Control"] == HISTORICAL_CACHE_CONTROL
+        assert "private" in HISTORICAL_CACHE_CONTROL
+        assert "public" not in HISTORICAL_CACHE_CONTROL
+        assert "immutable" not in HISTORICAL_CACHE_CONTROL
+
+    def test_current_season_must_revalidate(self):
+        client, _ = _make_client()
+        resp = client.get("/dashboard/standings", headers=AUTH)
+        assert resp.headers["Cache-Control"] == CURRENT_CACHE_CONTROL
+
+    def test_matching_etag_returns_304_after_handler_runs(self):
+        client, state = _make_client()
+        params = {"season": "2019-20"}
+        etag = client.get("/dashboard/standings", params=params, headers=AUTH).headers["ETag"]
+
+        resp = client.get(
+            "/dashboard/standings", params=params, headers={**AUTH, "If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+        assert state["calls"] == 2
+
+    def test_etag_follows_the_body(self):
+        client, state = _make_client()
+        params = {"season": "2019-20"}
+        etag = client.get("/dashboard/standings", params=params, headers=AUTH).headers["ETag"]
+
+        # e.g. an outage fallback replaced by real data: the old tag no longer matches
+        state["payload"] = {"standings": []}
+        resp = client.get(
+            "/dashboard/standings", params=params, headers={**AUTH, "If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+        assert resp.json() == {"standings": []}
+
+    def test_unauthenticated_revalidation_is_rejected(self):
+        client, _ = _make_client()
+        params = {"season": "2019-20"}
+        etag = client.get("/dashboard/standings", params=params, headers=AUTH).headers["ETag"]
+
+        resp = client.get("/dashboard/standings", params=params, headers={"If-None-Match": etag})
+        assert resp.status_code == 401
+        assert "ETag" not in resp.headers
@@ -0,0 +1,45 @@
+"""
+Tests for the dtype hints used when parsing FPL GitHub CSVs.
+"""
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("requests")
+pytest.importorskip("mysql.connector")
+pytest.importorskip("dotenv")
+
+from Utils.db import _map_dtype_to_mysql_type
+from Utils.github_fetch import SCHEMAS, _parse_csv, _schema_for
+
+TEAMS_CSV = b"id,name,short_name,strength\n1,Arsenal,ARS,4\n2,Aston Villa,AVL,3\n"
+
+
+class TestSchemaLookup:
+    def test_lookup_by_file_name(self):
+        assert _schema_for("2023-24/teams.csv") is SCHEMAS["teams.csv"]
+        assert _schema_for("2023-24/gws/gw12.csv") is SCHEMAS["gw*.csv"]
+        assert _schema_for("2023-24/fixtures.csv") is None
+
+    def test_schemas_use_numpy_dtypes_only(self):
+        for schema in SCHEMAS.values():
+            assert set(schema.values()) <= {"int64", "object"}
+
+
+class TestParseCsv:
+    def test_hinted_columns_are_numpy_backed(self):
+        df = _parse_csv("teams.csv", TEAMS_CSV, "utf-8", SCHEMAS["teams.csv"])
+        assert str(df["id"].dtype) == "int64"
+        assert df["name"].dtype == object
+        assert df["name"].tolist() == ["Arsenal", "Aston Villa"]
+
+    def test_hinted_columns_map_to_mysql_types(self):
+        df = _parse_csv("teams.csv", TEAMS_CSV, "utf-8", SCHEMAS["teams.csv"])
+        assert _map_dtype_to_mysql_type(df["id"].dtype) == "INT"
+        assert _map_dtype_to_mysql_type(df["name"].dtype) == "VARCHAR(255)"
+
+    def test_mismatched_hint_falls_back_to_inference(self):
+        df = _parse_csv("teams.csv", TEAMS_CSV, "utf-8", {"name": "int64"})
+        assert df["name"].tolist() == ["Arsenal", "Aston Villa"]
+        assert str(df["id"].dtype) == "int64"
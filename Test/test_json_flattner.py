@@ -0,0 +1,91 @@
+"""
+Tests for Utils.json_flattner: key names and key order of flattened payloads.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from Utils.json_flattner import flatten_json, json_to_dataframe
+
+
+def _flatten_recursive(obj, parent_key="", sep="."):
+    """The original recursive implementation, kept as the reference."""
+    items = []
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            new_key = f"{parent_key}{sep}{k}" if parent_key else k
+            items.extend(_flatten_recursive(v, new_key, sep=sep).items())
+    elif isinstance(obj, list):
+        for i, v in enumerate(obj):
+            new_key = f"{parent_key}{sep}{i}"
+            items.extend(_flatten_recursive(v, new_key, sep=sep).items())
+    else:
+        items.append((parent_key, obj))
+    return dict(items)
+
+
+def _random_payload(rng, depth=0):
+    if depth > 3 or rng.random() < 0.3:
+        return rng.choice([1, 2.5, "x", None, True])
+    if rng.random() < 0.5:
+        return [_random_payload(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return {f"k{i}": _random_payload(rng, depth + 1) for i in range(rng.randint(0, 3))}
+
+
+class TestFlattenJson:
+    """flatten_json keys and ordering."""
+
+    def test_nested_dicts(self):
+        payload = {"id": 1, "stats": {"minutes": 90, "goals": {"open_play": 1, "pens": 0}}}
+        flat = flatten_json(payload)
+        assert list(flat.items()) == [
+            ("id", 1),
+            ("stats.minutes", 90),
+            ("stats.goals.open_play", 1),
+            ("stats.goals.pens", 0),
+        ]
+
+    def test_lists_are_indexed_in_order(self):
+        payload = {"explain": [{"fixture": 7, "stats": [{"value": 90}, {"value": 2}]}], "z": 0}
+        flat = flatten_json(payload)
+        assert list(flat) == [
+            "explain.0.fixture",
+            "explain.0.stats.0.value",
+            "explain.0.stats.1.value",
+            "z",
+        ]
+
+    def test_empty_containers_produce_no_keys(self):
+        assert flatten_json({"a": {}, "b": [], "c": 1}) == {"c": 1}
+
+    def test_custom_separator_and_parent_key(self):
+        assert flatten_json({"a": {"b": 1}}, parent_key="root", sep="_") == {"root_a_b": 1}
+
+    def test_deep_nesting_has_no_recursion_limit(self):
+        payload = value = {}
+        for _ in range(5000):
+            value["n"] = {}
+            value = value["n"]
+        value["leaf"] = 1
+        flat = flatten_json(payload)
+        assert list(flat.values()) == [1]
+
+    def test_matches_recursive_implementation(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            payload = _random_payload(rng)
+            assert list(flatten_json(payload).items()) == list(_flatten_recursive(payload).items())
+
+
+class TestJsonToDataframe:
+    def test_list_of_records(self):
+        df = json_to_dataframe([{"id": 1, "s": {"m": 90}}, {"id": 2, "s": {"m": 0}}])
+        assert list(df.columns) == ["id", "s.m"]
+        assert df["s.m"].tolist() == [90, 0]
+
+    def test_unsupported_structure(self):
+        with pytest.raises(ValueError):
+            json_to_dataframe("not json")
@@ -0,0 +1,92 @@
+"""
+Tests for retry_request: which failures are retried and which propagate.
+"""
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from Exceptions.fpl_exceptions import FPLServerError
+from Utils import retry
+from Utils.retry import retry_request
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda seconds: None)
+
+
+def _failing(exc, succeed_after=1):
+    """Callable that raises exc for the first succeed_after calls, then returns "ok"."""
+    calls = {"n": 0}
+
+    def func():
+        calls["n"] += 1
+        if calls["n"] <= succeed_after:
+            raise exc
+        return "ok"
+
+    return func, calls
+
+
+def _http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+class TestRetryable:
+    """Transient failures are retried until the call succeeds."""
+
+    @pytest.mark.parametrize("exc", [
+        ConnectionError("reset"),
+        TimeoutError("slow"),
+        requests.ConnectionError("refused"),
+        requests.Timeout("read timeout"),
+        FPLServerError("503"),
+    ])
+    def test_transient_errors_are_retried(self, exc):
+        func, calls = _failing(exc)
+        assert retry_request(func, retries=3) == "ok"
+        assert calls["n"] == 2
+
+    @pytest.mark.parametrize("status_code", [429, 500, 502, 503, 504])
+    def test_http_error_retried_for_rate_limit_and_server_errors(self, status_code):
+        func, calls = _failing(_http_error(status_code))
+        assert retry_request(func, retries=3) == "ok"
+        assert calls["n"] == 2
+
+    def test_selenium_timeout_is_retried(self):
+        exceptions = pytest.importorskip("selenium.common.exceptions")
+        func, calls = _failing(exceptions.TimeoutException("page load"))
+        assert retry_request(func, retries=3) == "ok"
+        assert calls["n"] == 2
+
+    def test_selenium_webdriver_error_is_retried(self):
+        exceptions = pytest.importorskip("selenium.common.exceptions")
+        func, calls = _failing(exceptions.WebDriverException("tab crashed"))
+        assert retry_request(func, retries=3) == "ok"
+        assert calls["n"] == 2
+
+    def test_gives_up_after_retries(self):
+        func, calls = _failing(FPLServerError("503"), succeed_after=10)
+        with pytest.raises(FPLServerError):
+            retry_request(func, retries=3)
+        assert calls["n"] == 3
+
+
+class TestNonRetryable:
+    """Permanent failures propagate on the first attempt."""
+
+    @pytest.mark.parametrize("status_code", [400, 401, 404])
+    def test_http_client_errors_are_not_retried(self, status_code):
+        func, calls = _failing(_http_error(status_code))
+        with pytest.raises(requests.HTTPError):
+            retry_request(func, retries=3)
+        assert calls["n"] == 1
+
+    def test_programming_errors_are_not_retried(self):
+        func, calls = _failing(KeyError("events"))
+        with pytest.raises(KeyError):
+            retry_request(func, retries=3)
+        assert calls["n"] == 1
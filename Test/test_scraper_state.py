@@ -0,0 +1,99 @@
+"""
+Tests for the SQLite-backed scraper state store (Utils.scraper_state).
+"""
+
+import pytest
+
+from Utils import state_db, scraper_state
+
+
+@pytest.fixture(autouse=True)
+def state_store(tmp_path, monkeypatch):
+    """Point the state store at a fresh database for every test."""
+    monkeypatch.setattr(state_db, "STATE_DIR", str(tmp_path))
+    monkeypatch.setattr(state_db, "STATE_DB", str(tmp_path / "state.db"))
+    monkeypatch.setattr(state_db, "_CONN", None)
+    monkeypatch.setattr(scraper_state, "PLAYER_STATE_FILE", str(tmp_path / "missing.json"))
+    monkeypatch.setattr(scraper_state, "_legacy_checked", False)
+    monkeypatch.setattr(scraper_state, "_STATE_CACHE", None)
+    yield
+    if state_db._CONN is not None:
+        state_db._CONN.close()
+
+
+def _reload():
+    """Drop the in-memory cache so the next read comes from the database."""
+    scraper_state._STATE_CACHE = None
+
+
+class TestSaveAndLoad:
+    """save_player_state / load_player_state round trips."""
+
+    def test_roundtrip(self):
+        state = {
+            "p1": {
+                "player_name": "Martin Ødegaard",
+                "last_scraped_season": "2023-24",
+                "completed_seasons": ["2022-23", "2023-24"],
+                "status": "completed",
+            },
+            "p2": {
+                "player_name": "Bukayo Saka",
+                "last_scraped_season": None,
+                "completed_seasons": [],
+                "status": "failed",
+                "failure_reason": "timeout",
+            },
+        }
+        scraper_state.save_player_state(state)
+        _reload()
+
+        assert scraper_state.load_player_state() == state
+        assert scraper_state.get_incomplete_players() == ["p2"]
+
+    def test_save_removes_players_missing_from_state(self):
+        scraper_state.update_player_progress("p1", "Player One", "2023-24", "completed")
+        scraper_state.update_player_progress("p2", "Player Two")
+
+        scraper_state.save_player_state({"p1": scraper_state.get_player_status("p1")})
+
+        assert set(scraper_state.load_player_state()) == {"p1"}
+        _reload()
+        assert set(scraper_state.load_player_state()) == {"p1"}
+        assert scraper_state.get_player_status("p2") is None
+
+
+class TestCacheConsistency:
+    """The in-memory cache only changes after the database write succeeds."""
+
+    def test_failed_write_leaves_cache_unchanged(self):
+        scraper_state.update_player_progress("p1", "Player One", "2022-23")
+        before = scraper_state.get_player_status("p1")
+
+        conn = state_db.get_state_connection()
+        conn.execute("PRAGMA query_only = ON")
+        try:
+            with pytest.raises(Exception):
+                scraper_state.update_player_progress("p1", "Player One", "2023-24", "completed")
+            with pytest.raises(Exception):
+                scraper_state.mark_player_failed("p1", "Player One", "blocked")
+        finally:
+            conn.execute("PRAGMA query_only = OFF")
+
+        assert scraper_state.get_player_status("p1") == before
+        assert scraper_state.get_incomplete_players() == ["p1"]
+
+    def test_returned_state_is_a_copy(self):
+        scraper_state.update_player_progress("p1", "Player One", "2022-23")
+
+        info = scraper_state.get_player_status("p1")
+        info["status"] = "completed"
+        info["completed_seasons"].append("2023-24")
+        scraper_state.load_player_state()["p1"]["completed_seasons"].clear()
+
+        assert scraper_state.get_player_status("p1") == {
+            "player_name": "Player One",
+            "last_scraped_season": "2022-23",
+            "completed_seasons": ["2022-23"],
+            "status": "in_progress",
+        }
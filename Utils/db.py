@@ -1,7 +1,11 @@
+import csv
 import json
 import os
+import tempfile
 from contextlib import contextmanager
-from typing import Iterable, Mapping, List
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Mapping, List, Tuple
 
 import mysql.connector
 from mysql.connector import Error as MySQLError
@@ -19,10 +23,18 @@ logger = get_logger("db")
 # This is a no-op if the file does not exist or variables are already set.
 load_dotenv()
 
+# Shared compact encoder for JSON payloads (avoids a new JSONEncoder per json.dumps call)
+_ENCODE_JSON = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
 
+# events_raw only needs its CREATE TABLE IF NOT EXISTS issued once per process
+_events_table_created = False
+
+
+@lru_cache(maxsize=1)
 def _get_db_config() -> dict:
     """
     Read database configuration from environment variables.
+    Cached for the lifetime of the process.
 
     Expected variables:
       - FPL_DB_HOST
@@ -53,11 +65,16 @@ def _get_db_config() -> dict:
 
 
 @contextmanager
-def get_connection():
+def get_connection(allow_local_infile: bool = False):
     """
     Context manager that yields a MySQL connection.
+
+    Args:
+        allow_local_infile: Enable client-side LOAD DATA LOCAL INFILE (bulk loads)
     """
     cfg = _get_db_config()
+    if allow_local_infile:
+        cfg = {**cfg, "allow_local_infile": True}
 
     try:
         conn = mysql.connector.connect(**cfg)
@@ -84,7 +101,13 @@ def _ensure_events_table(conn) -> None:
       - payload: JSON payload from the FPL API
       - created_at: insert timestamp
       - updated_at: last update timestamp
+
+    Only issues the DDL once per process.
     """
+    global _events_table_created
+    if _events_table_created:
+        return
+
     create_sql = """
         CREATE TABLE IF NOT EXISTS events_raw (
             id INT AUTO_INCREMENT PRIMARY KEY,
@@ -101,6 +124,7 @@ def _ensure_events_table(conn) -> None:
         with conn.cursor() as cur:
             cur.execute(create_sql)
         conn.commit()
+        _events_table_created = True
     except MySQLError as e:
         logger.error(f"Failed to ensure events_raw table exists: {e}")
         raise DBWriteError(f"Could not create or verify events_raw table: {e}") from e
@@ -137,7 +161,7 @@ def upsert_events(records: Iterable[Mapping]) -> None:
                 logger.error(f"Malformed record missing key {e}: {rec}")
                 continue
 
-            payload_json = json.dumps(data)
+            payload_json = _ENCODE_JSON(data)
             params.append((event_id, payload_json))
 
         if not params:
@@ -201,65 +225,180 @@ def create_table_from_df(conn, table_name: str, df: pd.DataFrame, primary_keys:
         raise DBWriteError(f"Could not create table {table_name}: {e}") from e
 
 
+_SPACE2UNDERSCORE = str.maketrans({" ": "_"})
+
+
+@lru_cache(maxsize=128)
+def _clean_columns(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    SQL-safe column names: spaces -> underscores, lowercased.
+    Cached per raw column tuple so each frame shape is cleaned only once.
+    """
+    return tuple(c.translate(_SPACE2UNDERSCORE).lower() for c in columns)
+
+
+@lru_cache(maxsize=128)
+def _build_upsert_sql(table_name: str, columns: Tuple[str, ...], primary_keys: Tuple[str, ...]) -> str:
+    """
+    Build the INSERT ... ON DUPLICATE KEY UPDATE statement for a table shape.
+    Cached per (table, columns, primary keys) so repeat loads skip the string work.
+    """
+    columns_str = ", ".join(f"`{col}`" for col in columns)
+    placeholders_str = ", ".join(["%s"] * len(columns))
+
+    update_clause = ""
+    if primary_keys:
+        # ON DUPLICATE KEY UPDATE col1=VALUES(col1), ...
+        # If there are no non-PK columns there is nothing to update.
+        updates = [f"`{col}` = VALUES(`{col}`)" for col in columns if col not in primary_keys]
+        if updates:
+            update_clause = "ON DUPLICATE KEY UPDATE " + ", ".join(updates)
+
+    return f"""
+        INSERT INTO `{table_name}` ({columns_str})
+        VALUES ({placeholders_str})
+        {update_clause}
+    """
+
+
+def _escape_load_data(value):
+    """Double backslashes in text so LOAD DATA only treats the \\N NULL marker as special."""
+    return value.replace("\\", "\\\\") if isinstance(value, str) else value
+
+
+def _write_load_data_file(df: pd.DataFrame, fh) -> None:
+    """
+    Write a frame as LOAD DATA input: tab separated, NULLs as \\N, text fields
+    escaped with the default backslash and quoted when they contain tabs,
+    quotes or newlines. A literal "NULL" string stays a string.
+    """
+    # MySQL reads booleans as 0/1, not True/False
+    bool_cols = df.select_dtypes(include="bool").columns
+    if len(bool_cols):
+        df = df.astype({col: "int8" for col in bool_cols})
+
+    text_cols = df.select_dtypes(include=["object", "string"]).columns
+    if len(text_cols):
+        df = df.copy()
+        for col in text_cols:
+            df[col] = df[col].map(_escape_load_data)
+
+    df.to_csv(
+        fh, sep="\t", index=False, header=False, na_rep="\\N",
+        quoting=csv.QUOTE_MINIMAL, quotechar='"', lineterminator="\n"
+    )
+
+
+def _bulk_load_dataframe(conn, df: pd.DataFrame, table_name: str, primary_keys: List[str] = None) -> None:
+    """
+    Load a DataFrame with a single LOAD DATA LOCAL INFILE statement.
+
+    The frame is dumped to a temporary TSV file. Without primary keys it is
+    loaded straight into the target table; with primary keys it is loaded
+    into a temporary staging table and merged with one
+    INSERT ... SELECT ... ON DUPLICATE KEY UPDATE.
+    """
+    columns = tuple(df.columns)
+    columns_str = ", ".join(f"`{col}`" for col in columns)
+
+    tmp = tempfile.NamedTemporaryFile(
+        "w", suffix=".tsv", delete=False, encoding="utf-8", newline=""
+    )
+    try:
+        with tmp:
+            _write_load_data_file(df, tmp)
+
+        load_target = f"_stg_{table_name}" if primary_keys else table_name
+        load_sql = f"""
+            LOAD DATA LOCAL INFILE %s
+            INTO TABLE `{load_target}`
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY '\\t' OPTIONALLY ENCLOSED BY '"'
+            LINES TERMINATED BY '\\n'
+            ({columns_str})
+        """
+
+        with conn.cursor() as cur:
+            if primary_keys:
+                cur.execute(f"DROP TEMPORARY TABLE IF EXISTS `{load_target}`")
+                # No keys on staging: duplicate rows merge in file order (last wins), like INSERTs
+                cur.execute(f"CREATE TEMPORARY TABLE `{load_target}` SELECT {columns_str} FROM `{table_name}` LIMIT 0")
+
+            cur.execute(load_sql, (tmp.name.replace(os.sep, "/"),))
+
+            if primary_keys:
+                updates = [f"`{col}` = VALUES(`{col}`)" for col in columns if col not in primary_keys]
+                update_clause = (
+                    "ON DUPLICATE KEY UPDATE " + ", ".join(updates) if updates else ""
+                )
+                cur.execute(f"""
+                    INSERT INTO `{table_name}` ({columns_str})
+                    SELECT {columns_str} FROM `{load_target}`
+                    {update_clause}
+                """)
+                cur.execute(f"DROP TEMPORARY TABLE IF EXISTS `{load_target}`")
+        conn.commit()
+    finally:
+        try:
+            os.remove(tmp.name)
+        except OSError:
+            pass
+
+
 def upsert_dataframe(df: pd.DataFrame, table_name: str, primary_keys: List[str] = None, batch_size: int = 1000):
     """
     Insert or update rows from a DataFrame into the database.
     If the table does not exist, it is created.
+
+    Frames larger than one batch are bulk loaded via LOAD DATA LOCAL INFILE;
+    if the server rejects that (local_infile disabled), batched INSERTs are used.
     """
     if df.empty:
         logger.info(f"Empty dataframe provided for {table_name}, skipping.")
         return
 
     # Clean column names to ensure they work in SQL (simple sanitization)
-    df.columns = [c.replace(" ", "_").lower() for c in df.columns]
+    df.columns = _clean_columns(tuple(df.columns))
 
     # Convert NaN to None (NULL in SQL)
     df = df.replace({np.nan: None})
 
-    with get_connection() as conn:
+    # LOCAL INFILE is only enabled on connections that actually bulk load
+    bulk = len(df) > batch_size
+    with get_connection(allow_local_infile=bulk) as conn:
         create_table_from_df(conn, table_name, df, primary_keys)
+
+        if bulk:
+            try:
+                _bulk_load_dataframe(conn, df, table_name, primary_keys)
+                logger.info(f"Successfully bulk loaded {len(df)} rows into {table_name}.")
+                return
+            except MySQLError as e:
+                conn.rollback()
+                logger.warning(f"Bulk load into {table_name} failed ({e}), falling back to batched INSERTs")
         
-        columns = [f"`{col}`" for col in df.columns]
-        placeholders = ["%s"] * len(df.columns)
-        
-        columns_str = ", ".join(columns)
-        placeholders_str = ", ".join(placeholders)
-        
-        update_clause = ""
-        if primary_keys:
-            # ON DUPLICATE KEY UPDATE col1=VALUES(col1), ...
-            updates = []
-            for col in df.columns:
-                if col not in primary_keys:
-                    updates.append(f"`{col}` = VALUES(`{col}`)")
-            if updates:
-                update_clause = "ON DUPLICATE KEY UPDATE " + ", ".join(updates)
-            else:
-                # If only PKs and they match, do nothing (IGNORE behavior essentially in an INSERT context, but strict SQL)
-                # But to trigger 'upsert' semantics validly we often just update a PK to itself or similar no-op if no other columns?
-                # Actually if there are no non-PK columns, we can just IGNORE.
-                pass
-        
-        sql = f"""
-            INSERT INTO `{table_name}` ({columns_str})
-            VALUES ({placeholders_str})
-            {update_clause}
-        """
+        sql = _build_upsert_sql(table_name, tuple(df.columns), tuple(primary_keys or ()))
 
-        records = df.to_dict("records")
-        total = len(records)
+        # Plain tuples straight from the column blocks - no per-row dicts
+        rows_iter = df.itertuples(index=False, name=None)
+        total = len(df)
         
         try:
             with conn.cursor() as cur:
-                for i in range(0, total, batch_size):
-                    batch = records[i : i + batch_size]
-                    batch_values = [list(row.values()) for row in batch]
-                    cur.executemany(sql, batch_values)
-                    conn.commit()
-                    logger.info(f"Processed batch {i // batch_size + 1} for {table_name}")
-            
+                batch_no = 0
+                while True:
+                    batch = list(islice(rows_iter, batch_size))
+                    if not batch:
+                        break
+                    batch_no += 1
+                    cur.executemany(sql, batch)
+                    logger.info(f"Processed batch {batch_no} for {table_name}")
+
+            # Single commit for the whole frame (one durable flush, not one per batch)
+            conn.commit()
             logger.info(f"Successfully upserted {total} rows into {table_name}.")
         except MySQLError as e:
+            conn.rollback()
             logger.error(f"Failed to upsert dataframe into {table_name}: {e}")
             raise DBWriteError(f"Could not upsert dataframe into {table_name}: {e}") from e
 
@@ -1,13 +1,18 @@
 """
 Utilities for fetching raw data from GitHub efficiently.
 Uses retries and caching.
+
+Fetched CSVs are cached locally as Parquet (snappy) so cache hits skip
+CSV re-tokenisation entirely. Legacy CSV cache files are still read.
 """
 
 import os
+import posixpath
+from fnmatch import fnmatch
 import requests
 import pandas as pd
-from io import StringIO
-from typing import Optional
+from io import BytesIO
+from typing import Dict, Optional
 
 from Utils.logging_config import get_logger
 from Utils.http import safe_get
@@ -16,12 +21,115 @@ logger = get_logger("github_fetch")
 
 RAW_BASE_URL = "https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/master/data"
 CACHE_DIR = "Data/github_cache"
+CACHE_SUFFIX = ".parquet"
+
+# Known, stable column types for the FPL repo files (keyed by file-name pattern).
+# Only never-null columns are pinned; everything else is still inferred.
+# Text stays NumPy "object" (not the "string" extension dtype), which is
+# what _map_dtype_to_mysql_type and upsert_dataframe's NaN handling expect.
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "teams.csv": {
+        "id": "int64",
+        "name": "object",
+        "short_name": "object",
+    },
+    "players_raw.csv": {
+        "id": "int64",
+        "first_name": "object",
+        "second_name": "object",
+        "team": "int64",
+        "element_type": "int64",
+        "total_points": "int64",
+        "now_cost": "int64",
+    },
+    "merged_gw.csv": {
+        "name": "object",
+        "element": "int64",
+        "round": "int64",
+        "fixture": "int64",
+        "total_points": "int64",
+        "minutes": "int64",
+        "goals_scored": "int64",
+        "assists": "int64",
+        "value": "int64",
+    },
+    "gw*.csv": {
+        "name": "object",
+        "element": "int64",
+        "fixture": "int64",
+        "total_points": "int64",
+        "minutes": "int64",
+        "goals_scored": "int64",
+        "assists": "int64",
+        "value": "int64",
+    },
+}
+
+
+def _schema_for(path: str) -> Optional[Dict[str, str]]:
+    """Look up the dtype hint for a repo path by its file name."""
+    filename = posixpath.basename(path)
+    for pattern, schema in SCHEMAS.items():
+        if fnmatch(filename, pattern):
+            return schema
+    return None
+
+
+def _parse_csv(path: str, content: bytes, encoding: str, dtype: Optional[Dict[str, str]]) -> pd.DataFrame:
+    """
+    Parse CSV bytes with the Arrow reader, applying a dtype hint when given.
+    Falls back to full inference if the hint doesn't fit the file.
+    """
+    if dtype:
+        try:
+            return pd.read_csv(BytesIO(content), engine="pyarrow", encoding=encoding, dtype=dtype)
+        except Exception as e:
+            logger.warning(f"Schema hint did not match {path} ({e}), inferring types")
+
+    return pd.read_csv(BytesIO(content), engine="pyarrow", encoding=encoding)
+
+
+def _read_cache(path: str, cache_path: str, encoding: str) -> Optional[pd.DataFrame]:
+    """
+    Load a cached copy of `path`, preferring Parquet over legacy CSV.
+    Returns None on a miss or if the cache file is unreadable.
+    """
+    parquet_path = cache_path + CACHE_SUFFIX
+
+    if os.path.exists(parquet_path):
+        try:
+            df = pd.read_parquet(parquet_path, engine="pyarrow")
+            logger.info(f"Loaded from cache: {path}")
+            return df
+        except Exception:
+            logger.warning(f"Parquet cache corrupt for {path}, trying CSV cache...")
+
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_csv(cache_path, encoding=encoding)
+            logger.info(f"Loaded from legacy CSV cache: {path}")
+            return df
+        except Exception:
+            logger.warning(f"Cache corrupt for {path}, refetching...")
+
+    return None
+
+
+def _write_cache(path: str, cache_path: str, df: pd.DataFrame) -> None:
+    """Persist a fetched DataFrame as snappy-compressed Parquet."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        df.to_parquet(cache_path + CACHE_SUFFIX, engine="pyarrow", compression="snappy", index=False)
+    except Exception as e:
+        # Mixed-type object columns can't always be written; caching is best-effort
+        logger.warning(f"Could not cache {path} as Parquet: {e}")
 
 
 def fetch_csv_from_github(
     path: str,
     use_cache: bool = True,
-    encoding: str = "utf-8"
+    encoding: str = "utf-8",
+    dtype: Optional[Dict[str, str]] = None
 ) -> Optional[pd.DataFrame]:
     """
     Fetch a CSV file from the FPL GitHub repository.
@@ -30,6 +138,7 @@ def fetch_csv_from_github(
         path: Relative path from data/ directory (e.g., "2023-24/teams.csv")
         use_cache: Whether to use local cache if available
         encoding: File encoding
+        dtype: Column dtype hint; defaults to the SCHEMAS entry for the file, if any
         
     Returns:
         DataFrame or None if fetch fails
@@ -38,29 +147,23 @@ def fetch_csv_from_github(
     cache_path = os.path.join(CACHE_DIR, path.replace("/", os.sep))
     
     # Check cache first
-    if use_cache and os.path.exists(cache_path):
-        try:
-            df = pd.read_csv(cache_path, encoding=encoding)
-            logger.info(f"Loaded from cache: {path}")
+    if use_cache:
+        df = _read_cache(path, cache_path, encoding)
+        if df is not None:
             return df
-        except Exception:
-            logger.warning(f"Cache corrupt for {path}, refetching...")
     
     # Fetch from GitHub
     url = f"{RAW_BASE_URL}/{path}"
     try:
         logger.info(f"Fetching from GitHub: {url}")
         response = safe_get(url)
-        response.encoding = encoding
         
-        # Parse CSV
-        content = response.text
-        df = pd.read_csv(StringIO(content))
+        # Parse raw bytes directly (multi-threaded Arrow reader, no text decode round trip)
+        df = _parse_csv(path, response.content, encoding, dtype or _schema_for(path))
         
         # Save to cache
         if use_cache:
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            df.to_csv(cache_path, index=False)
+            _write_cache(path, cache_path, df)
         
         return df
         
@@ -10,6 +10,9 @@ from Utils.retry import retry_request
 
 DEFAULT_TIMEOUT = 20
 
+# One pooled session per process: keeps TCP/TLS connections warm across calls
+_SESSION = requests.Session()
+
 
 def _raw_get(url: str):
     """
@@ -22,7 +25,7 @@ def _raw_get(url: str):
       • raise hard errors for bad requests
     """
 
-    resp = requests.get(url, timeout=DEFAULT_TIMEOUT)
+    resp = _SESSION.get(url, timeout=DEFAULT_TIMEOUT)
 
     # Retryable / temporary server-side issues
     if resp.status_code in (429, 500, 502, 503, 504):
@@ -48,13 +51,15 @@ def safe_get(url: str, retries: int = 3, backoff: float = 2.0):
       • jitter
       • logs
       • retry only when appropriate
+
+    Always returns a response or raises - never None.
     """
 
     def op():
         return _raw_get(url)
 
     try:
-        return retry_request(
+        resp = retry_request(
             op,
             retries=retries,
             backoff=backoff,
@@ -66,3 +71,8 @@ def safe_get(url: str, retries: int = 3, backoff: float = 2.0):
 
     except requests.Timeout as e:
         raise FPLNetworkError(f"Timeout fetching {url}: {e}") from e
+
+    if resp is None:
+        raise FPLNetworkError(f"Exhausted retries fetching {url}")
+
+    return resp
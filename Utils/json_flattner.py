@@ -1,22 +1,36 @@
 import pandas as pd
 
 def flatten_json(obj, parent_key="", sep="."):
-    items = []
-
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            items.extend(flatten_json(v, new_key, sep=sep).items())
-
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            new_key = f"{parent_key}{sep}{i}"
-            items.extend(flatten_json(v, new_key, sep=sep).items())
-
-    else:
-        items.append((parent_key, obj))
-
-    return dict(items)
+    """
+    Flatten nested dicts/lists into a single-level dict with `sep`-joined keys.
+
+    Iterative (explicit stack) rather than recursive: no per-level dict
+    allocation or call overhead, and no recursion limit on deep payloads.
+    Keys come out in the same depth-first order as the nested input.
+    """
+    out = {}
+    stack = [(parent_key, obj)]
+
+    while stack:
+        key, value = stack.pop()
+
+        if isinstance(value, dict):
+            # Push in reverse so children are popped in their original order
+            stack.extend(
+                (f"{key}{sep}{k}" if key else k, v)
+                for k, v in reversed(value.items())
+            )
+
+        elif isinstance(value, list):
+            stack.extend(
+                (f"{key}{sep}{i}", value[i])
+                for i in range(len(value) - 1, -1, -1)
+            )
+
+        else:
+            out[key] = value
+
+    return out
 
 
 def json_to_dataframe(data):
@@ -1,13 +1,51 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 
 LOG_DIR = "logs"
 LOG_FILE = "logs/pipeline.log"
+LOG_MAX_BYTES = 50_000_000
+LOG_BACKUP_COUNT = 5
 
+# Loggers only enqueue records; one background listener owns the real
+# file/console handlers so disk I/O stays off the calling thread.
+_QUEUE = queue.SimpleQueue()
+_LISTENER = None
 
-def get_logger(name: str) -> logging.Logger:
-    os.makedirs(LOG_DIR, exist_ok=True)
 
+def _get_listener() -> logging.handlers.QueueListener:
+    global _LISTENER
+
+    if _LISTENER is None:
+        os.makedirs(LOG_DIR, exist_ok=True)
+
+        formatter = logging.Formatter(
+            "[%(asctime)s] %(levelname)s | %(name)s | %(message)s"
+        )
+
+        file_handler = logging.handlers.RotatingFileHandler(
+            LOG_FILE,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(formatter)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+
+        _LISTENER = logging.handlers.QueueListener(
+            _QUEUE, file_handler, console_handler, respect_handler_level=True
+        )
+        _LISTENER.start()
+        atexit.register(_LISTENER.stop)
+
+    return _LISTENER
+
+
+def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
 
     # Prevent duplicate handlers
@@ -16,17 +54,7 @@ def get_logger(name: str) -> logging.Logger:
 
     logger.setLevel(logging.INFO)
 
-    formatter = logging.Formatter(
-        "[%(asctime)s] %(levelname)s | %(name)s | %(message)s"
-    )
-
-    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-    file_handler.setFormatter(formatter)
-
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    _get_listener()
+    logger.addHandler(logging.handlers.QueueHandler(_QUEUE))
 
     return logger
@@ -2,16 +2,46 @@ import time
 import random
 from typing import Callable, Any
 
+import requests
+
+from Exceptions.fpl_exceptions import FPLServerError
 from Utils.logging_config import get_logger
 
 logger = get_logger("retry")
 
 
+try:
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    _SELENIUM_EXCEPTIONS = (TimeoutException, WebDriverException)
+except ImportError:  # API-only installs don't ship selenium
+    _SELENIUM_EXCEPTIONS = ()
+
+
+# Only transient failures are retried; anything else (KeyError, 4xx, bugs)
+# propagates immediately instead of sleeping through the backoff schedule.
 RETRYABLE_EXCEPTIONS = (
     ConnectionError,
     TimeoutError,
-    Exception,   # keep last to catch custom retry-triggered exceptions
-)
+    requests.ConnectionError,
+    requests.Timeout,
+    FPLServerError,
+) + _SELENIUM_EXCEPTIONS
+
+# raise_for_status() errors worth retrying: rate limiting and server errors
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Upper bound on a single backoff sleep (seconds)
+MAX_BACKOFF = 30.0
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for transient failures: network errors, timeouts, 429/5xx responses."""
+    if isinstance(exc, RETRYABLE_EXCEPTIONS):
+        return True
+    if isinstance(exc, requests.HTTPError):
+        response = exc.response
+        return response is not None and response.status_code in RETRYABLE_STATUS_CODES
+    return False
 
 
 def retry_request(
@@ -24,16 +54,19 @@ def retry_request(
     Wrap a callable with retries.
 
     Strategy:
-    - Exponential backoff: backoff^attempt (2, 4, 8 ...)
+    - Exponential backoff: backoff^attempt (2, 4, 8 ...), capped at MAX_BACKOFF
     - Jitter: randomization to avoid retry storms
-    - Retry only for retryable exceptions (HTTP layer decides what is retryable)
+    - Retry only transient failures (see is_retryable); anything else is raised at once
     """
 
     for attempt in range(1, retries + 1):
         try:
             return func()
 
-        except RETRYABLE_EXCEPTIONS as e:
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+
             logger.warning(f"Attempt {attempt} failed: {e}")
 
             if attempt == retries:
@@ -41,11 +74,11 @@ def retry_request(
                 raise
 
             # exponential backoff
-            sleep_time = backoff ** attempt
+            sleep_time = min(backoff ** attempt, MAX_BACKOFF)
 
             # jitter adds randomness so we don't hammer the server at once
             if jitter:
-                sleep_time += random.uniform(0, 1.0)
+                sleep_time += random.random()
 
             logger.info(f"Retrying in {sleep_time:.2f}s...")
             time.sleep(sleep_time)
@@ -1,6 +1,11 @@
 """
 State management for scraping operations.
 Extends the base state.py to handle player scraping state.
+
+Player progress lives in the `player_state` table of the shared SQLite
+state DB (see Utils.state_db); each update touches a single row.
+The table is read once per process into a write-through in-memory cache,
+with a sidecar set of incomplete player IDs for O(1) status gating.
 """
 print(">>> scraper_state LOADED FROM:", __file__)
 print(">>> AVAILABLE NAMES AT IMPORT:", dir())
@@ -10,22 +15,136 @@ import json
 from typing import Dict, List, Optional
 
 from Utils.logging_config import get_logger
+from Utils.state_db import STATE_LOCK, get_state_connection
 
 logger = get_logger("scraper_state")
 
+# Legacy JSON state, imported into the state DB on first use
 STATE_DIR = "state/scraper"
 PLAYER_STATE_FILE = os.path.join(STATE_DIR, "player_progress.json")
 
+_UPSERT_PLAYER_SQL = """
+    INSERT OR REPLACE INTO player_state
+        (player_id, name, status, last_season, completed_json, failure_reason)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Shared compact encoder for completed_json (avoids a new JSONEncoder per json.dumps call)
+_ENCODE_JSON = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+_legacy_checked = False
+
+# Write-through cache of the player_state table, loaded on first use
+_STATE_CACHE: Optional[Dict[str, Dict]] = None
+# player_ids whose status != "completed", maintained alongside _STATE_CACHE
+_INCOMPLETE: set = set()
+
+
+def _row_to_info(row) -> Dict:
+    """Convert a player_state row into the legacy state-dict shape."""
+    _, name, status, last_season, completed_json, failure_reason = row
+    info = {
+        "player_name": name,
+        "last_scraped_season": last_season,
+        "completed_seasons": json.loads(completed_json or "[]"),
+        "status": status,
+    }
+    if failure_reason is not None:
+        info["failure_reason"] = failure_reason
+    return info
+
+
+def _info_to_row(player_id: str, info: Dict) -> tuple:
+    return (
+        player_id,
+        info.get("player_name"),
+        info.get("status", "pending"),
+        info.get("last_scraped_season"),
+        _ENCODE_JSON(info.get("completed_seasons", [])),
+        info.get("failure_reason"),
+    )
+
+
+def _get_conn():
+    """Return the state connection, importing legacy JSON state once."""
+    global _legacy_checked
+    conn = get_state_connection()
+
+    if _legacy_checked:
+        return conn
+
+    with STATE_LOCK:
+        if not _legacy_checked:
+            _legacy_checked = True
+            empty = conn.execute("SELECT 1 FROM player_state LIMIT 1").fetchone() is None
+            if empty and os.path.exists(PLAYER_STATE_FILE):
+                try:
+                    with open(PLAYER_STATE_FILE, 'r', encoding='utf-8') as f:
+                        legacy = json.load(f)
+                    _write_state(conn, legacy)
+                    logger.info(f"Imported {len(legacy)} players from legacy {PLAYER_STATE_FILE}")
+                except Exception as e:
+                    logger.warning(f"Failed to import legacy player state: {e}")
+
+    return conn
+
+
+def _write_state(conn, state: Dict[str, Dict]):
+    """Replace the whole player_state table with `state` in one transaction."""
+    conn.execute("BEGIN")
+    try:
+        conn.execute("DELETE FROM player_state")
+        conn.executemany(
+            _UPSERT_PLAYER_SQL,
+            [_info_to_row(pid, info) for pid, info in state.items()]
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _copy_info(info: Dict) -> Dict:
+    """Copy a state dict so callers never share mutable state with the cache."""
+    return {**info, "completed_seasons": list(info.get("completed_seasons", []))}
+
+
+def _get_cache() -> Dict[str, Dict]:
+    """Return the in-memory state, loading it from the state DB once."""
+    global _STATE_CACHE
+
+    if _STATE_CACHE is None:
+        with STATE_LOCK:
+            if _STATE_CACHE is None:
+                rows = _get_conn().execute("SELECT * FROM player_state").fetchall()
+                cache = {row[0]: _row_to_info(row) for row in rows}
+                _INCOMPLETE.clear()
+                _INCOMPLETE.update(
+                    pid for pid, info in cache.items() if info.get("status") != "completed"
+                )
+                _STATE_CACHE = cache
 
-def _ensure_state_dir():
-    """Ensure state directory exists."""
-    os.makedirs(STATE_DIR, exist_ok=True)
+    return _STATE_CACHE
+
+
+def _put_player(player_id: str, info: Dict):
+    """
+    Write one player's state to the DB, then the in-memory cache/index.
+    `info` must be a fresh dict: if the DB write raises, the cache is untouched.
+    """
+    _get_conn().execute(_UPSERT_PLAYER_SQL, _info_to_row(player_id, info))
+    _get_cache()[player_id] = info
+
+    if info.get("status") == "completed":
+        _INCOMPLETE.discard(player_id)
+    else:
+        _INCOMPLETE.add(player_id)
 
 
 def load_player_state() -> Dict[str, Dict]:
     """
     Load the scraping state for all players.
-    
+
     Returns:
         Dict mapping player_id to state info:
         {
@@ -37,14 +156,8 @@ def load_player_state() -> Dict[str, Dict]:
             }
         }
     """
-    _ensure_state_dir()
-    
-    if not os.path.exists(PLAYER_STATE_FILE):
-        return {}
-    
     try:
-        with open(PLAYER_STATE_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return {pid: _copy_info(info) for pid, info in _get_cache().items()}
     except Exception as e:
         logger.warning(f"Failed to load player state: {e}. Starting fresh.")
         return {}
@@ -52,16 +165,19 @@ def load_player_state() -> Dict[str, Dict]:
 
 def save_player_state(state: Dict[str, Dict]):
     """
-    Persist the player scraping state.
-    
+    Persist the player scraping state, replacing what was stored:
+    players missing from `state` are removed.
+
     Args:
         state: Complete state dictionary to save
     """
-    _ensure_state_dir()
-    
+    global _STATE_CACHE
+
     try:
-        with open(PLAYER_STATE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+        with STATE_LOCK:
+            _write_state(_get_conn(), state)
+            # Rebuild the cache from the DB on next access
+            _STATE_CACHE = None
         logger.debug("Player state saved successfully")
     except Exception as e:
         logger.error(f"Failed to save player state: {e}")
@@ -75,85 +191,78 @@ def update_player_progress(
 ):
     """
     Update progress for a single player.
-    
+
     Args:
         player_id: Unique player identifier
         player_name: Player's name
         season: Season that was just completed (optional)
         status: Current status of the player scraping
     """
-    state = load_player_state()
-    
-    if player_id not in state:
-        state[player_id] = {
+    with STATE_LOCK:
+        cached = _get_cache().get(player_id)
+        info = _copy_info(cached) if cached else {
             "player_name": player_name,
             "last_scraped_season": None,
             "completed_seasons": [],
             "status": "pending"
         }
-    
-    # Update season info if provided
-    if season:
-        state[player_id]["last_scraped_season"] = season
-        if season not in state[player_id]["completed_seasons"]:
-            state[player_id]["completed_seasons"].append(season)
-    
-    # Update status
-    state[player_id]["status"] = status
-    
-    save_player_state(state)
+
+        # Update season info if provided
+        if season:
+            info["last_scraped_season"] = season
+            if season not in info["completed_seasons"]:
+                info["completed_seasons"].append(season)
+
+        # Update status
+        info["status"] = status
+
+        _put_player(player_id, info)
 
 
 def get_player_status(player_id: str) -> Optional[Dict]:
     """
     Get the current state for a specific player.
-    
+
     Args:
         player_id: Player identifier
-        
+
     Returns:
-        Player state dict or None if not found
+        Copy of the player state dict or None if not found
     """
-    state = load_player_state()
-    return state.get(player_id)
+    info = _get_cache().get(player_id)
+    return _copy_info(info) if info else None
 
 
 def get_incomplete_players() -> List[str]:
     """
     Get list of player IDs that haven't been fully scraped.
-    
+
     Returns:
         List of player_ids with status != "completed"
     """
-    state = load_player_state()
-    return [
-        pid for pid, info in state.items()
-        if info.get("status") != "completed"
-    ]
+    _get_cache()
+    return list(_INCOMPLETE)
 
 
 def mark_player_failed(player_id: str, player_name: str, reason: str):
     """
     Mark a player as failed with reason.
-    
+
     Args:
         player_id: Player identifier
         player_name: Player's name
         reason: Failure reason
     """
-    state = load_player_state()
-    
-    if player_id not in state:
-        state[player_id] = {
+    with STATE_LOCK:
+        cached = _get_cache().get(player_id)
+        info = _copy_info(cached) if cached else {
             "player_name": player_name,
             "last_scraped_season": None,
             "completed_seasons": [],
-            "status": "failed"
         }
-    else:
-        state[player_id]["status"] = "failed"
-    
-    state[player_id]["failure_reason"] = reason
-    
-    save_player_state(state)
-    logger.warning(f"Player {player_name} ({player_id}) marked as failed: {reason}")
\ No newline at end of file
+        info["status"] = "failed"
+        info["failure_reason"] = reason
+
+        _put_player(player_id, info)
+
+    logger.warning(f"Player {player_name} ({player_id}) marked as failed: {reason}")
@@ -1,13 +1,14 @@
 import os
 
+from Utils.state_db import get_value, set_value
+
+LAST_EVENT_KEY = "last_event"
+
+# Legacy flat-file state, read once if the state DB has no value yet
 STATE_FILE = "state/last_event.txt"
 
 
-def load_last_event() -> int:
-    """
-    Returns the last processed event id.
-    If the state file does not exist, return 0 meaning 'start fresh'.
-    """
+def _load_legacy_last_event() -> int:
     if not os.path.exists(STATE_FILE):
         return 0
 
@@ -19,11 +20,24 @@ def load_last_event() -> int:
         return 0
 
 
+def load_last_event() -> int:
+    """
+    Returns the last processed event id.
+    If no state has been recorded yet, return 0 meaning 'start fresh'.
+    """
+    value = get_value(LAST_EVENT_KEY)
+
+    if value is None:
+        return _load_legacy_last_event()
+
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
 def save_last_event(event_id: int):
     """
     Persist the most recently processed event.
     """
-    os.makedirs("state", exist_ok=True)
-
-    with open(STATE_FILE, "w") as f:
-        f.write(str(event_id))
+    set_value(LAST_EVENT_KEY, str(event_id))
@@ -0,0 +1,70 @@
+"""
+SQLite-backed state store shared by the pipeline and the scrapers.
+
+A single long-lived connection in WAL mode replaces the old flat files
+(state/last_event.txt, state/scraper/player_progress.json): point updates
+no longer rewrite the whole state, and concurrent readers don't block.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+STATE_DIR = "state"
+STATE_DB = os.path.join(STATE_DIR, "state.db")
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS kv (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    CREATE TABLE IF NOT EXISTS player_state (
+        player_id TEXT PRIMARY KEY,
+        name TEXT,
+        status TEXT,
+        last_season TEXT,
+        completed_json TEXT,
+        failure_reason TEXT
+    );
+"""
+
+_CONN: Optional[sqlite3.Connection] = None
+
+# Serialises read-modify-write sequences on the shared connection
+STATE_LOCK = threading.RLock()
+
+
+def get_state_connection() -> sqlite3.Connection:
+    """
+    Return the process-wide state connection, opening it on first use.
+    Autocommit mode (isolation_level=None); use BEGIN/COMMIT explicitly
+    for multi-statement updates.
+    """
+    global _CONN
+
+    with STATE_LOCK:
+        if _CONN is None:
+            os.makedirs(STATE_DIR, exist_ok=True)
+            conn = sqlite3.connect(STATE_DB, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            _CONN = conn
+
+    return _CONN
+
+
+def get_value(key: str) -> Optional[str]:
+    """Read a value from the key/value table, or None if unset."""
+    row = get_state_connection().execute(
+        "SELECT value FROM kv WHERE key = ?", (key,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def set_value(key: str, value: str):
+    """Insert or replace a value in the key/value table."""
+    get_state_connection().execute(
+        "INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)", (key, value)
+    )
@@ -4,85 +4,131 @@ Dashboard router - Anti-Gravity API layer.
 
 from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, Body
+from fastapi.concurrency import run_in_threadpool
+from fastapi_cache.decorator import cache
 
 from app.api.deps import get_current_user
+from app.core.cache import (
+    DASHBOARD_CACHE_EXPIRE, DASHBOARD_NAMESPACE, ResponseCoder, dashboard_key_builder
+)
+from app.core.responses import ORJSONResponse, model_response
 from app.api.dashboard.schemas import (
     SummaryStats, TrendsResponse, DistributionsResponse,
     TopPlayer, DashboardFilters, TeamSquadResponse,
-    StandingsResponse, PlayerTrendsResponse, GlobalSearchFilters
+    StandingsResponse, PlayerTrendsResponse, GlobalSearchFilters, DashboardBundle
 )
 from app.api.dashboard.service import (
     get_summary_stats, get_gameweek_trends, get_distributions,
     get_top_players, get_available_filters, get_team_squad,
-    get_league_standings, get_player_trends, get_global_players
+    get_league_standings, get_player_trends, get_global_players, get_dashboard_bundle,
+    sync_data_version
+)
+
+# sync_data_version picks up ETL runs from other processes before each request
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["Dashboard"],
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(sync_data_version)],
 )
 
-router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+# List endpoints document their schema via responses= instead of
+# response_model, and their services return plain dicts: rows come
+# straight from typed SQL, so per-item model validation is skipped.
+
+# Service functions use the blocking MySQL driver, so handlers run them in the
+# threadpool instead of on the event loop.
+
+# Shared-across-users, short-TTL cache for the read-only endpoints
+dashboard_cache = cache(
+    expire=DASHBOARD_CACHE_EXPIRE,
+    namespace=DASHBOARD_NAMESPACE,
+    coder=ResponseCoder,
+    key_builder=dashboard_key_builder,
+)
 
 @router.get("/summary", response_model=SummaryStats)
+@dashboard_cache
 async def dashboard_summary(
     team_id: Optional[int] = Query(None),
     season: str = Query("2024-25"),
     current_user: dict = Depends(get_current_user),
 ):
-    return get_summary_stats(team_id=team_id, season=season)
+    return model_response(await run_in_threadpool(get_summary_stats, team_id=team_id, season=season))
 
 @router.get("/trends", response_model=TrendsResponse)
+@dashboard_cache
 async def dashboard_trends(
     team_id: Optional[int] = Query(None),
     season: str = Query("2024-25"),
     current_user: dict = Depends(get_current_user),
 ):
-    return get_gameweek_trends(team_id=team_id, season=season)
+    return model_response(await run_in_threadpool(get_gameweek_trends, team_id=team_id, season=season))
 
 @router.get("/distributions", response_model=DistributionsResponse)
+@dashboard_cache
 async def dashboard_distributions(
     season: str = Query("2024-25"),
     current_user: dict = Depends(get_current_user),
 ):
-    return get_distributions(season=season)
+    return model_response(await run_in_threadpool(get_distributions, season=season))
 
-@router.get("/top-players", response_model=List[TopPlayer])
+@router.get("/top-players", responses={200: {"model": List[TopPlayer]}})
+@dashboard_cache
 async def dashboard_top_players(
     limit: int = Query(10),
     season: str = Query("2024-25"),
     current_user: dict = Depends(get_current_user),
 ):
-    return get_top_players(limit=limit, season=season)
+    return model_response(await run_in_threadpool(get_top_players, limit=limit, season=season))
+
+@router.get("/bundle", responses={200: {"model": DashboardBundle}})
+@dashboard_cache
+async def dashboard_bundle(
+    limit: int = Query(10),
+    season: str = Query("2024-25"),
+    current_user: dict = Depends(get_current_user),
+):
+    """Distributions, top players and filters for the landing page in one request."""
+    return model_response(await run_in_threadpool(get_dashboard_bundle, season=season, limit=limit))
 
-@router.post("/search/players", response_model=List[TopPlayer])
+@router.post("/search/players", responses={200: {"model": List[TopPlayer]}})
 async def search_players(
     filters: GlobalSearchFilters = Body(...),
     current_user: dict = Depends(get_current_user),
 ):
     """Global player discovery decoupled from team selection."""
-    return get_global_players(filters)
+    return model_response(await run_in_threadpool(get_global_players, filters))
 
 @router.get("/filters", response_model=DashboardFilters)
+@dashboard_cache
 async def dashboard_filters(
     current_user: dict = Depends(get_current_user),
 ):
-    return get_available_filters()
+    return model_response(await run_in_threadpool(get_available_filters))
 
 @router.get("/teams/{team_id}/squad", response_model=TeamSquadResponse)
+@dashboard_cache
 async def dashboard_team_squad(
     team_id: int,
     season: str = Query("2024-25"),
     current_user: dict = Depends(get_current_user),
 ):
-    return get_team_squad(team_id=team_id, season=season)
+    return model_response(await run_in_threadpool(get_team_squad, team_id=team_id, season=season))
 
 @router.get("/standings", response_model=StandingsResponse)
+@dashboard_cache
 async def dashboard_standings(
     season: str = Query("2024-25"),
     current_user: dict = Depends(get_current_user),
 ):
-    return get_league_standings(season=season)
+    return model_response(await run_in_threadpool(get_league_standings, season=season))
 
 @router.get("/players/{player_id}/trends", response_model=PlayerTrendsResponse)
+@dashboard_cache
 async def dashboard_player_trends(
     player_id: int,
     season: str = Query("2024-25"),
     current_user: dict = Depends(get_current_user),
 ):
-    return get_player_trends(player_id=player_id, season=season)
+    return model_response(await run_in_threadpool(get_player_trends, player_id=player_id, season=season))
@@ -2,12 +2,36 @@
 Pydantic schemas for dashboard endpoints.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 
-class SummaryStats(BaseModel):
+class DashboardModel(BaseModel):
+    """
+    Base for dashboard response models.
+    Responses are serialized straight to JSON bytes by Pydantic's core
+    serializer (see app.core.responses.model_response).
+
+    None-valued fields (e.g. Understat xG/xA for seasons without data) are
+    omitted from dumps rather than emitted as null.
+
+    Per-row models (trend points, squad members, standings entries) are
+    built with model_construct from already-typed SQL values, so only the
+    response envelope pays for validation.
+    """
+    model_config = ConfigDict(from_attributes=True, ser_json_inf_nan="constants")
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
+
+
+class SummaryStats(DashboardModel):
     """Key performance indicators for the dashboard."""
     total_players: int
     total_teams: int
@@ -19,7 +43,7 @@ class SummaryStats(BaseModel):
     avg_player_value: float
 
 
-class TrendDataPoint(BaseModel):
+class TrendDataPoint(DashboardModel):
     """Single data point for trend charts."""
     gameweek: int
     total_points: float
@@ -32,13 +56,13 @@ class TrendDataPoint(BaseModel):
     total_xA: Optional[float] = None
 
 
-class TrendsResponse(BaseModel):
+class TrendsResponse(DashboardModel):
     """Response for gameweek trends."""
     data: List[TrendDataPoint]
     seasons: List[str] = []
 
 
-class TeamDistribution(BaseModel):
+class TeamDistribution(DashboardModel):
     """Goals/points distribution by team."""
     team_name: str
     team_id: int
@@ -47,7 +71,7 @@ class TeamDistribution(BaseModel):
     player_count: int
 
 
-class PositionDistribution(BaseModel):
+class PositionDistribution(DashboardModel):
     """Player count and stats by position."""
     position: str
     position_id: int
@@ -56,13 +80,13 @@ class PositionDistribution(BaseModel):
     avg_points: float
 
 
-class DistributionsResponse(BaseModel):
+class DistributionsResponse(DashboardModel):
     """Response for distribution charts."""
     by_team: List[TeamDistribution]
     by_position: List[PositionDistribution]
 
 
-class TopPlayer(BaseModel):
+class TopPlayer(DashboardModel):
     """Top performing player data."""
     player_id: int
     player_name: str
@@ -74,7 +98,7 @@ class TopPlayer(BaseModel):
     xA: Optional[float] = None
 
 
-class DashboardFilters(BaseModel):
+class DashboardFilters(DashboardModel):
     """Available filters for dashboard queries."""
     seasons: List[str] = []
     teams: List[Dict[str, Any]] = []
@@ -83,7 +107,7 @@ class DashboardFilters(BaseModel):
 
 # --- Advanced Analytics Schemas ---
 
-class SquadMember(BaseModel):
+class SquadMember(DashboardModel):
     """Individual player summary for team view."""
     player_id: int
     name: str
@@ -104,14 +128,14 @@ class SquadMember(BaseModel):
     xA_per_90: Optional[float] = None
 
 
-class TeamSquadResponse(BaseModel):
+class TeamSquadResponse(DashboardModel):
     """Full squad details for a team."""
     team_name: str
     season: str
     players: List[SquadMember]
 
 
-class StandingEntry(BaseModel):
+class StandingEntry(DashboardModel):
     """League table entry."""
     rank: int
     team_name: str
@@ -131,13 +155,13 @@ class StandingEntry(BaseModel):
     xPts: Optional[float] = None
 
 
-class StandingsResponse(BaseModel):
+class StandingsResponse(DashboardModel):
     """League table response."""
     season: str
     standings: List[StandingEntry]
 
 
-class PlayerTrendPoint(BaseModel):
+class PlayerTrendPoint(DashboardModel):
     """GW breakdown for a single player."""
     gameweek: int
     points: int
@@ -153,7 +177,7 @@ class PlayerTrendPoint(BaseModel):
     xA: Optional[float] = None
 
 
-class PlayerTrendsResponse(BaseModel):
+class PlayerTrendsResponse(DashboardModel):
     """Historical performance for a player."""
     player_id: int
     player_name: str
@@ -162,6 +186,13 @@ class PlayerTrendsResponse(BaseModel):
     overall_form: float
 
 
+class DashboardBundle(DashboardModel):
+    """Landing-page payload: distributions, top players and filters in one response."""
+    distributions: DistributionsResponse
+    top_players: List[TopPlayer]
+    filters: DashboardFilters
+
+
 class GlobalSearchFilters(BaseModel):
     """Filters for global player lookup."""
     name: Optional[str] = None
@@ -172,3 +203,5 @@ class GlobalSearchFilters(BaseModel):
     min_minutes: Optional[int] = None
     sort_by: str = "total_points"  # total_points, form, xG, etc.
     order: str = "desc"
+    page: int = Field(1, ge=1)
+    page_size: int = Field(50, ge=1, le=100)
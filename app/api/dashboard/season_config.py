@@ -6,6 +6,10 @@ This module provides:
 2. Pre-configured schemas for all seasons (2016-17 to 2024-25)
 3. SQL builder helper functions for safe query construction
 
+SQL fragments never embed the season value itself: they use named
+placeholders (%(season)s, %(understat_year)s) bound from
+SeasonSchema.sql_params, so the statement text is identical across seasons.
+
 Design principles:
 - No unsafe dictionary access
 - Explicit capability flags (supports_teams, supports_understat, etc.)
@@ -13,8 +17,9 @@ Design principles:
 - Fact-first architecture (fpl_player_gameweeks as primary source)
 """
 
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 CURRENT_SEASON = "2024-25"
 
@@ -53,6 +58,57 @@ class SeasonSchema:
     supports_understat: bool        # Based on understat data availability
     supports_standings: bool        # Requires teams + fixtures
     supports_fixtures: bool         # Most seasons have fixtures
+    
+    # Pre-aggregated summary tables (built by Scripts/build_season_summaries.py)
+    table_mv_team_stats: str = "mv_season_team_stats"          # (season, team_id)
+    table_mv_gw_trends: str = "mv_season_gw_trends"            # (season, gameweek)
+    table_mv_position_stats: str = "mv_season_position_stats"  # (season, element_type)
+    table_mv_player_totals: str = "mv_season_player_totals"    # (season, player_id)
+    table_mv_season_meta: str = "mv_season_meta"                # (season) -> max_gw
+    
+    # Understat player linkage (built by Scripts/build_understat_player_map.py)
+    table_understat_map: str = "understat_player_map"
+    table_understat_roster: str = "understat_roster_metrics"
+    table_understat_matches: str = "understat_team_metrics"
+    
+    # Precompiled SQL fragments for the alias pairs the service layer uses.
+    # Filled in by __post_init__ so the templating runs once per schema.
+    sql_season_filter: str = field(init=False, repr=False, compare=False)
+    sql_season_filter_f: str = field(init=False, repr=False, compare=False)
+    sql_season_filter_p: str = field(init=False, repr=False, compare=False)
+    sql_season_filter_t: str = field(init=False, repr=False, compare=False)
+    sql_season_where: str = field(init=False, repr=False, compare=False)
+    sql_team_join_p_t: str = field(init=False, repr=False, compare=False)
+    sql_team_select_t: str = field(init=False, repr=False, compare=False)
+    sql_player_join_f_p: str = field(init=False, repr=False, compare=False)
+    sql_understat_join_p: str = field(init=False, repr=False, compare=False)
+    sql_understat_xg: str = field(init=False, repr=False, compare=False)
+    sql_understat_xa: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen dataclass: assign through object.__setattr__
+        team_join, team_select = build_team_join(self, "p", "t")
+        us_join, us_xg, us_xa = build_understat_join(self, "p", "us", "m")
+        fragments = {
+            "sql_season_filter": build_season_filter(self),
+            "sql_season_filter_f": build_season_filter(self, "f"),
+            "sql_season_filter_p": build_season_filter(self, "p"),
+            "sql_season_filter_t": build_season_filter(self, "t"),
+            "sql_season_where": build_season_where(self),
+            "sql_team_join_p_t": team_join,
+            "sql_team_select_t": team_select,
+            "sql_player_join_f_p": build_player_join(self, "f", "p"),
+            "sql_understat_join_p": us_join,
+            "sql_understat_xg": us_xg,
+            "sql_understat_xa": us_xa,
+        }
+        for name, sql in fragments.items():
+            object.__setattr__(self, name, sql)
+    
+    @property
+    def sql_params(self) -> Dict[str, Any]:
+        """Bind values for the named placeholders used in this schema's SQL fragments."""
+        return {"season": self.name, "understat_year": get_understat_season_year(self.name)}
 
 
 def get_season_schema(season: str) -> SeasonSchema:
@@ -61,86 +117,104 @@ def get_season_schema(season: str) -> SeasonSchema:
     
     Returns a fully-typed SeasonSchema object with all capability flags set.
     Never raises KeyError - always returns a valid schema.
+    
+    Known seasons are pre-built at import time (_SCHEMAS); anything else is
+    built on first use and memoized.
     """
+    schema = _SCHEMAS.get(season)
+    if schema is None:
+        schema = _build_season_schema(season)
+    return schema
+
+
+@lru_cache(maxsize=32)
+def _build_season_schema(season: str) -> SeasonSchema:
     is_historical = season != CURRENT_SEASON and season is not None
+    return _build_historical(season) if is_historical else _build_current(season)
+
+
+def _build_historical(season: str) -> SeasonSchema:
+    # Convert season format (e.g., "2019-20" -> 2019) for understat check
+    try:
+        understat_year = int(season.split("-")[0])
+    except (ValueError, AttributeError):
+        understat_year = 0
     
-    if is_historical:
-        # Convert season format (e.g., "2019-20" -> 2019) for understat check
-        try:
-            understat_year = int(season.split("-")[0])
-        except (ValueError, AttributeError):
-            understat_year = 0
-        
-        supports_teams = season in SEASONS_WITH_TEAMS
-        supports_understat = understat_year in UNDERSTAT_SEASONS
-        
-        return SeasonSchema(
-            name=season,
-            is_historical=True,
-            table_fact="fpl_player_gameweeks",
-            table_players="fpl_season_players",
-            table_teams="fpl_season_teams",
-            table_fixtures="fpl_fixtures",
-            col_player_id="element_id",           # In fact table
-            col_player_table_id="element_id",     # In player table (same for historical)
-            col_team_id="team_id",
-            col_gameweek="gameweek",
-            col_team_name="team_name",
-            supports_teams=supports_teams,
-            supports_understat=supports_understat,
-            supports_standings=supports_teams,  # Standings need teams
-            supports_fixtures=True
-        )
-    else:
-        # Current season uses live tables
-        # CRITICAL: players table uses 'id', fact table uses 'player_id'
-        return SeasonSchema(
-            name=season,
-            is_historical=False,
-            table_fact="fact_player_gameweeks",
-            table_players="players",
-            table_teams="teams",
-            table_fixtures="fixtures",
-            col_player_id="player_id",            # In fact table
-            col_player_table_id="id",             # In players table (PRIMARY KEY)
-            col_team_id="id",
-            col_gameweek="event",
-            col_team_name="name",
-            supports_teams=True,
-            supports_understat=True,
-            supports_standings=True,
-            supports_fixtures=True
-        )
+    supports_teams = season in SEASONS_WITH_TEAMS
+    supports_understat = understat_year in UNDERSTAT_SEASONS
+    
+    return SeasonSchema(
+        name=season,
+        is_historical=True,
+        table_fact="fpl_player_gameweeks",
+        table_players="fpl_season_players",
+        table_teams="fpl_season_teams",
+        table_fixtures="fpl_fixtures",
+        col_player_id="element_id",           # In fact table
+        col_player_table_id="element_id",     # In player table (same for historical)
+        col_team_id="team_id",
+        col_gameweek="gameweek",
+        col_team_name="team_name",
+        supports_teams=supports_teams,
+        supports_understat=supports_understat,
+        supports_standings=supports_teams,  # Standings need teams
+        supports_fixtures=True
+    )
+
+
+def _build_current(season: str) -> SeasonSchema:
+    # Current season uses live tables
+    # CRITICAL: players table uses 'id', fact table uses 'player_id'
+    return SeasonSchema(
+        name=season,
+        is_historical=False,
+        table_fact="fact_player_gameweeks",
+        table_players="players",
+        table_teams="teams",
+        table_fixtures="fixtures",
+        col_player_id="player_id",            # In fact table
+        col_player_table_id="id",             # In players table (PRIMARY KEY)
+        col_team_id="id",
+        col_gameweek="event",
+        col_team_name="name",
+        supports_teams=True,
+        supports_understat=True,
+        supports_standings=True,
+        supports_fixtures=True
+    )
 
 
+@lru_cache(maxsize=128)
 def build_season_filter(schema: SeasonSchema, table_alias: str = "") -> str:
     """
     Build a WHERE clause fragment for season filtering.
     
     Returns:
-        SQL fragment like "AND f.season = '2019-20'" or empty string for current season.
+        SQL fragment like "AND f.season = %(season)s" or empty string for current season.
     """
     if not schema.is_historical:
         return ""
     
     prefix = f"{table_alias}." if table_alias else ""
-    return f"AND {prefix}season = '{schema.name}'"
+    return f"AND {prefix}season = %(season)s"
 
 
+@lru_cache(maxsize=128)
 def build_season_where(schema: SeasonSchema, table_alias: str = "") -> str:
     """
     Build a standalone WHERE clause for season filtering.
     
     Returns:
-        SQL fragment like "WHERE season = '2019-20'" or "WHERE 1=1" for current season.
+        SQL fragment like "WHERE season = %(season)s" or "WHERE 1=1" for current season.
     """
     if not schema.is_historical:
         return "WHERE 1=1"
     
     prefix = f"{table_alias}." if table_alias else ""
-    return f"WHERE {prefix}season = '{schema.name}'"
+    return f"WHERE {prefix}season = %(season)s"
 
 
+@lru_cache(maxsize=128)
 def build_team_join(
     schema: SeasonSchema,
     player_alias: str = "p",
@@ -153,7 +227,7 @@ def build_team_join(
         Tuple of (join_clause, select_fragment) or ("", "") if teams not supported.
         
     Example:
-        join_clause: "LEFT JOIN fpl_season_teams t ON p.team_id = t.team_id AND t.season = '2019-20'"
+        join_clause: "LEFT JOIN fpl_season_teams t ON p.team_id = t.team_id AND t.season = %(season)s"
         select_fragment: "t.team_name"
     """
     if not schema.supports_teams:
@@ -163,7 +237,7 @@ def build_team_join(
         join = (
             f"LEFT JOIN {schema.table_teams} {team_alias} "
             f"ON {player_alias}.team_id = {team_alias}.{schema.col_team_id} "
-            f"AND {team_alias}.season = '{schema.name}'"
+            f"AND {team_alias}.season = %(season)s"
         )
         select = f"{team_alias}.{schema.col_team_name}"
     else:
@@ -176,6 +250,7 @@ def build_team_join(
     return (join, select)
 
 
+@lru_cache(maxsize=128)
 def build_player_join(
     schema: SeasonSchema,
     fact_alias: str = "f",
@@ -193,7 +268,7 @@ def build_player_join(
         return (
             f"JOIN {schema.table_players} {player_alias} "
             f"ON {fact_alias}.{schema.col_player_id} = {player_alias}.{schema.col_player_table_id} "
-            f"AND {player_alias}.season = '{schema.name}'"
+            f"AND {player_alias}.season = %(season)s"
         )
     else:
         # Current season: fact.player_id = players.id
@@ -203,7 +278,37 @@ def build_player_join(
         )
 
 
-    return (join, select)
+@lru_cache(maxsize=128)
+def build_understat_join(
+    schema: SeasonSchema,
+    player_alias: str = "p",
+    understat_alias: str = "us",
+    map_alias: str = "m"
+) -> Tuple[str, str, str]:
+    """
+    Build an ID-based Understat join via the understat_player_map table.
+    
+    Returns:
+        Tuple of (join_clause, xg_select, xa_select), or ("", "NULL", "NULL")
+        if the season has no Understat data.
+    
+    The roster table is per-match, so it is pre-aggregated to one row per
+    Understat player for the season before joining on integer IDs.
+    """
+    if not schema.supports_understat:
+        return ("", "NULL", "NULL")
+    
+    join = (
+        f"LEFT JOIN {schema.table_understat_map} {map_alias} "
+        f"ON {map_alias}.fpl_element_id = {player_alias}.{schema.col_player_table_id} "
+        f"AND {map_alias}.season = %(season)s "
+        f"LEFT JOIN ("
+        f"SELECT player_id, SUM(xg) AS xg, SUM(xa) AS xa "
+        f"FROM {schema.table_understat_roster} WHERE season = %(understat_year)s "
+        f"GROUP BY player_id"
+        f") {understat_alias} ON {understat_alias}.player_id = {map_alias}.understat_id"
+    )
+    return (join, f"{understat_alias}.xg", f"{understat_alias}.xa")
 
 
 def get_season_mode(season: str) -> str:
@@ -213,10 +318,60 @@ def get_season_mode(season: str) -> str:
     return "current" if season == CURRENT_SEASON else "historical"
 
 
-def build_standings_xg_query(season_year: int, col_home: str = "team_h", col_away: str = "team_a") -> str:
+@lru_cache(maxsize=32)
+def build_standings_query(schema: SeasonSchema) -> str:
+    """
+    Build a single GROUP BY query computing the league table from fixtures.
+    
+    Each finished fixture is unrolled into home and away rows by joining it
+    to a constant two-row side table, so the fixtures table is scanned once
+    (STRAIGHT_JOIN keeps it as the driving table), then all teams are
+    aggregated in one pass (no per-team queries).
+    """
+    fixture_where = f"WHERE fx.finished = 1 {build_season_filter(schema, 'fx')}"
+    if schema.supports_teams:
+        team_join = (
+            f"LEFT JOIN {schema.table_teams} t "
+            f"ON t.{schema.col_team_id} = r.team_id {schema.sql_season_filter_t}"
+        )
+        team_select = f"COALESCE(t.{schema.col_team_name}, CONCAT('Team ', r.team_id))"
+    else:
+        team_join = ""
+        team_select = "CONCAT('Team ', r.team_id)"
+    
+    return f"""
+        SELECT
+            {team_select} as team_name,
+            COUNT(*) as played,
+            SUM(CASE WHEN r.gf > r.ga THEN 1 ELSE 0 END) as wins,
+            SUM(CASE WHEN r.gf = r.ga THEN 1 ELSE 0 END) as draws,
+            SUM(CASE WHEN r.gf < r.ga THEN 1 ELSE 0 END) as losses,
+            SUM(r.gf) as goals_for,
+            SUM(r.ga) as goals_against,
+            SUM(r.gf) - SUM(r.ga) as goal_diff,
+            SUM(CASE WHEN r.gf > r.ga THEN 3 WHEN r.gf = r.ga THEN 1 ELSE 0 END) as points,
+            SUM(CASE WHEN r.ga = 0 THEN 1 ELSE 0 END) as clean_sheets
+        FROM (
+            SELECT
+                IF(side.away, fx.team_a, fx.team_h) as team_id,
+                IF(side.away, fx.team_a_score, fx.team_h_score) as gf,
+                IF(side.away, fx.team_h_score, fx.team_a_score) as ga
+            FROM {schema.table_fixtures} fx
+            STRAIGHT_JOIN (SELECT 0 as away UNION ALL SELECT 1) side
+            {fixture_where}
+        ) r
+        {team_join}
+        GROUP BY r.team_id, team_name
+        ORDER BY points DESC, goal_diff DESC, goals_for DESC
+    """
+
+
+def build_standings_xg_query(col_home: str = "team_h", col_away: str = "team_a") -> str:
     """
     Build query to fetch Team xG stats for standings with dynamic columns.
     Refactored to avoid 'Unknown column' error by aliasing in subquery.
+    
+    The Understat season is bound as %(understat_year)s (see SeasonSchema.sql_params).
     """
     return f"""
         SELECT 
@@ -232,7 +387,7 @@ def build_standings_xg_query(season_year: int, col_home: str = "team_h", col_awa
                 a_xg as xg_against, 
                 h_goals as goals_for, 
                 a_goals as goals_against 
-            FROM understat_team_metrics WHERE season = {season_year}
+            FROM understat_team_metrics WHERE season = %(understat_year)s
             UNION ALL
             SELECT 
                 {col_away} as team_name, 
@@ -240,17 +395,19 @@ def build_standings_xg_query(season_year: int, col_home: str = "team_h", col_awa
                 h_xg as xg_against, 
                 a_goals as goals_for, 
                 h_goals as goals_against 
-            FROM understat_team_metrics WHERE season = {season_year}
+            FROM understat_team_metrics WHERE season = %(understat_year)s
         ) all_matches
         GROUP BY team_name
     """
 
 
+@lru_cache(maxsize=32)
 def get_player_team_column(schema: SeasonSchema) -> str:
     """Get the column name for team reference in player table."""
     return "team_id" if schema.is_historical else "team"
 
 
+@lru_cache(maxsize=32)
 def get_understat_season_year(season: str) -> Optional[int]:
     """
     Convert FPL season format to Understat year format.
@@ -263,3 +420,7 @@ def get_understat_season_year(season: str) -> Optional[int]:
         return int(season.split("-")[0])
     except (ValueError, AttributeError, IndexError):
         return None
+
+
+# Pre-built schemas (with their precompiled SQL) for every known season
+_SCHEMAS = {season: _build_season_schema(season) for season in SEASONS_WITH_TEAMS | {CURRENT_SEASON}}
@@ -8,321 +8,669 @@ This service uses pre-processed clean tables as the source of truth:
 Refactored to eliminate complex FPL↔Understat SQL joins.
 """
 
+import threading
+import time
 import unicodedata
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Union, Callable
+
+import numpy as np
+
+from app.core.cache import get_data_version
 from app.db.session import execute_query
 from app.api.dashboard.schemas import (
     SummaryStats, TrendDataPoint, TrendsResponse,
     TeamDistribution, PositionDistribution, DistributionsResponse,
-    TopPlayer, DashboardFilters, SquadMember, TeamSquadResponse,
+    DashboardFilters, SquadMember, TeamSquadResponse,
     StandingEntry, StandingsResponse, PlayerTrendPoint, PlayerTrendsResponse,
     GlobalSearchFilters
 )
 from app.api.dashboard.season_config import (
-    SeasonSchema, get_season_schema, build_season_filter, build_season_where,
-    build_team_join, build_player_join, build_standings_xg_query, 
-    get_understat_season_year, get_player_team_column, CURRENT_SEASON
+    SeasonSchema, get_season_schema, build_standings_query,
+    get_player_team_column, CURRENT_SEASON
 )
 from Utils.logging_config import get_logger
 
 logger = get_logger("dashboard_service")
 
+# Position mapping (element_type is mapped in Python, not with SQL CASE)
+POSITION_MAP = {1: 'GKP', 2: 'DEF', 3: 'MID', 4: 'FWD'}
+POSITION_REVERSE = {'GKP': 1, 'DEF': 2, 'MID': 3, 'FWD': 4}
+
+
+# Letters NFKD doesn't decompose to an ASCII base (it would drop them)
+_ACCENT_EXTRAS = {
+    'Æ': 'AE', 'æ': 'ae', 'Ð': 'D', 'ð': 'd', 'Ø': 'O', 'ø': 'o', 'Þ': 'TH', 'þ': 'th',
+    'ß': 'ss', 'Đ': 'D', 'đ': 'd', 'Ħ': 'H', 'ħ': 'h', 'ı': 'i', 'Ł': 'L', 'ł': 'l',
+    'Œ': 'OE', 'œ': 'oe',
+}
+
+
+def _build_accent_table() -> Dict[int, str]:
+    """Translation table for Latin-1 Supplement + Latin Extended-A letters to ASCII."""
+    table = {}
+    for code in range(0x00C0, 0x0180):
+        ch = chr(code)
+        ascii_form = unicodedata.normalize('NFKD', ch).encode('ASCII', 'ignore').decode('ascii')
+        table[code] = _ACCENT_EXTRAS.get(ch, ascii_form)
+    return table
+
 
+_ACCENT_TABLE = _build_accent_table()
+
+
+@lru_cache(maxsize=8192)
 def normalize_name(name: str) -> str:
     """Normalize player name for fuzzy matching (remove accents, lowercase)."""
     if not name:
         return ""
-    n = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('utf-8')
+    if name.isascii():
+        # Most names have no accents: nothing to decompose or strip
+        return name.lower().strip()
+    n = name.translate(_ACCENT_TABLE)
+    if not n.isascii():
+        # Outside the Latin tables (e.g. combining marks): full decomposition
+        n = unicodedata.normalize('NFKD', n).encode('ASCII', 'ignore').decode('utf-8')
     return n.lower().strip()
 
 
+# Filter lists and max gameweeks only change when the ETL runs; a closed
+# season's last gameweek never changes, so it is cached without expiry
+FILTERS_CACHE_TTL = 3600  # seconds
+MAX_GW_CACHE_TTL = 300  # seconds (current season)
 
+SUMMARY_RETRY_TTL = 300  # seconds before re-probing a missing summary table
+SCHEMA_PROBE_RETRY_TTL = 300  # seconds before re-probing a missing optional table/column/index
+DATA_VERSION_CHECK_TTL = 60  # seconds between reads of the shared ETL data version
 
+# Global search pages (current and prefetched next page), LRU-bounded
+SEARCH_PAGE_CACHE_TTL = 300  # seconds
+SEARCH_PAGE_CACHE_SIZE = 256
 
+_filters_cache: Dict[str, Any] = {"value": None, "expires": 0.0}
+_max_gw_cache: Dict[str, Tuple[int, float]] = {}
+_summary_unavailable: Dict[str, float] = {}
+_schema_found: set = set()
+_schema_missing: Dict[Tuple, float] = {}
+_data_version: Dict[str, Any] = {"value": None, "checked": 0.0}
+_search_pages: "OrderedDict[Tuple, Tuple[List[Dict[str, Any]], float]]" = OrderedDict()
+_search_pages_lock = threading.Lock()
 
-def _resolve_team_player_ids(schema: SeasonSchema, team_id: int) -> List[int]:
-    """Resolve player IDs for a given team using FPL schema."""
-    team_col = get_player_team_column(schema)
-    season_filter = build_season_filter(schema)
-    
-    query = f"""
-        SELECT {schema.col_player_table_id} as pid 
-        FROM {schema.table_players} 
-        WHERE {team_col} = %s {season_filter}
+
+def invalidate_filters_cache():
     """
-    
-    try:
-        results = execute_query(query, (team_id,))
-        return [r["pid"] for r in results]
-    except Exception as e:
-        logger.error(f"Team PID resolution failed ({schema.name}, team={team_id}): {e}")
-        return []
+    Drop cached filter lists, max gameweeks, search pages, schema probes and
+    the query text built from them (call after ETL completes).
+    """
+    _filters_cache["value"] = None
+    _filters_cache["expires"] = 0.0
+    _max_gw_cache.clear()
+    _summary_unavailable.clear()
+    with _search_pages_lock:
+        _search_pages.clear()
+    _schema_found.clear()
+    _schema_missing.clear()
+    _QUERY_CACHE.clear()
+
+
+def sync_data_version():
+    """
+    Drop this process's caches when an ETL run has bumped the shared data
+    version (see app.core.cache). Reads it at most once per
+    DATA_VERSION_CHECK_TTL; without Redis, the cache TTLs apply alone.
+    """
+    now = time.monotonic()
+    if _data_version["checked"] > now:
+        return
+    _data_version["checked"] = now + DATA_VERSION_CHECK_TTL
+
+    version = get_data_version()
+    if version is None:
+        return
+    if _data_version["value"] is not None and version != _data_version["value"]:
+        logger.info(f"Dashboard data version changed to {version}, dropping cached lookups")
+        invalidate_filters_cache()
+    _data_version["value"] = version
+
+
+def _schema_probe(key: Tuple, query: str, params: tuple) -> bool:
+    """
+    Probe for an optional table/column/index built by the ETL scripts.
+
+    Found objects are cached for the life of the process; missing ones are
+    re-probed after SCHEMA_PROBE_RETRY_TTL, so a running app picks up a
+    later ETL run. When an object appears, the query text built without it
+    is dropped. DB errors propagate and are never cached.
+    """
+    if key in _schema_found:
+        return True
+    if _schema_missing.get(key, 0.0) > time.monotonic():
+        return False
+
+    result = execute_query(query, params)
+    if result and result[0]["cnt"]:
+        _schema_found.add(key)
+        if _schema_missing.pop(key, None) is not None:
+            _QUERY_CACHE.clear()
+        return True
+
+    _schema_missing[key] = time.monotonic() + SCHEMA_PROBE_RETRY_TTL
+    return False
+
+
+def _table_exists(table: str) -> bool:
+    """Whether an optional table has been built."""
+    return _schema_probe(
+        ("table", table),
+        "SELECT COUNT(*) as cnt FROM information_schema.tables "
+        "WHERE table_schema = DATABASE() AND table_name = %s",
+        (table,)
+    )
+
+
+def _column_exists(table: str, column: str) -> bool:
+    """Whether an optional column has been added."""
+    return _schema_probe(
+        ("column", table, column),
+        "SELECT COUNT(*) as cnt FROM information_schema.columns "
+        "WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s",
+        (table, column)
+    )
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (MySQL's default escape is backslash)."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _index_exists(table: str, index_name: str) -> bool:
+    """Whether an optional index has been created."""
+    return _schema_probe(
+        ("index", table, index_name),
+        "SELECT COUNT(*) as cnt FROM information_schema.statistics "
+        "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s",
+        (table, index_name)
+    )
+
+
+# ngram FULLTEXT indexes on full_name (Scripts/create_dashboard_indexes.py)
+_NAME_FULLTEXT_INDEXES = {
+    "fpl_season_players": "ftx_fsp_full_name",
+    "players": "ftx_players_full_name",
+}
+# Characters with a meaning in BOOLEAN MODE queries
+_FULLTEXT_OPERATORS = str.maketrans("", "", '"+-<>()~*@')
+
+
+def _player_name(schema: SeasonSchema, alias: str = "p") -> str:
+    """
+    Player display name: the stored full_name column (Scripts/create_dashboard_indexes.py)
+    when present, otherwise CONCAT of the name parts.
+    """
+    prefix = f"{alias}." if alias else ""
+    if _column_exists(schema.table_players, "full_name"):
+        return f"{prefix}full_name"
+    return f"CONCAT({prefix}first_name, ' ', {prefix}second_name)"
+
+
+# Fully rendered query text per (query, season[, variant]). Fragments depend
+# only on the schema and on optional tables probed once per process, so the
+# f-string is built on the first call and only parameters vary afterwards.
+_QUERY_CACHE: Dict[Tuple, str] = {}
+
+
+def _cached_query(key: Tuple, build: Callable[[], str]) -> str:
+    query = _QUERY_CACHE.get(key)
+    if query is None:
+        query = _QUERY_CACHE[key] = build()
+    return query
+
+
+def _understat_join(schema: SeasonSchema) -> Tuple[str, str, str]:
+    """ID-based Understat join on player alias p, or no-op selects until understat_player_map is built."""
+    if not _table_exists(schema.table_understat_map):
+        return ("", "NULL", "NULL")
+    return (schema.sql_understat_join_p, schema.sql_understat_xg, schema.sql_understat_xa)
+
+
+# Shared pool for issuing independent queries of one request in parallel
+# (each execute_query call opens its own connection)
+_QUERY_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dashboard-query")
+
+
+def _run_concurrently(*calls: Tuple) -> List[Any]:
+    """Run (func, *args) calls on the query pool and return their results in order."""
+    futures = [_QUERY_POOL.submit(func, *args) for func, *args in calls]
+    return [f.result() for f in futures]
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+def _top_player_dict(
+    player_id, player_name, team_name, total_points, total_goals, total_assists, xg, xa
+) -> Dict[str, Any]:
+    """
+    Plain-dict TopPlayer row for the list endpoints, skipping per-item model
+    validation. Like the models, None-valued xG/xA are left out.
+    """
+    row = {
+        "player_id": int(player_id),
+        "player_name": player_name,
+        "team_name": team_name or "Unknown",
+        "total_points": int(total_points or 0),
+        "total_goals": int(total_goals or 0),
+        "total_assists": int(total_assists or 0),
+    }
+    if xg is not None:
+        row["xG"] = round(float(xg), 2)
+    if xa is not None:
+        row["xA"] = round(float(xa), 2)
+    return row
 
 
 def _get_max_gameweek(schema: SeasonSchema) -> int:
-    """Get the maximum gameweek for a season."""
-    season_where = build_season_where(schema)
-    query = f"SELECT MAX({schema.col_gameweek}) as max_gw FROM {schema.table_fact} {season_where}"
-    try:
-        result = execute_query(query)
-        return result[0]["max_gw"] or 38 if result else 38
-    except Exception:
-        return 38
+    """Get the maximum gameweek for a season (current season cached for MAX_GW_CACHE_TTL)."""
+    cached = _max_gw_cache.get(schema.name)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    
+    # Primary-key lookup in the summary meta table, else MAX() over the fact table
+    meta = _fetch_summary_rows(
+        schema.table_mv_season_meta,
+        f"SELECT max_gw FROM {schema.table_mv_season_meta} WHERE season = %s",
+        (schema.name,)
+    )
+    if meta:
+        max_gw = meta[0]["max_gw"] or 38
+    else:
+        season_where = schema.sql_season_where
+        query = f"SELECT MAX({schema.col_gameweek}) as max_gw FROM {schema.table_fact} {season_where}"
+        try:
+            result = execute_query(query, schema.sql_params)
+            max_gw = result[0]["max_gw"] or 38 if result else 38
+        except Exception:
+            return 38
+    
+    expires = float("inf") if schema.is_historical else time.monotonic() + MAX_GW_CACHE_TTL
+    _max_gw_cache[schema.name] = (max_gw, expires)
+    return max_gw
 
 
+def _fetch_summary_rows(table: str, query: str, params: Union[tuple, dict]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Read from a pre-aggregated mv_season_* table (Scripts/build_season_summaries.py).
+    Returns None if the table is missing or has no rows for the season, so
+    callers fall back to live aggregation.
+    
+    A failed read marks the table unavailable for SUMMARY_RETRY_TTL, so
+    requests go straight to the live query instead of paying for an
+    erroring round trip first.
+    """
+    if _summary_unavailable.get(table, 0.0) > time.monotonic():
+        return None
+    try:
+        rows = execute_query(query, params)
+    except Exception as e:
+        logger.warning(f"Summary table {table} unavailable, using live aggregation: {e}")
+        _summary_unavailable[table] = time.monotonic() + SUMMARY_RETRY_TTL
+        return None
+    return rows or None
 
 
+def _empty_summary() -> SummaryStats:
+    return SummaryStats(
+        total_players=0, total_teams=0, total_fixtures=0, total_gameweeks=0,
+        avg_points_per_player=0, total_goals=0, total_assists=0, avg_player_value=0
+    )
 
 
 def get_summary_stats(team_id: Optional[int] = None, season: str = CURRENT_SEASON) -> SummaryStats:
-    """Fact-first summary stats (FPL Only)."""
+    """Fact-first summary stats (FPL Only), one round trip per path."""
     schema = get_season_schema(season)
+    params = {**schema.sql_params, "team_id": team_id}
+    max_gw_select = f"(SELECT MAX({schema.col_gameweek}) FROM {schema.table_fact} {schema.sql_season_where})"
     
     try:
-        player_ids = _resolve_team_player_ids(schema, team_id) if team_id else None
-        
-        # Player Count & Value
+        # Fast path: pre-aggregated per-team totals
+        mv_query = _cached_query(("summary_mv", schema.name, bool(team_id)), lambda: f"""
+            SELECT SUM(player_count) as count, SUM(total_now_cost) as cost,
+                   SUM(total_points) as pts, SUM(total_goals) as g, SUM(total_assists) as a,
+                   {max_gw_select} as max_gw
+            FROM {schema.table_mv_team_stats}
+            WHERE season = %(season)s {"AND team_id = %(team_id)s" if team_id else ""}
+        """)
+        mv = _fetch_summary_rows(schema.table_mv_team_stats, mv_query, params)
+        if mv and mv[0]["count"]:
+            row = mv[0]
+            total_players = int(row["count"])
+            return SummaryStats(
+                total_players=total_players,
+                total_teams=20,
+                total_fixtures=380,
+                total_gameweeks=row["max_gw"] or 38,
+                avg_points_per_player=round(float(row["pts"] or 0) / max(total_players, 1), 2),
+                total_goals=int(row["g"] or 0),
+                total_assists=int(row["a"] or 0),
+                avg_player_value=round(float(row["cost"] or 0) / total_players / 10, 1)
+            )
+
+        # Live path: player count/value, performance totals and max gameweek together
         team_col = get_player_team_column(schema)
-        p_conditions = []
-        if schema.is_historical:
-            p_conditions.append(f"season = '{schema.name}'")
-        if team_id:
-            p_conditions.append(f"{team_col} = {team_id}")
-        
-        p_where = "WHERE " + " AND ".join(p_conditions) if p_conditions else ""
-        p_query = f"SELECT COUNT(*) as count, AVG(now_cost) as avg_val FROM {schema.table_players} {p_where}"
-        p_result = execute_query(p_query)
-        
-        # Performance Facts
-        f_conditions = []
-        if schema.is_historical:
-            f_conditions.append(f"season = '{schema.name}'")
-        if player_ids is not None:
-            if not player_ids:
-                return SummaryStats(0, 20, 380, 38, 0, 0, 0, 0)
-            f_conditions.append(f"{schema.col_player_id} IN ({','.join(map(str, player_ids))})")
+        p_team = f"AND p.{team_col} = %(team_id)s" if team_id else ""
+        f_team = f"""
+            AND f.{schema.col_player_id} IN (
+                SELECT {schema.col_player_table_id} FROM {schema.table_players}
+                WHERE {team_col} = %(team_id)s {schema.sql_season_filter}
+            )
+        """ if team_id else ""
         
-        f_where = "WHERE " + " AND ".join(f_conditions) if f_conditions else ""
-        f_query = f"SELECT SUM(total_points) as pts, SUM(goals_scored) as g, SUM(assists) as a FROM {schema.table_fact} {f_where}"
-        f_result = execute_query(f_query)
+        query = _cached_query(("summary", schema.name, bool(team_id)), lambda: f"""
+            SELECT pl.count, pl.avg_val, fs.pts, fs.g, fs.a, {max_gw_select} as max_gw
+            FROM (
+                SELECT COUNT(*) as count, AVG(p.now_cost) as avg_val
+                FROM {schema.table_players} p
+                WHERE 1=1 {schema.sql_season_filter_p} {p_team}
+            ) pl
+            CROSS JOIN (
+                SELECT SUM(f.total_points) as pts, SUM(f.goals_scored) as g, SUM(f.assists) as a
+                FROM {schema.table_fact} f
+                WHERE 1=1 {schema.sql_season_filter_f} {f_team}
+            ) fs
+        """)
+        rows = execute_query(query, params)
+        if not rows:
+            return _empty_summary()
         
-        total_players = p_result[0]["count"] if p_result else 0
-        total_points = f_result[0]["pts"] or 0 if f_result else 0
+        row = rows[0]
+        total_players = row["count"] or 0
+        total_points = row["pts"] or 0
         
         return SummaryStats(
             total_players=total_players,
             total_teams=20,
             total_fixtures=380,
-            total_gameweeks=_get_max_gameweek(schema),
+            total_gameweeks=row["max_gw"] or 38,
             avg_points_per_player=round(total_points / max(total_players, 1), 2),
-            total_goals=int(f_result[0]["g"] or 0) if f_result else 0,
-            total_assists=int(f_result[0]["a"] or 0) if f_result else 0,
-            avg_player_value=round((p_result[0]["avg_val"] or 0) / 10, 1) if p_result else 0
+            total_goals=int(row["g"] or 0),
+            total_assists=int(row["a"] or 0),
+            avg_player_value=round((row["avg_val"] or 0) / 10, 1)
         )
     except Exception as e:
         logger.error(f"Summary error: {e}")
-        return SummaryStats(0, 0, 0, 0, 0, 0, 0, 0)
+        return _empty_summary()
+
+
+def _gap_fill_trends(rows: List[Dict[str, Any]]) -> List[TrendDataPoint]:
+    """Expand gameweek-sorted aggregate rows to GW 1..last, zero-filling missing gameweeks."""
+    by_gw = {r["gameweek"]: r for r in rows if r["gameweek"] is not None}
+    data = []
+    for gw in range(1, max(by_gw, default=0) + 1):
+        r = by_gw.get(gw)
+        data.append(TrendDataPoint.model_construct(
+            gameweek=gw,
+            total_points=float(r["total_points"] or 0) if r else 0.0,
+            total_goals=int(r["total_goals"] or 0) if r else 0,
+            total_assists=int(r["total_assists"] or 0) if r else 0,
+            avg_minutes=float(r["avg_minutes"] or 0) if r else 0.0
+        ))
+    return data
 
 
 def get_gameweek_trends(team_id: Optional[int] = None, season: str = CURRENT_SEASON) -> TrendsResponse:
     """Gap-free trends (FPL Only)."""
     schema = get_season_schema(season)
-    max_gw = _get_max_gameweek(schema)
     
-    player_ids = _resolve_team_player_ids(schema, team_id) if team_id else None
-    
-    conditions = []
-    if schema.is_historical:
-        conditions.append(f"season = '{schema.name}'")
-    if player_ids is not None:
-        if not player_ids:
-            return TrendsResponse(data=[])
-        conditions.append(f"{schema.col_player_id} IN ({','.join(map(str, player_ids))})")
+    # Fast path: pre-aggregated league-wide trends, gap-filled up to the last gameweek
+    if not team_id:
+        mv = _fetch_summary_rows(
+            schema.table_mv_gw_trends,
+            f"""
+                SELECT gameweek, total_points, total_goals, total_assists, avg_minutes
+                FROM {schema.table_mv_gw_trends}
+                WHERE season = %s
+            """,
+            (schema.name,)
+        )
+        if mv:
+            return TrendsResponse(data=_gap_fill_trends(mv))
     
-    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+    team_filter = ""
+    if team_id:
+        team_filter = f"""
+            AND {schema.col_player_id} IN (
+                SELECT {schema.col_player_table_id} FROM {schema.table_players}
+                WHERE {get_player_team_column(schema)} = %(team_id)s {schema.sql_season_filter}
+            )
+        """
     
-    query = f"""
-        WITH RECURSIVE gw_axis AS (
-            SELECT 1 as gw
-            UNION ALL
-            SELECT gw + 1 FROM gw_axis WHERE gw < {max_gw}
-        ),
-        TrendFacts AS (
-            SELECT 
-                {schema.col_gameweek} as gw,
-                SUM(total_points) as pts,
-                SUM(goals_scored) as g,
-                SUM(assists) as a,
-                AVG(minutes) as m
-            FROM {schema.table_fact}
-            {where_clause}
-            GROUP BY {schema.col_gameweek}
-        )
+    # Plain GROUP BY on the (season, gameweek) index prefix: rows arrive
+    # already ordered by gameweek, so MySQL can stream the aggregate
+    query = _cached_query(("trends", schema.name, bool(team_id)), lambda: f"""
         SELECT 
-            ax.gw as gameweek,
-            COALESCE(tf.pts, 0) as total_points,
-            COALESCE(tf.g, 0) as total_goals,
-            COALESCE(tf.a, 0) as total_assists,
-            COALESCE(tf.m, 0) as avg_minutes
-        FROM gw_axis ax
-        LEFT JOIN TrendFacts tf ON ax.gw = tf.gw
-        ORDER BY ax.gw
-    """
+            {schema.col_gameweek} as gameweek,
+            SUM(total_points) as total_points,
+            SUM(goals_scored) as total_goals,
+            SUM(assists) as total_assists,
+            AVG(minutes) as avg_minutes
+        FROM {schema.table_fact}
+        {schema.sql_season_where} {team_filter}
+        GROUP BY {schema.col_gameweek}
+        ORDER BY {schema.col_gameweek}
+    """)
     
     try:
-        results = execute_query(query)
-        return TrendsResponse(data=[TrendDataPoint(**row) for row in results])
+        results = execute_query(query, {**schema.sql_params, "team_id": team_id})
+        if not results:
+            return TrendsResponse(data=[])
+        return TrendsResponse(data=_gap_fill_trends(results))
     except Exception as e:
         logger.error(f"Trends error: {e}")
         return TrendsResponse(data=[])
 
 
-def get_top_players(limit: int = 10, season: str = CURRENT_SEASON) -> List[TopPlayer]:
-    """Top players (FPL Only)."""
+def get_top_players(limit: int = 10, season: str = CURRENT_SEASON) -> List[Dict[str, Any]]:
+    """
+    Top players (FPL Only).
+    
+    Reads the pre-aggregated per-player totals when available: the
+    (season, total_points) index turns the top-N into a short range scan
+    instead of aggregating the whole fact table before the LIMIT.
+    """
     schema = get_season_schema(season)
+    params = {**schema.sql_params, "limit": limit}
+    
+    mv = _fetch_summary_rows(
+        schema.table_mv_player_totals,
+        f"""
+            SELECT player_id, player_name, team_name,
+                   total_points, total_goals, total_assists, xg as xG, xa as xA
+            FROM {schema.table_mv_player_totals}
+            WHERE season = %(season)s
+            ORDER BY total_points DESC
+            LIMIT %(limit)s
+        """,
+        params
+    )
+    if mv:
+        return [
+            _top_player_dict(
+                r["player_id"], r["player_name"], r["team_name"],
+                r["total_points"], r["total_goals"], r["total_assists"], r["xG"], r["xA"]
+            )
+            for r in mv
+        ]
     
-    join_clause, select_frag = build_team_join(schema, "p", "t")
+    join_clause, select_frag = (schema.sql_team_join_p_t, schema.sql_team_select_t)
     team_select = select_frag if select_frag else "'Unknown'"
-    season_filter = build_season_filter(schema, "f")
+    season_filter = schema.sql_season_filter_f
     
-    # Correct player join
-    if schema.is_historical:
-        p_join = f"JOIN {schema.table_players} p ON f.element_id = p.element_id AND p.season = '{schema.name}'"
-    else:
-        p_join = f"JOIN {schema.table_players} p ON f.player_id = p.id"
+    p_join = schema.sql_player_join_f_p
 
-    query = f"""
-        SELECT 
-            f.{schema.col_player_id} as player_id,
-            CONCAT(p.first_name, ' ', p.second_name) as player_name,
-            {team_select} as team_name,
-            SUM(f.total_points) as total_points,
-            SUM(f.goals_scored) as total_goals,
-            SUM(f.assists) as total_assists
-        FROM {schema.table_fact} f
-        {p_join}
-        {join_clause}
-        WHERE 1=1 {season_filter}
-        GROUP BY f.{schema.col_player_id}, p.first_name, p.second_name
-        ORDER BY total_points DESC
-        LIMIT {limit}
-    """
-    
     try:
-        results = execute_query(query)
-        return [TopPlayer(**row) for row in results]
+        us_join, xg_col, xa_col = _understat_join(schema)
+        name_col = _player_name(schema)
+
+        query = _cached_query(("top_players", schema.name), lambda: f"""
+            SELECT 
+                f.{schema.col_player_id} as player_id,
+                {name_col} as player_name,
+                {team_select} as team_name,
+                SUM(f.total_points) as total_points,
+                SUM(f.goals_scored) as total_goals,
+                SUM(f.assists) as total_assists,
+                MAX({xg_col}) as xG,
+                MAX({xa_col}) as xA
+            FROM {schema.table_fact} f
+            {p_join}
+            {join_clause}
+            {us_join}
+            WHERE 1=1 {season_filter}
+            GROUP BY f.{schema.col_player_id}, {name_col}
+            ORDER BY total_points DESC
+            LIMIT %(limit)s
+        """)
+
+        results = execute_query(query, params)
+        return [
+            _top_player_dict(
+                r["player_id"], r["player_name"], r["team_name"],
+                r["total_points"], r["total_goals"], r["total_assists"], r["xG"], r["xA"]
+            )
+            for r in results
+        ]
     except Exception as e:
         logger.error(f"Top players error: {e}")
         return []
 
 
+def _squad_query(schema: SeasonSchema, name_col: str, us_join: str,
+                 xg_col: str, xa_col: str, team_join: str, team_select: str) -> str:
+    """
+    Squad query: this squad's fact rows are aggregated per player in a
+    derived table and joined back onto the player rows, so the outer query
+    needs no GROUP BY and per-player columns (name, cost, ...) are read
+    as-is. Closed seasons take the totals straight off the player rows and
+    only aggregate the fact table for form and consistency.
+    """
+    team_col = get_player_team_column(schema)
+    if schema.is_historical:
+        totals_select = """
+            COALESCE(p.total_points, 0) as total_points,
+            COALESCE(p.goals_scored, 0) as goals,
+            COALESCE(p.assists, 0) as assists,
+            COALESCE(p.minutes, 0) as minutes,"""
+        totals_agg, order_by = "", "p.total_points"
+    else:
+        totals_select = """
+            COALESCE(fa.pts, 0) as total_points,
+            COALESCE(fa.g, 0) as goals,
+            COALESCE(fa.a, 0) as assists,
+            COALESCE(fa.mins, 0) as minutes,"""
+        totals_agg = """
+                SUM(f.total_points) as pts, SUM(f.goals_scored) as g,
+                SUM(f.assists) as a, SUM(f.minutes) as mins,"""
+        order_by = "total_points"
+
+    return f"""
+        SELECT 
+            p.{schema.col_player_table_id} as player_id,
+            {name_col} as name,
+            p.element_type,{totals_select}
+            COALESCE(p.now_cost, 0) / 10.0 as now_cost,
+            fa.form,
+            fa.consistency,
+            {xg_col} as xg,
+            {xa_col} as xa,
+            {team_select} as team_name
+        FROM {schema.table_players} p
+        LEFT JOIN (
+            SELECT 
+                f.{schema.col_player_id} as pid,{totals_agg}
+                AVG(CASE WHEN f.{schema.col_gameweek} > lg.max_gw - 5 THEN f.total_points END) as form,
+                STDDEV_POP(f.total_points) as consistency
+            FROM {schema.table_fact} f
+            CROSS JOIN (
+                SELECT MAX({schema.col_gameweek}) as max_gw FROM {schema.table_fact} {schema.sql_season_where}
+            ) lg
+            WHERE f.{schema.col_player_id} IN (
+                SELECT {schema.col_player_table_id} FROM {schema.table_players}
+                WHERE {team_col} = %(team_id)s {schema.sql_season_filter}
+            ) {schema.sql_season_filter_f}
+            GROUP BY f.{schema.col_player_id}
+        ) fa ON fa.pid = p.{schema.col_player_table_id}
+        {us_join}
+        {team_join}
+        WHERE p.{team_col} = %(team_id)s {schema.sql_season_filter_p}
+        ORDER BY {order_by} DESC
+    """
+
+
 def get_team_squad(team_id: int, season: str = CURRENT_SEASON) -> TeamSquadResponse:
     """
-    Decoupled Squad Analytics:
-    1. FPL Stats from DB
-    2. Understat Stats from DB (separate query)
-    3. Merge in Python
+    Squad Analytics in one query per squad:
+    FPL totals, form (avg points over the last 5 gameweeks), consistency
+    (std dev of gameweek points) and ID-mapped Understat xG/xA.
     """
     schema = get_season_schema(season)
+    params = {**schema.sql_params, "team_id": team_id}
     
     try:
-        # 1. Fetch Team Name
-        team_name = "Unknown"
+        # FPL stats (LEFT JOIN: show all players in team, even if 0 pointers),
+        # with the team name joined onto every row instead of a separate lookup
+        us_join, xg_col, xa_col = _understat_join(schema)
+        name_col = _player_name(schema)
+        team_join, team_name_col = "", "NULL"
         if schema.supports_teams:
-            q = f"SELECT {schema.col_team_name} as name FROM {schema.table_teams} WHERE {schema.col_team_id} = %s {build_season_filter(schema)}"
-            res = execute_query(q, (team_id,))
-            if res:
-                team_name = res[0]["name"]
+            team_join = (
+                f"LEFT JOIN {schema.table_teams} t "
+                f"ON t.{schema.col_team_id} = %(team_id)s {schema.sql_season_filter_t}"
+            )
+            team_name_col = f"t.{schema.col_team_name}"
 
-        # 2. Fetch FPL Stats
-        team_col = get_player_team_column(schema)
-        season_filter = build_season_filter(schema, "p")
-        
-        # Position logic
-        pos_code = """
-            CASE p.element_type 
-                WHEN 1 THEN 'GKP' WHEN 2 THEN 'DEF' WHEN 3 THEN 'MID' WHEN 4 THEN 'FWD' ELSE 'UNK' 
-            END
-        """ if schema.is_historical else "NULL" # Current season might need join with positions table, but simplified here
-        
-        # For current season, relying on p.element_type existence in 'players' table logic
-        if not schema.is_historical:
-             # 'players' table has element_type from bootstrap-static
-             pos_code = """
-                CASE p.element_type 
-                    WHEN 1 THEN 'GKP' WHEN 2 THEN 'DEF' WHEN 3 THEN 'MID' WHEN 4 THEN 'FWD' ELSE 'UNK' 
-                END
-             """
-
-        if schema.is_historical:
-            # Revert to LEFT JOIN to match original behavior (Show all players in team, even if 0 pointers)
-            # This fixes "used to work fine" feedback
-            fpl_query = f"""
-                SELECT 
-                    p.{schema.col_player_table_id} as player_id,
-                    CONCAT(p.first_name, ' ', p.second_name) as name,
-                    {pos_code} as position,
-                    COALESCE(SUM(f.total_points), 0) as total_points,
-                    COALESCE(SUM(f.goals_scored), 0) as goals,
-                    COALESCE(SUM(f.assists), 0) as assists,
-                    COALESCE(SUM(f.minutes), 0) as minutes,
-                    COALESCE(MAX(p.now_cost), 0) / 10.0 as now_cost
-                FROM {schema.table_players} p
-                LEFT JOIN {schema.table_fact} f 
-                    ON p.{schema.col_player_table_id} = f.{schema.col_player_id} 
-                    {build_season_filter(schema, "f")}
-                WHERE p.{team_col} = %s {season_filter}
-                GROUP BY p.{schema.col_player_table_id}, p.first_name, p.second_name, p.element_type
-                ORDER BY total_points DESC
-            """
-        else:
-            # Current season (no season column on players table)
-            fpl_query = f"""
-                SELECT 
-                    p.{schema.col_player_table_id} as player_id,
-                    CONCAT(p.first_name, ' ', p.second_name) as name,
-                    {pos_code} as position,
-                    COALESCE(SUM(f.total_points), 0) as total_points,
-                    COALESCE(SUM(f.goals_scored), 0) as goals,
-                    COALESCE(SUM(f.assists), 0) as assists,
-                    COALESCE(SUM(f.minutes), 0) as minutes,
-                    COALESCE(MAX(p.now_cost), 0) / 10.0 as now_cost
-                FROM {schema.table_players} p
-                LEFT JOIN {schema.table_fact} f 
-                    ON p.{schema.col_player_table_id} = f.{schema.col_player_id} 
-                    {build_season_filter(schema, "f")}
-                WHERE p.{team_col} = %s
-                GROUP BY p.{schema.col_player_table_id}, p.first_name, p.second_name, p.element_type
-                ORDER BY total_points DESC
-            """
+        fpl_query = _cached_query(
+            ("squad", schema.name),
+            lambda: _squad_query(schema, name_col, us_join, xg_col, xa_col, team_join, team_name_col)
+        )
         
-        fpl_stats = execute_query(fpl_query, (team_id,))
+        fpl_stats = execute_query(fpl_query, params)
+        team_name = (fpl_stats[0]["team_name"] if fpl_stats else None) or "Unknown"
         
-        # xG/xA removed per refactor requirements - use None (shows "—" in UI)
-        # Player-level xG/xA from Understat is unreliable due to name matching issues
+        # Per-90 rates for the whole squad in one vectorized pass.
+        # Player-level xG/xA come from the ID-mapped Understat join (NaN/None if unmapped)
+        n = len(fpl_stats)
+        mins = np.fromiter((p["minutes"] for p in fpl_stats), dtype=np.float64, count=n)
+        pts = np.fromiter((p["total_points"] for p in fpl_stats), dtype=np.float64, count=n)
+        xg = np.fromiter((np.nan if p["xg"] is None else p["xg"] for p in fpl_stats), dtype=np.float64, count=n)
+        xa = np.fromiter((np.nan if p["xa"] is None else p["xa"] for p in fpl_stats), dtype=np.float64, count=n)
+        per_90 = np.divide(90.0, mins, out=np.zeros(n), where=mins > 90)
+        pts90 = np.round(pts * per_90, 2).tolist()
+        xg90, xa90 = np.round(xg * per_90, 2).tolist(), np.round(xa * per_90, 2).tolist()
+        xg, xa = np.round(xg, 2).tolist(), np.round(xa, 2).tolist()
         
-        # Build squad list from FPL data only
-        squad = []
-        for p in fpl_stats:
-            pts90 = (p["total_points"] / (p["minutes"] / 90)) if p["minutes"] > 90 else 0.0
-            
-            squad.append(SquadMember(
-                player_id=p["player_id"],
+        squad = [
+            SquadMember.model_construct(
+                player_id=int(p["player_id"]),
                 name=p["name"],
-                position=p["position"],
+                position=POSITION_MAP.get(p["element_type"], 'UNK'),
                 total_points=int(p["total_points"]),
                 goals=int(p["goals"]),
                 assists=int(p["assists"]),
                 minutes=int(p["minutes"]),
                 now_cost=float(p["now_cost"]),
-                form=0,
-                consistency=0,
-                pts_per_90=round(pts90, 2),
-                xG=None,  # Not available at player level
-                xA=None,  # Not available at player level
-                xG_per_90=None,
-                xA_per_90=None
-            ))
+                form=round(float(p["form"] or 0), 2),
+                consistency=round(float(p["consistency"] or 0), 2),
+                pts_per_90=pts90[i],
+                xG=_nan_to_none(xg[i]),
+                xA=_nan_to_none(xa[i]),
+                xG_per_90=_nan_to_none(xg90[i]),
+                xA_per_90=_nan_to_none(xa90[i])
+            )
+            for i, p in enumerate(fpl_stats)
+        ]
             
         return TeamSquadResponse(team_name=team_name, season=season, players=squad)
         
@@ -336,11 +684,14 @@ def get_league_standings(season: str = CURRENT_SEASON) -> StandingsResponse:
     Standings from clean_team_season_metrics table (pre-merged xG data).
     
     This is the refactored version that uses clean tables instead of
-    complex FPL fixtures + Understat merging.
+    complex FPL fixtures + Understat merging. Seasons not yet in the clean
+    table fall back to one GROUP BY over the fixtures (no xG).
     """
     try:
-        # Simple query to clean table - xG already merged
-        query = """
+        # Simple query to clean table - xG (and xPts, once the clean step has
+        # been re-run with it) already merged
+        xpts_col = "xpts" if _column_exists("clean_team_season_metrics", "xpts") else "NULL"
+        query = f"""
             SELECT
                 team_name,
                 played,
@@ -352,24 +703,35 @@ def get_league_standings(season: str = CURRENT_SEASON) -> StandingsResponse:
                 gd AS goal_diff,
                 pts AS points,
                 xg_for,
-                xg_against
+                xg_against,
+                {xpts_col} AS xpts
             FROM clean_team_season_metrics
             WHERE season = %s
             ORDER BY pts DESC, gd DESC, gf DESC
         """
         results = execute_query(query, (season,))
         
+        if not results:
+            schema = get_season_schema(season)
+            if schema.supports_standings:
+                results = execute_query(build_standings_query(schema), schema.sql_params)
+        
         if not results:
             logger.warning(f"No standings data found for season {season}")
             return StandingsResponse(season=season, standings=[])
         
-        standings = []
-        for i, row in enumerate(results):
-            # xG: return None if NULL, never return 0.0 for missing data
-            xg_for = float(row["xg_for"]) if row["xg_for"] is not None else None
-            xg_against = float(row["xg_against"]) if row["xg_against"] is not None else None
-            
-            standings.append(StandingEntry(
+        # xG: None if NULL, never 0.0 for missing data (NaN through the vectorized rounding)
+        n = len(results)
+        xg_for = np.fromiter(
+            (np.nan if r.get("xg_for") is None else r["xg_for"] for r in results), dtype=np.float64, count=n
+        )
+        xg_against = np.fromiter(
+            (np.nan if r.get("xg_against") is None else r["xg_against"] for r in results), dtype=np.float64, count=n
+        )
+        xg_for, xg_against = np.round(xg_for, 2).tolist(), np.round(xg_against, 2).tolist()
+        
+        standings = [
+            StandingEntry.model_construct(
                 rank=i + 1,
                 team_name=row["team_name"],
                 played=int(row["played"]),
@@ -380,11 +742,13 @@ def get_league_standings(season: str = CURRENT_SEASON) -> StandingsResponse:
                 goals_against=int(row["goals_against"]),
                 goal_diff=int(row["goal_diff"]),
                 points=int(row["points"]),
-                clean_sheets=0,
-                xG_for=round(xg_for, 2) if xg_for is not None else None,
-                xG_against=round(xg_against, 2) if xg_against is not None else None,
-                xPts=None
-            ))
+                clean_sheets=int(row.get("clean_sheets") or 0),
+                xG_for=_nan_to_none(xg_for[i]),
+                xG_against=_nan_to_none(xg_against[i]),
+                xPts=float(row["xpts"]) if row.get("xpts") is not None else None
+            )
+            for i, row in enumerate(results)
+        ]
             
         return StandingsResponse(season=season, standings=standings)
         
@@ -394,34 +758,82 @@ def get_league_standings(season: str = CURRENT_SEASON) -> StandingsResponse:
 
 
 def get_player_trends(player_id: int, season: str = CURRENT_SEASON) -> PlayerTrendsResponse:
-    """Gap-free player trends."""
+    """
+    Gap-free player trends. The name lookup, the per-gameweek query and the
+    season's last gameweek are independent, so they run concurrently.
+    """
     schema = get_season_schema(season)
-    max_gw = _get_max_gameweek(schema)
     
     try:
-        # Get Name
-        season_filter = build_season_filter(schema, "")
-        p_query = f"SELECT CONCAT(first_name, ' ', second_name) as name FROM {schema.table_players} WHERE {schema.col_player_table_id} = %s {season_filter}"
-        p_res = execute_query(p_query, (player_id,))
-        p_name = p_res[0]["name"] if p_res else "Unknown"
+        season_filter = schema.sql_season_filter
+        p_query = f"SELECT {_player_name(schema, '')} as name FROM {schema.table_players} WHERE {schema.col_player_table_id} = %(player_id)s {season_filter}"
+        params = {**schema.sql_params, "player_id": player_id}
         
-        query = f"""
-            WITH RECURSIVE gw_axis AS (
-                SELECT 1 as gw UNION ALL SELECT gw + 1 FROM gw_axis WHERE gw < {max_gw}
-            ),
-            Perf AS (
-                SELECT {schema.col_gameweek} as gw, total_points as p, minutes as m, goals_scored as g, assists as a, value / 10 as v
-                FROM {schema.table_fact}
-                WHERE {schema.col_player_id} = %s {build_season_filter(schema, "")}
+        # Per-match Understat xG/xA, matched to FPL fixtures by match date.
+        # Needs fixture IDs on the fact table, so historical seasons only.
+        us_cte, us_join, xg_col, xa_col = "", "", "NULL", "NULL"
+        fixture_join, match_date = "", "NULL"
+        if schema.is_historical and schema.supports_understat and _table_exists(schema.table_understat_map):
+            us_cte = f""",
+            UsMatch AS (
+                SELECT DATE(tm.date) as match_date, SUM(r.xg) as xg, SUM(r.xa) as xa
+                FROM {schema.table_understat_map} m
+                JOIN {schema.table_understat_roster} r
+                    ON r.player_id = m.understat_id AND r.season = %(understat_year)s
+                JOIN {schema.table_understat_matches} tm
+                    ON tm.id = CAST(SUBSTRING_INDEX(r.match_link, '/', -1) AS UNSIGNED)
+                WHERE m.season = %(season)s AND m.fpl_element_id = %(player_id)s
+                GROUP BY DATE(tm.date)
+            )"""
+            us_join = "LEFT JOIN UsMatch us ON us.match_date = p.match_date"
+            xg_col, xa_col = "us.xg", "us.xa"
+            fixture_join = (
+                f"LEFT JOIN {schema.table_fixtures} fx "
+                f"ON fx.fixture_id = f.fixture_id AND fx.season = %(season)s"
             )
-            SELECT ax.gw, COALESCE(p.p,0) as p, COALESCE(p.m,0) as m, COALESCE(p.g,0) as g, COALESCE(p.a,0) as a, COALESCE(p.v,0) as v
-            FROM gw_axis ax LEFT JOIN Perf p ON ax.gw = p.gw ORDER BY ax.gw
+            match_date = "DATE(fx.kickoff_time)"
+        
+        query = f"""
+            WITH Perf AS (
+                SELECT f.{schema.col_gameweek} as gw, f.total_points as p, f.minutes as m, f.goals_scored as g,
+                       f.assists as a, f.value / 10 as v, {match_date} as match_date
+                FROM {schema.table_fact} f
+                {fixture_join}
+                WHERE f.{schema.col_player_id} = %(player_id)s {schema.sql_season_filter_f}
+            ){us_cte}
+            SELECT p.gw, p.p, p.m, p.g, p.a, p.v, {xg_col} as xg, {xa_col} as xa
+            FROM Perf p {us_join} ORDER BY p.gw
         """
-        results = execute_query(query, (player_id,))
-        trends = [PlayerTrendPoint(
-            gameweek=r["gw"], points=int(r["p"]), minutes=int(r["m"]), goals=int(r["g"]), assists=int(r["a"]), value=float(r["v"]),
-            opponent="-", was_home=False, xG=None, xA=None
-        ) for r in results]
+        p_res, results, max_gw = _run_concurrently(
+            (execute_query, p_query, params),
+            (execute_query, query, params),
+            (_get_max_gameweek, schema),
+        )
+        p_name = p_res[0]["name"] if p_res else "Unknown"
+        
+        # Gap-fill GW 1..last in Python (double gameweeks keep one point per fixture)
+        by_gw: Dict[int, List[Dict[str, Any]]] = {}
+        for r in results:
+            if r["gw"] is not None:
+                by_gw.setdefault(r["gw"], []).append(r)
+        
+        # max_gw is cached, so rows ingested since then can run past it
+        last_gw = max(max_gw, max(by_gw, default=0))
+        trends = []
+        for gw in range(1, last_gw + 1):
+            for r in by_gw.get(gw, ()):
+                trends.append(PlayerTrendPoint.model_construct(
+                    gameweek=gw, points=int(r["p"] or 0), minutes=int(r["m"] or 0), goals=int(r["g"] or 0),
+                    assists=int(r["a"] or 0), value=float(r["v"] or 0),
+                    opponent="-", was_home=False,
+                    xG=round(float(r["xg"]), 2) if r["xg"] is not None else None,
+                    xA=round(float(r["xa"]), 2) if r["xa"] is not None else None
+                ))
+            if gw not in by_gw:
+                trends.append(PlayerTrendPoint.model_construct(
+                    gameweek=gw, points=0, minutes=0, goals=0, assists=0, value=0.0,
+                    opponent="-", was_home=False
+                ))
         
         return PlayerTrendsResponse(player_id=player_id, player_name=p_name, team_name="", trend=trends, overall_form=0)
     except Exception as e:
@@ -429,116 +841,248 @@ def get_player_trends(player_id: int, season: str = CURRENT_SEASON) -> PlayerTre
         return PlayerTrendsResponse(player_id=player_id, player_name="Error", team_name="", trend=[], overall_form=0)
 
 
+def _team_distribution_rows(schema: SeasonSchema) -> List[Dict[str, Any]]:
+    """Per-team player count / goals / points, from the summary table when built."""
+    team_join, team_select = "", "CONCAT('Team ', x.team_id)"
+    if schema.supports_teams:
+        team_join = (
+            f"LEFT JOIN {schema.table_teams} t "
+            f"ON t.{schema.col_team_id} = x.team_id {schema.sql_season_filter_t}"
+        )
+        team_select = f"COALESCE(t.{schema.col_team_name}, CONCAT('Team ', x.team_id))"
+    
+    rows = _fetch_summary_rows(
+        schema.table_mv_team_stats,
+        f"""
+            SELECT x.team_id, {team_select} as team_name, x.player_count as c,
+                   x.total_goals as g, x.total_points as pts
+            FROM {schema.table_mv_team_stats} x {team_join}
+            WHERE x.season = %(season)s
+        """,
+        schema.sql_params
+    )
+    if rows is not None:
+        return rows
+    
+    team_col = get_player_team_column(schema)
+    return execute_query(_cached_query(("team_distribution", schema.name), lambda: f"""
+        SELECT x.team_id, {team_select} as team_name, x.c, x.g, x.pts
+        FROM (
+            SELECT {team_col} as team_id, COUNT(*) as c,
+                   SUM(goals_scored) as g, SUM(total_points) as pts
+            FROM {schema.table_players} WHERE 1=1 {schema.sql_season_filter}
+            GROUP BY {team_col}
+        ) x {team_join}
+    """), schema.sql_params)
+
+
+def _position_distribution_rows(schema: SeasonSchema) -> List[Dict[str, Any]]:
+    """Per-position player count / points, from the summary table when built."""
+    rows = _fetch_summary_rows(
+        schema.table_mv_position_stats,
+        f"""
+            SELECT element_type, player_count as c, total_points as pts
+            FROM {schema.table_mv_position_stats}
+            WHERE season = %s
+        """,
+        (schema.name,)
+    )
+    if rows is not None:
+        return rows
+    
+    return execute_query(_cached_query(("position_distribution", schema.name), lambda: f"""
+        SELECT element_type, COUNT(*) as c, SUM(total_points) as pts 
+        FROM {schema.table_players} WHERE 1=1 {schema.sql_season_filter} GROUP BY element_type
+    """), schema.sql_params)
+
+
 def get_distributions(season: str = CURRENT_SEASON) -> DistributionsResponse:
-    """Distributions (FPL Only)."""
+    """Distributions (FPL Only); the team and position aggregates run concurrently."""
     schema = get_season_schema(season)
     try:
-        season_filter = build_season_filter(schema, "")
-        pos_query = f"""
-            SELECT element_type, COUNT(*) as c, SUM(total_points) as pts 
-            FROM {schema.table_players} WHERE 1=1 {season_filter} GROUP BY element_type
-        """
-        rows = execute_query(pos_query)
+        team_rows, pos_rows = _run_concurrently(
+            (_team_distribution_rows, schema),
+            (_position_distribution_rows, schema),
+        )
+        
+        by_team = [TeamDistribution.model_construct(
+            team_name=r["team_name"],
+            team_id=int(r["team_id"]),
+            total_goals=int(r["g"] or 0),
+            total_points=int(r["pts"] or 0),
+            player_count=int(r["c"])
+        ) for r in team_rows if r["team_id"] is not None]
+        by_team.sort(key=lambda t: t.total_points, reverse=True)
         
-        pos_map = {1: 'GKP', 2: 'DEF', 3: 'MID', 4: 'FWD'}
-        dist = [PositionDistribution(
-            position=pos_map.get(r["element_type"], 'UNK'),
-            position_id=r["element_type"],
-            player_count=r["c"],
+        dist = [PositionDistribution.model_construct(
+            position=POSITION_MAP.get(r["element_type"], 'UNK'),
+            position_id=int(r["element_type"]),
+            player_count=int(r["c"]),
             total_goals=0,
             avg_points=round(float(r["pts"]) / max(r["c"], 1), 2)
-        ) for r in rows]
+        ) for r in pos_rows]
         
-        return DistributionsResponse(by_team=[], by_position=dist)
+        return DistributionsResponse(by_team=by_team, by_position=dist)
     except Exception as e:
         logger.error(f"Distribution error: {e}")
         return DistributionsResponse(by_team=[], by_position=[])
 
 
-def get_global_players(filters: GlobalSearchFilters) -> List[TopPlayer]:
-    """Safe Global Search with Python-side Understat enrichment & sorting."""
+def _search_page_get(key: Tuple) -> Optional[List[Dict[str, Any]]]:
+    with _search_pages_lock:
+        entry = _search_pages.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del _search_pages[key]
+            return None
+        _search_pages.move_to_end(key)
+        return entry[0]
+
+
+def _search_page_put(key: Tuple, rows: List[Dict[str, Any]]):
+    with _search_pages_lock:
+        _search_pages[key] = (rows, time.monotonic() + SEARCH_PAGE_CACHE_TTL)
+        _search_pages.move_to_end(key)
+        while len(_search_pages) > SEARCH_PAGE_CACHE_SIZE:
+            _search_pages.popitem(last=False)
+
+
+def _prefetch_search_page(filters: GlobalSearchFilters, key: Tuple):
+    try:
+        _search_page_put(key, _search_players(filters))
+    except Exception as e:
+        logger.warning(f"Global search prefetch failed: {e}")
+
+
+def get_global_players(filters: GlobalSearchFilters) -> List[Dict[str, Any]]:
+    """
+    Safe Global Search, one page at a time. Pages are cached briefly and the
+    next page is fetched in the background, so paging forward is a cache hit.
+    """
+    filter_key = tuple(sorted(filters.model_dump(exclude={"page"}).items()))
+    key = (filter_key, filters.page)
+
+    rows = _search_page_get(key)
+    if rows is None:
+        try:
+            rows = _search_players(filters)
+        except Exception as e:
+            logger.error(f"Global search error: {e}")
+            return []
+        _search_page_put(key, rows)
+
+    # A short page is the last one; otherwise warm the next
+    next_key = (filter_key, filters.page + 1)
+    if len(rows) == filters.page_size and _search_page_get(next_key) is None:
+        next_filters = filters.model_copy(update={"page": filters.page + 1})
+        _QUERY_POOL.submit(_prefetch_search_page, next_filters, next_key)
+
+    return rows
+
+
+def _search_players(filters: GlobalSearchFilters) -> List[Dict[str, Any]]:
+    """One page of the global search: all filters, sorting and paging run in SQL."""
     schema = get_season_schema(filters.season)
+    us_join, xg_col, xa_col = _understat_join(schema)
     
     # 1. Build Conditions
     conditions = []
+    params = dict(schema.sql_params)
     if schema.is_historical:
-        conditions.append(f"p.season = '{schema.name}'")
+        conditions.append("p.season = %(season)s")
+    name_col = _player_name(schema)
     if filters.name:
-        safe_name = filters.name.replace("'", "''")
-        conditions.append(f"(p.first_name LIKE '%{safe_name}%' OR p.second_name LIKE '%{safe_name}%')")
+        # Normalized so diacritic variants ("Ozil" / "Özil") match
+        # through the accent-insensitive collation
+        term = normalize_name(filters.name).translate(_FULLTEXT_OPERATORS).strip()
+        fulltext_index = _NAME_FULLTEXT_INDEXES.get(schema.table_players)
+        if (
+            name_col == "p.full_name" and len(term) >= 2
+            and fulltext_index and _index_exists(schema.table_players, fulltext_index)
+        ):
+            # Phrase search over the ngram index: contiguous substring match
+            params["name"] = f'"{term}"'
+            conditions.append("MATCH(p.full_name) AGAINST (%(name)s IN BOOLEAN MODE)")
+        elif name_col == "p.full_name":
+            params["name"] = f"%{_escape_like(filters.name)}%"
+            conditions.append("p.full_name LIKE %(name)s")
+        else:
+            params["name"] = f"%{_escape_like(filters.name)}%"
+            conditions.append("(p.first_name LIKE %(name)s OR p.second_name LIKE %(name)s)")
     if filters.team_id:
-        conditions.append(f"p.{get_player_team_column(schema)} = {filters.team_id}")
+        params["team_id"] = filters.team_id
+        conditions.append(f"p.{get_player_team_column(schema)} = %(team_id)s")
     if filters.position:
-        pm = {'GKP': 1, 'DEF': 2, 'MID': 3, 'FWD': 4}
-        if filters.position in pm: conditions.append(f"p.element_type = {pm[filters.position]}")
+        if filters.position in POSITION_REVERSE:
+            params["element_type"] = POSITION_REVERSE[filters.position]
+            conditions.append("p.element_type = %(element_type)s")
+    if filters.min_points is not None:
+        params["min_points"] = filters.min_points
+        conditions.append("p.total_points >= %(min_points)s")
+    if filters.min_minutes is not None:
+        params["min_minutes"] = filters.min_minutes
+        conditions.append("p.minutes >= %(min_minutes)s")
     
     where = "WHERE " + " AND ".join(conditions) if conditions else ""
     
     # 2. Join Teams (if supported)
     join, t_col = "", "'Unknown'"
     if schema.supports_teams:
-        j, s = build_team_join(schema, "p", "t")
+        j, s = (schema.sql_team_join_p_t, schema.sql_team_select_t)
         join, t_col = j, s
         
-    # 3. Determine Sorting Strategy
-    # If sorting by xG/xA, we must fetch ALL candidates, enrich, then sort in Python.
-    manual_sort_key = None
-    if filters.sort_by in ["xG", "xg", "xA", "xa"]:
-        manual_sort_key = "xG" if filters.sort_by.lower() == "xg" else "xA"
-        sql_order = ""
-        sql_limit = "" # Fetch all to allow correct sorting
-    else:
-        # Standard SQL sort
-        map_sort = {
-            "form": "CAST(p.form as DECIMAL(10,1))",
-            "value": "p.now_cost",
-            "position": "p.element_type",
-            "total_points": "p.total_points"
-        }
-        sort_col = map_sort.get(filters.sort_by, "p.total_points")
-        sql_order = f"ORDER BY {sort_col} {filters.order.upper()}"
-        sql_limit = "LIMIT 50"
+    # 3. Sorting: whitelisted columns only; unmapped xG/xA sort last
+    map_sort = {
+        "form": "CAST(p.form as DECIMAL(10,1))",
+        "value": "p.now_cost",
+        "position": "p.element_type",
+        "total_points": "p.total_points",
+        "minutes": "p.minutes",
+        "xg": xg_col,
+        "xa": xa_col,
+    }
+    sort_col = map_sort.get(filters.sort_by.lower(), "p.total_points")
+    direction = "ASC" if filters.order.lower() == "asc" else "DESC"
+    # Player id breaks ties so OFFSET pages don't overlap or skip rows
+    sql_order = (
+        f"ORDER BY {sort_col} IS NULL, {sort_col} {direction}, "
+        f"p.{schema.col_player_table_id}"
+    )
 
     query = f"""
         SELECT 
             p.{schema.col_player_table_id} as pid, 
-            CONCAT(p.first_name, ' ', p.second_name) as name, 
+            {name_col} as name, 
             {t_col} as tname, 
             p.total_points,
             p.goals_scored,
-            p.assists
-        FROM {schema.table_players} p {join} {where}
-        {sql_order} {sql_limit}
+            p.assists,
+            {xg_col} as xg,
+            {xa_col} as xa
+        FROM {schema.table_players} p {join} {us_join} {where}
+        {sql_order}
+        LIMIT %(limit)s OFFSET %(offset)s
     """
-    
-    try:
-        res = execute_query(query)
-        
-        # xG/xA removed - Understat player merging not reliable
-        players = []
-        for r in res:
-            players.append(TopPlayer(
-                player_id=r["pid"], 
-                player_name=r["name"], 
-                team_name=r["tname"], 
-                total_points=r["total_points"], 
-                total_goals=int(r.get("goals_scored") or 0),
-                total_assists=int(r.get("assists") or 0),
-                xG=None,
-                xA=None
-            ))
-            
-        # Manual sort for xG/xA not applicable (always None now)
-        # Just return the list
-            
-        return players
-    except Exception as e:
-        logger.error(f"Global search error: {e}")
-        return []
+    params["limit"] = filters.page_size
+    params["offset"] = (filters.page - 1) * filters.page_size
+
+    res = execute_query(query, params)
+
+    return [
+        _top_player_dict(
+            r["pid"], r["name"], r["tname"],
+            r["total_points"], r["goals_scored"], r["assists"], r["xg"], r["xa"]
+        )
+        for r in res
+    ]
 
 
 def get_available_filters() -> DashboardFilters:
-    """Get available seasons, teams, and gameweeks for filtering."""
+    """Get available seasons, teams, and gameweeks for filtering (cached for FILTERS_CACHE_TTL)."""
+    if _filters_cache["value"] is not None and _filters_cache["expires"] > time.monotonic():
+        return _filters_cache["value"]
+    
     try:
         # Get all seasons from historical players table
         seasons = [
@@ -554,7 +1098,7 @@ def get_available_filters() -> DashboardFilters:
             for t in execute_query("SELECT id, name FROM teams ORDER BY name")
         ]
         
-        return DashboardFilters(
+        filters = DashboardFilters(
             seasons=seasons,
             teams=teams,
             gameweeks=list(range(1, 39))
@@ -562,3 +1106,25 @@ def get_available_filters() -> DashboardFilters:
     except Exception as e:
         logger.error(f"get_available_filters error: {e}")
         return DashboardFilters(seasons=[CURRENT_SEASON], teams=[], gameweeks=[])
+    
+    _filters_cache["value"] = filters
+    _filters_cache["expires"] = time.monotonic() + FILTERS_CACHE_TTL
+    return filters
+
+
+def get_dashboard_bundle(season: str = CURRENT_SEASON, limit: int = 10) -> Dict[str, Any]:
+    """
+    Distributions, top players and filters for one page load.
+    
+    Top players and filters run on the query pool while distributions runs
+    in the calling thread (it fans out on the pool itself, so nesting it
+    there could starve the pool).
+    """
+    top_future = _QUERY_POOL.submit(get_top_players, limit, season)
+    filters_future = _QUERY_POOL.submit(get_available_filters)
+    distributions = get_distributions(season)
+    return {
+        "distributions": distributions.model_dump(),
+        "top_players": top_future.result(),
+        "filters": filters_future.result().model_dump(),
+    }
@@ -5,6 +5,7 @@ FastAPI dependencies for authentication and database.
 from typing import Optional
 
 from fastapi import Depends, Header
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.security import decode_access_token
@@ -35,7 +36,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
     if username is None:
         raise CredentialsException("Invalid token payload")
     
-    user = get_user_by_username(username)
+    user = await run_in_threadpool(get_user_by_username, username)
     
     if user is None:
         raise CredentialsException("User not found")
@@ -65,7 +66,7 @@ async def get_current_user_optional(
         
         username = payload.get("sub")
         if username:
-            return get_user_by_username(username)
+            return await run_in_threadpool(get_user_by_username, username)
     except (ValueError, AttributeError):
         pass
     
@@ -4,6 +4,7 @@ Prediction Router - API endpoints for player predictions and recommendations.
 
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from datetime import date
 
 from app.api.deps import get_current_user
@@ -55,7 +56,7 @@ async def get_best_player_predictions(
         season=season
     )
     
-    players = get_best_players(filters)
+    players = await run_in_threadpool(get_best_players, filters)
     
     total_budget = sum(p.now_cost for p in players)
     
@@ -88,7 +89,7 @@ async def refresh_predictions(
     Run this after new gameweek data is available.
     """
     try:
-        count = generate_predictions(season=season, min_minutes=min_minutes)
+        count = await run_in_threadpool(generate_predictions, season=season, min_minutes=min_minutes)
         return RefreshResponse(
             success=True,
             players_updated=count,
@@ -111,7 +112,7 @@ async def get_single_player_prediction(
     """
     Get detailed prediction for a specific player.
     """
-    prediction = get_player_prediction(player_id, season)
+    prediction = await run_in_threadpool(get_player_prediction, player_id, season)
     
     if not prediction:
         raise HTTPException(
@@ -141,7 +142,7 @@ async def get_optimized_squad(
     **Returns:**
     Selected squad with total cost and predicted points.
     """
-    result = get_budget_optimized_squad(max_budget, formation)
+    result = await run_in_threadpool(get_budget_optimized_squad, max_budget, formation)
     return result
 
 
@@ -172,4 +173,4 @@ async def get_predictions_by_position(
         season=season
     )
     
-    return get_best_players(filters)
+    return await run_in_threadpool(get_best_players, filters)
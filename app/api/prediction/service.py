@@ -145,12 +145,12 @@ def get_player_stats_for_prediction(
             LEFT JOIN fact_player_gameweeks f ON p.id = f.player_id
             GROUP BY p.id, p.first_name, p.second_name, t.name, p.team, 
                      p.element_type, p.now_cost, p.total_points, p.form
-            HAVING minutes >= %s
+            HAVING minutes >= %(min_minutes)s
             ORDER BY p.total_points DESC
         """
     else:
         # Historical season query
-        query = f"""
+        query = """
             SELECT 
                 p.element_id as player_id,
                 CONCAT(p.first_name, ' ', p.second_name) as player_name,
@@ -170,17 +170,17 @@ def get_player_stats_for_prediction(
                 COALESCE(SUM(f.assists), 0) as assists,
                 COUNT(DISTINCT f.gameweek) as games_played
             FROM fpl_season_players p
-            LEFT JOIN fpl_season_teams t ON p.team_id = t.team_id AND t.season = '{season}'
-            LEFT JOIN fpl_player_gameweeks f ON p.element_id = f.element_id AND f.season = '{season}'
-            WHERE p.season = '{season}'
+            LEFT JOIN fpl_season_teams t ON p.team_id = t.team_id AND t.season = %(season)s
+            LEFT JOIN fpl_player_gameweeks f ON p.element_id = f.element_id AND f.season = %(season)s
+            WHERE p.season = %(season)s
             GROUP BY p.element_id, p.first_name, p.second_name, t.team_name, p.team_id, 
                      p.element_type, p.now_cost, p.total_points, p.form
-            HAVING minutes >= %s
+            HAVING minutes >= %(min_minutes)s
             ORDER BY p.total_points DESC
         """
     
     try:
-        results = execute_query(query, (min_minutes,))
+        results = execute_query(query, {"season": season, "min_minutes": min_minutes})
         return results
     except Exception as e:
         logger.error(f"Failed to fetch player stats: {e}")
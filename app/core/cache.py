@@ -0,0 +1,150 @@
+"""
+Response caching for read-only dashboard endpoints (fastapi-cache2).
+
+Aggregations behind the dashboard are identical for every user within a
+season and only change when new gameweek data is ingested, so responses
+are cached in Redis (or in-process memory when REDIS_URL is unset).
+
+Entries live for a few minutes at most, and keys are grouped per season
+so an ingestion run can drop just the season it refreshed.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder
+from redis import Redis
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+from Utils.logging_config import get_logger
+
+logger = get_logger("cache")
+
+CACHE_PREFIX = "fpl-dash"
+DASHBOARD_NAMESPACE = "dashboard"
+DASHBOARD_CACHE_EXPIRE = 300  # seconds
+
+# Only these endpoint arguments vary the cached payload. Everything else
+# (notably current_user) is deliberately left out of the key.
+_KEY_PARAMS = ("team_id", "player_id", "season", "limit")
+# Key segment for endpoints that don't take a season (e.g. /filters)
+_ALL_SEASONS = "all"
+# Counter bumped by ETL scripts; API processes watch it to drop their
+# in-process caches (schema probes, query text, filter lists)
+DATA_VERSION_KEY = f"{CACHE_PREFIX}:data-version"
+
+
+class ResponseCoder(Coder):
+    """Stores the already-serialized JSON body of a dashboard Response."""
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, Response):
+            return bytes(value.body)
+        raise TypeError(f"ResponseCoder can only cache Response objects, got {type(value).__name__}")
+
+    @classmethod
+    def decode(cls, value: bytes) -> Response:
+        return Response(content=value, media_type="application/json")
+
+    @classmethod
+    def decode_as_type(cls, value: bytes, *, type_: Optional[Any] = None) -> Response:
+        return cls.decode(value)
+
+
+def dashboard_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Cache key from (endpoint, team_id, player_id, season, limit) only, grouped by season.
+
+    fastapi-cache2 passes `namespace` already prefixed ("fpl-dash:dashboard"),
+    so keys come out as fpl-dash:dashboard:<season>:<digest> - the layout
+    FastAPICache.clear and invalidate_dashboard_cache match against.
+    """
+    kwargs = kwargs or {}
+    parts = [func.__module__, func.__name__]
+    parts += [f"{name}={kwargs[name]}" for name in _KEY_PARAMS if name in kwargs]
+    digest = hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()
+    season = kwargs.get("season") or _ALL_SEASONS
+    return f"{namespace}:{season}:{digest}"
+
+
+def init_cache():
+    """Initialize the cache backend. Call once at application startup."""
+    if settings.REDIS_URL:
+        redis = aioredis.from_url(settings.REDIS_URL)
+        FastAPICache.init(RedisBackend(redis), prefix=CACHE_PREFIX)
+        logger.info("Response cache initialized (Redis)")
+    else:
+        FastAPICache.init(InMemoryBackend(), prefix=CACHE_PREFIX)
+        logger.info("Response cache initialized (in-memory, REDIS_URL not set)")
+
+
+async def clear_dashboard_cache():
+    """Drop every cached dashboard response (call after data ingestion)."""
+    await FastAPICache.clear(namespace=DASHBOARD_NAMESPACE)
+
+
+def invalidate_dashboard_cache(season: str):
+    """
+    Drop the cached responses for one season (plus the season-less ones)
+    and bump the data version.
+
+    Synchronous and independent of FastAPICache.init, so ETL scripts can
+    call it after refreshing a season. Without REDIS_URL the cache is
+    per-process and simply expires after DASHBOARD_CACHE_EXPIRE.
+    """
+    if not settings.REDIS_URL:
+        return
+
+    try:
+        redis = Redis.from_url(settings.REDIS_URL)
+        keys = []
+        for segment in (season, _ALL_SEASONS):
+            keys += redis.scan_iter(match=f"{CACHE_PREFIX}:{DASHBOARD_NAMESPACE}:{segment}:*")
+        if keys:
+            redis.delete(*keys)
+        redis.incr(DATA_VERSION_KEY)
+        logger.info(f"Invalidated {len(keys)} cached dashboard responses for {season}")
+    except Exception as e:
+        logger.warning(f"Could not invalidate dashboard cache for {season}: {e}")
+
+
+def mark_data_refreshed():
+    """
+    Bump the data version after an ETL step that changes the schema or
+    reference data (new tables, columns, indexes) rather than one season.
+    No-op without REDIS_URL.
+    """
+    if not settings.REDIS_URL:
+        return
+
+    try:
+        Redis.from_url(settings.REDIS_URL).incr(DATA_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"Could not bump dashboard data version: {e}")
+
+
+def get_data_version() -> Optional[int]:
+    """Current data version, or None without REDIS_URL or if Redis is unreachable."""
+    if not settings.REDIS_URL:
+        return None
+
+    try:
+        value = Redis.from_url(settings.REDIS_URL).get(DATA_VERSION_KEY)
+        return int(value or 0)
+    except Exception as e:
+        logger.warning(f"Could not read dashboard data version: {e}")
+        return None
@@ -21,6 +21,10 @@ class Settings(BaseSettings):
     FPL_DB_USER: str = ""
     FPL_DB_PASSWORD: str = ""
     FPL_DB_NAME: str = ""
+    FPL_DB_POOL_SIZE: int = 25  # mysql-connector caps pools at 32
+    
+    # Response cache (in-memory fallback when unset)
+    REDIS_URL: str = ""
     
     # JWT Configuration
     JWT_SECRET_KEY: str = "your-super-secret-key-change-in-production"
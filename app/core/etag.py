@@ -0,0 +1,72 @@
+"""
+Conditional GET support (ETag / If-None-Match) for dashboard endpoints.
+
+The handler always runs first (so auth dependencies are enforced), then
+successful responses get an ETag hashed from the rendered body and a
+matching If-None-Match is answered with 304.
+
+Responses are per-user (private) and never immutable: services answer
+DB failures with 200 and an empty/"Error" fallback body, which must not
+be pinned in caches. Historical seasons may be reused for a few minutes
+before revalidating; the current season always revalidates.
+"""
+
+import hashlib
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api.dashboard.season_config import CURRENT_SEASON
+from app.core.cache import DASHBOARD_CACHE_EXPIRE
+
+DASHBOARD_PREFIX = "/dashboard/"
+
+HISTORICAL_CACHE_CONTROL = f"private, max-age={DASHBOARD_CACHE_EXPIRE}"
+CURRENT_CACHE_CONTROL = "private, no-cache"
+
+
+def _body_etag(body: bytes) -> str:
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+class DashboardETagMiddleware(BaseHTTPMiddleware):
+    """Add ETag/Cache-Control to successful dashboard GETs and answer revalidations with 304."""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET" or not request.url.path.startswith(DASHBOARD_PREFIX):
+            return await call_next(request)
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        historical = request.query_params.get("season", CURRENT_SEASON) != CURRENT_SEASON
+        cache_control = HISTORICAL_CACHE_CONTROL if historical else CURRENT_CACHE_CONTROL
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = _body_etag(body)
+        if _matches(request, etag):
+            return _not_modified(etag, cache_control)
+
+        headers = dict(response.headers)
+        headers.pop("content-length", None)
+        headers["ETag"] = etag
+        headers["Cache-Control"] = cache_control
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            media_type=response.media_type,
+        )
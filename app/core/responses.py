@@ -0,0 +1,63 @@
+"""
+Fast JSON response classes.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, List, Type
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback encoder for types orjson doesn't handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib json module.
+    Handles NumPy scalars/arrays, non-str dict keys, Decimal and datetime.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_type: Type[BaseModel]) -> TypeAdapter:
+    """Cached TypeAdapter for List[item_type] (building one compiles a core schema)."""
+    return TypeAdapter(List[item_type])
+
+
+def model_response(content: Any) -> Response:
+    """
+    Serialize a Pydantic model (or list of models) with Pydantic's core
+    serializer and wrap the bytes in a Response.
+
+    None-valued fields are omitted from the payload.
+
+    Returning a Response from a route skips FastAPI's response_model
+    re-validation and jsonable_encoder pass; response_model on the route
+    still documents the schema in OpenAPI.
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json(exclude_none=True)
+    elif isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        body = _list_adapter(type(content[0])).dump_json(content, exclude_none=True)
+    else:
+        body = ORJSONResponse(content).body
+
+    return Response(content=body, media_type="application/json")
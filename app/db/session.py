@@ -3,17 +3,23 @@ Database session management.
 Reuses the existing Utils.db pattern for MySQL connections.
 """
 
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional, Union
 
 import mysql.connector
 from mysql.connector import Error as MySQLError
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
 
 from app.core.config import settings
 from Utils.logging_config import get_logger
 
 logger = get_logger("db_session")
 
+_pool: Optional[MySQLConnectionPool] = None
+_pool_lock = threading.Lock()
+
 
 def get_db_config() -> dict:
     """Get database configuration from settings."""
@@ -26,23 +32,49 @@ def get_db_config() -> dict:
     }
 
 
+def _get_pool() -> MySQLConnectionPool:
+    """Create the shared connection pool on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = MySQLConnectionPool(
+                    pool_name="fpl_app",
+                    pool_size=settings.FPL_DB_POOL_SIZE,
+                    pool_reset_session=True,
+                    **get_db_config()
+                )
+                logger.info(f"MySQL connection pool created (size={settings.FPL_DB_POOL_SIZE})")
+    return _pool
+
+
+def _connect():
+    """Borrow a pooled connection; open a direct one if the pool is exhausted."""
+    try:
+        return _get_pool().get_connection()
+    except PoolError:
+        logger.debug("Connection pool exhausted, opening a direct connection")
+        return mysql.connector.connect(**get_db_config())
+
+
 @contextmanager
 def get_db_connection():
     """
     Context manager that yields a MySQL connection.
     For use in FastAPI dependencies.
+    
+    Connections come from a shared pool; close() hands them back.
     """
-    cfg = get_db_config()
     conn = None
     
     try:
-        conn = mysql.connector.connect(**cfg)
+        conn = _connect()
         yield conn
     except MySQLError as e:
         logger.error(f"Database connection failed: {e}")
         raise
     finally:
-        if conn and conn.is_connected():
+        if conn:
             conn.close()
 
 
@@ -54,13 +86,13 @@ def get_db() -> Generator:
         yield conn
 
 
-def execute_query(query: str, params: tuple = None, fetch: bool = True):
+def execute_query(query: str, params: Union[tuple, dict] = None, fetch: bool = True):
     """
     Execute a SQL query and return results.
     
     Args:
         query: SQL query string
-        params: Query parameters
+        params: Query parameters (tuple for %s, dict for %(name)s placeholders)
         fetch: Whether to fetch results
     
     Returns:
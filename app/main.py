@@ -2,7 +2,7 @@
 FPL Dashboard - Main FastAPI Application
 
 This is the entry point for the application. It:
-- Configures CORS
+- Configures CORS, gzip response compression and dashboard ETags
 - Mounts static files
 - Includes auth and dashboard routers
 - Serves HTML templates for login/register/dashboard
@@ -14,9 +14,12 @@ from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from app.core.config import settings
+from app.core.cache import init_cache
+from app.core.etag import DashboardETagMiddleware
 from app.api.auth.router import router as auth_router
 from app.api.dashboard.router import router as dashboard_router
 from app.api.prediction.router import router as prediction_router
@@ -44,6 +47,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ETag / 304 revalidation for dashboard GETs (inside gzip, so tags hash raw JSON)
+app.add_middleware(DashboardETagMiddleware)
+
+# Compress JSON payloads (squad, standings, trends) above 1 KB
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Paths
 BASE_DIR = Path(__file__).parent
 TEMPLATES_DIR = BASE_DIR / "templates"
@@ -65,6 +74,7 @@ app.include_router(prediction_router)
 async def startup_event():
     """Initialize database tables on startup."""
     logger.info("Starting FPL Dashboard application...")
+    init_cache()
     try:
         ensure_users_table()
         ensure_predictions_table()
@@ -172,9 +172,9 @@ async function loadStandings() {
             <td>${s.goal_diff > 0 ? '+' : ''}${s.goal_diff}</td>
             <td class="fw-bold text-info">${s.points}</td>
             <td class="row-understat text-info">
-                <span class="metric-value">${s.xG_for !== null ? s.xG_for.toFixed(1) : '—'}</span>
+                <span class="metric-value">${s.xG_for != null ? s.xG_for.toFixed(1) : '—'}</span>
                 <span class="text-muted"> / </span>
-                <span class="metric-value text-danger">${s.xG_against !== null ? s.xG_against.toFixed(1) : '—'}</span>
+                <span class="metric-value text-danger">${s.xG_against != null ? s.xG_against.toFixed(1) : '—'}</span>
             </td>
         </tr>
     `).join('');
@@ -28,7 +28,7 @@ REM --------------------------------------------------
 REM 1. Cold Start
 REM --------------------------------------------------
 echo.
-echo [1/10] Cold start ingestion
+echo [1/11] Cold start ingestion
 python "%PROJECT_ROOT%Scripts\events_cold_start.py"
 
 if errorlevel 1 (
@@ -40,7 +40,7 @@ REM --------------------------------------------------
 REM 2. Incremental Update
 REM --------------------------------------------------
 echo.
-echo [2/10] Incremental update
+echo [2/11] Incremental update
 python "%PROJECT_ROOT%Scripts\incremental_event_update.py"
 
 if errorlevel 1 (
@@ -53,7 +53,7 @@ REM --------------------------------------------------
 REM 3. Get Fixtures
 REM --------------------------------------------------
 echo.
-echo [3/10] Fetching fixtures
+echo [3/11] Fetching fixtures
 python "%PROJECT_ROOT%Scripts\ingest_fixture.py"
 
 if errorlevel 1 (
@@ -66,7 +66,7 @@ REM --------------------------------------------------
 REM 4. Player Snapshots
 REM --------------------------------------------------
 echo.
-echo [4/10] Fetching player snapshots
+echo [4/11] Fetching player snapshots
 python "%PROJECT_ROOT%Scripts\player_snapshot.py"
 
 if errorlevel 1 (
@@ -79,7 +79,7 @@ REM --------------------------------------------------
 REM 5. Player History Dump
 REM --------------------------------------------------
 echo.
-echo [5/10] Fetching player history
+echo [5/11] Fetching player history
 python "%PROJECT_ROOT%Scripts\player_history_dump.py"
 
 if errorlevel 1 (
@@ -92,7 +92,7 @@ REM --------------------------------------------------
 REM 6. Build Fact Table
 REM --------------------------------------------------
 echo.
-echo [6/10] Building fact table
+echo [6/11] Building fact table
 python "%PROJECT_ROOT%Scripts\build_fact_table.py"
 
 if errorlevel 1 (
@@ -105,7 +105,7 @@ REM --------------------------------------------------
 REM 7. Ingest Understat Teams (Kaggle)
 REM --------------------------------------------------
 echo.
-echo [7/10] Ingesting Understat Team Metrics
+echo [7/11] Ingesting Understat Team Metrics
 python "%PROJECT_ROOT%Scripts\ingest_understat_teams.py"
 
 if errorlevel 1 (
@@ -118,7 +118,7 @@ REM --------------------------------------------------
 REM 8. Ingest Understat Roster (Kaggle)
 REM --------------------------------------------------
 echo.
-echo [8/10] Ingesting Understat Roster Metrics
+echo [8/11] Ingesting Understat Roster Metrics
 python "%PROJECT_ROOT%Scripts\ingest_understat_roster.py"
 
 if errorlevel 1 (
@@ -131,7 +131,7 @@ REM --------------------------------------------------
 REM 9. Ingest FPL GitHub History
 REM --------------------------------------------------
 echo.
-echo [9/10] Ingesting Historical FPL Data from GitHub
+echo [9/11] Ingesting Historical FPL Data from GitHub
 python "%PROJECT_ROOT%Scripts\ingest_fpl_github.py"
 
 if errorlevel 1 (
@@ -144,7 +144,7 @@ REM --------------------------------------------------
 REM 10. merging data into clean tables
 REM --------------------------------------------------
 echo.
-echo [10/10] cleaning data and storing into tables
+echo [10/11] cleaning data and storing into tables
 python "%PROJECT_ROOT%Scripts\clean_and_store.py"
 
 if errorlevel 1 (
@@ -153,6 +153,19 @@ if errorlevel 1 (
     exit /b 1
 )
 
+REM --------------------------------------------------
+REM 11. Build per-season dashboard summary tables
+REM --------------------------------------------------
+echo.
+echo [11/11] Building season summary tables
+python "%PROJECT_ROOT%Scripts\build_season_summaries.py"
+
+if errorlevel 1 (
+    echo ERROR: building season summary tables failed
+    pause
+    exit /b 1
+)
+
 REM --------------------------------------------------
 REM Done
 REM --------------------------------------------------
@@ -43,28 +43,31 @@ run_module() {
 
 # Step 1: Cold Start
 # Assuming your script is at Scripts/events_cold_start.py
-run_module "Scripts.events_cold_start" "1/8 Ingestion (Cold Start)"
+run_module "Scripts.events_cold_start" "1/9 Ingestion (Cold Start)"
 
 # Step 2: Incremental Update
-run_module "Scripts.incremental_event_update" "2/8 Incremental update"
+run_module "Scripts.incremental_event_update" "2/9 Incremental update"
 
 # Step 3: Get Fixtures
-run_module "Scripts.ingest_fixture" "3/8 Fetching fixtures"
+run_module "Scripts.ingest_fixture" "3/9 Fetching fixtures"
 
 # Step 4: Player Snapshots
-run_module "Scripts.player_snapshot" "4/8 Fetching player snapshots"
+run_module "Scripts.player_snapshot" "4/9 Fetching player snapshots"
 
 # Step 5: Player History Dump
-run_module "Scripts.player_history_dump" "5/8 Fetching player history"
+run_module "Scripts.player_history_dump" "5/9 Fetching player history"
 
 # Step 6: Build Fact Table
-run_module "Scripts.build_fact_table" "6/8 Building fact table"
+run_module "Scripts.build_fact_table" "6/9 Building fact table"
 
 # Step 7: Understat Teams
-run_module "Scripts.ingest_understat_teams" "7/8 Ingesting Understat Team Metrics"
+run_module "Scripts.ingest_understat_teams" "7/9 Ingesting Understat Team Metrics"
 
 # Step 8: Understat Roster
-run_module "Scripts.ingest_understat_roster" "8/8 Ingesting Understat Roster Metrics"
+run_module "Scripts.ingest_understat_roster" "8/9 Ingesting Understat Roster Metrics"
+
+# Step 9: Dashboard summary tables
+run_module "Scripts.build_season_summaries" "9/9 Building season summary tables"
 
 echo ""
 echo "=================================================="